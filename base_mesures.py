@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Base SQLite des mesures, écrite par lots dans un fil d'arrière-plan.
+
+Un ``INSERT`` suivi d'un ``commit`` toutes les 2 s, c'est un ou plusieurs
+``fsync`` par mesure : la carte SD s'use et la boucle de lecture attend le
+disque. Ici, ``append()`` ne fait que déposer la mesure dans une file
+(quelques µs) ; un fil l'insère avec d'autres dans une seule transaction
+dès que le lot compte ``batch_size`` mesures ou que la plus ancienne a
+``max_age`` secondes.
+
+La base est en mode WAL avec ``synchronous=NORMAL`` : une transaction
+n'écrit que dans le journal (un seul ``fsync`` au point de contrôle), et
+les lecteurs (``query()``) ne bloquent pas l'écrivain. L'insertion passe
+par ``executemany`` : une requête préparée une fois par lot. L'index sur
+l'instant sert les requêtes par intervalle.
+
+Exemple :
+
+    with SQLiteWriter("mesures.db") as base:
+        base.append(dht22.read())
+
+    for instant, capteur, temperature, humidite, essais in query("mesures.db", debut, fin):
+        ...
+"""
+
+import queue
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS readings (
+    timestamp   INTEGER NOT NULL,   -- ns (Reading.timestamp)
+    sensor      TEXT NOT NULL,      -- broche, ex. "D4"
+    temperature REAL NOT NULL,
+    humidity    REAL NOT NULL,
+    attempts    INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS readings_timestamp ON readings (timestamp);
+"""
+
+_INSERT = ("INSERT INTO readings (timestamp, sensor, temperature, humidity, attempts) "
+           "VALUES (?, ?, ?, ?, ?)")
+
+# Demande d'arrêt déposée dans la file
+_ARRET = object()
+
+# Pendant flush(), intervalle de vérification que le fil vit encore (s)
+_VERIFICATION_FIL = 0.1
+
+
+def _connecter(path):
+    connexion = sqlite3.connect(path, isolation_level=None)
+    connexion.execute("PRAGMA journal_mode=WAL")
+    connexion.execute("PRAGMA synchronous=NORMAL")
+    return connexion
+
+
+class SQLiteWriter:
+    """
+    Écrivain de mesures par lots (un fil, une connexion).
+
+    Args:
+        path (str): Fichier de la base (créé avec son schéma s'il manque)
+        batch_size (int): Mesures au plus par transaction
+        max_age (float): Attente maximale d'une mesure avant son commit (s)
+        sensor (str): Capteur noté par défaut avec chaque mesure
+
+    Attributes:
+        written (int): Mesures validées dans la base
+        commits (int): Transactions validées
+        errors (int): Lots perdus sur une erreur SQLite
+        last_error: Dernière erreur SQLite
+    """
+
+    def __init__(self, path, batch_size=64, max_age=10.0, sensor="D4"):
+        if batch_size < 1:
+            raise ValueError("Un lot contient au moins une mesure")
+        self.path = path
+        self.batch_size = batch_size
+        self.max_age = max_age
+        self.sensor = sensor
+        self.written = 0
+        self.commits = 0
+        self.errors = 0
+        self.last_error = None
+        self._file = queue.SimpleQueue()
+        self._thread = None
+
+    def start(self):
+        """
+        Crée le schéma puis démarre le fil d'écriture.
+
+        Raises:
+            sqlite3.Error: Base inaccessible (signalé ici plutôt que dans le fil)
+        """
+        connexion = _connecter(self.path)
+        try:
+            connexion.executescript(SCHEMA)
+        finally:
+            connexion.close()
+        self._thread = threading.Thread(target=self._run, name="base-mesures",
+                                        daemon=True)
+        self._thread.start()
+        return self
+
+    def append(self, reading, sensor=None):
+        """Dépose une ``dht22.Reading`` ; aucune entrée-sortie ici."""
+        self._file.put((reading.timestamp, sensor or self.sensor,
+                        reading.temperature, reading.humidity, reading.attempts))
+
+    def flush(self, timeout=None):
+        """
+        Valide tout ce qui a été déposé avant l'appel.
+
+        Returns:
+            bool: False si le délai est écoulé avant le commit
+
+        Raises:
+            RuntimeError: Le fil d'écriture ne tourne pas (start() pas
+                appelée, stop() déjà appelée, ou fil mort)
+        """
+        fait = threading.Event()
+        echeance = None if timeout is None else time.monotonic() + timeout
+        self._verifier_fil()
+        self._file.put(fait)
+        while True:
+            attente = _VERIFICATION_FIL
+            if echeance is not None:
+                attente = min(attente, max(0.0, echeance - time.monotonic()))
+            if fait.wait(attente):
+                return True
+            self._verifier_fil()
+            if echeance is not None and time.monotonic() >= echeance:
+                return False
+
+    def _verifier_fil(self):
+        fil = self._thread
+        if fil is None or not fil.is_alive():
+            raise RuntimeError("Le fil d'écriture de la base ne tourne pas")
+
+    def stop(self):
+        """Valide le dernier lot et arrête le fil."""
+        if self._thread is None:
+            return
+        self._file.put(_ARRET)
+        self._thread.join()
+        self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+    def _valider(self, connexion, lot):
+        if not lot:
+            return
+        try:
+            with connexion:
+                connexion.execute("BEGIN")
+                connexion.executemany(_INSERT, lot)
+        except sqlite3.Error as e:
+            self.errors += 1
+            self.last_error = e
+        else:
+            self.written += len(lot)
+            self.commits += 1
+        lot.clear()
+
+    def _run(self):
+        connexion = _connecter(self.path)
+        lot = []
+        echeance = None
+        try:
+            while True:
+                attente = None if not lot else max(0.0, echeance - time.monotonic())
+                try:
+                    element = self._file.get(timeout=attente)
+                except queue.Empty:
+                    # La plus ancienne mesure du lot a atteint max_age
+                    self._valider(connexion, lot)
+                    continue
+                if element is _ARRET:
+                    self._valider(connexion, lot)
+                    return
+                if isinstance(element, threading.Event):
+                    self._valider(connexion, lot)
+                    element.set()
+                    continue
+                if not lot:
+                    echeance = time.monotonic() + self.max_age
+                lot.append(element)
+                if len(lot) >= self.batch_size:
+                    self._valider(connexion, lot)
+        finally:
+            connexion.close()
+
+
+def query(path, start_ns=None, end_ns=None, sensor=None):
+    """
+    Mesures de ``[start_ns, end_ns[`` dans l'ordre chronologique.
+
+    Ouvre une connexion en lecture seule : utilisable pendant l'écriture.
+
+    Returns:
+        list: ``[(instant, capteur, température, humidité, essais), ...]``
+    """
+    conditions = []
+    parametres = []
+    if start_ns is not None:
+        conditions.append("timestamp >= ?")
+        parametres.append(start_ns)
+    if end_ns is not None:
+        conditions.append("timestamp < ?")
+        parametres.append(end_ns)
+    if sensor is not None:
+        conditions.append("sensor = ?")
+        parametres.append(sensor)
+    requete = ("SELECT timestamp, sensor, temperature, humidity, attempts FROM readings"
+               + (" WHERE " + " AND ".join(conditions) if conditions else "")
+               + " ORDER BY timestamp")
+    # URI absolue : les caractères spéciaux du chemin (?, #, %) sont échappés
+    uri = Path(path).resolve().as_uri() + "?mode=ro"
+    connexion = sqlite3.connect(uri, uri=True)
+    try:
+        return connexion.execute(requete, parametres).fetchall()
+    finally:
+        connexion.close()
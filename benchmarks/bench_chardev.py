@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Banc d'essai : /dev/gpiochipN (un ioctl par trame) vs RPi.GPIO.
+
+À exécuter sur le Raspberry Pi. Chaque pilote est mesuré seul, car les
+lignes prises par la requête chardev ne sont libérées qu'à sa fermeture.
+
+Usage: python3 benchmarks/bench_chardev.py [nombre_de_trames] [/dev/gpiochipN]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from gpio_bank import PinBank, RPiGPIODriver
+from gpio_chardev import ChardevDriver, chip_label, find_chip
+
+LEDS = [17, 27, 22]
+
+
+def mesurer(nom, ecrire_trame, trames):
+    """Mesure le débit d'une fonction d'écriture de trame."""
+    debut = time.perf_counter()
+    for i in range(trames):
+        ecrire_trame(i & 0b111)
+    duree = time.perf_counter() - debut
+    print(f"{nom:<28} {trames / duree:>12,.0f} trames/s")
+
+
+def main():
+    trames = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    puce = sys.argv[2] if len(sys.argv) > 2 else find_chip()
+    if puce is None:
+        sys.exit("Aucune puce GPIO du Pi trouvée : indiquez /dev/gpiochipN")
+    print(f"Puce: {puce} ({chip_label(puce)})")
+
+    with PinBank(LEDS, ChardevDriver(LEDS, puce)) as banque:
+        mesurer("PinBank (chardev)", banque.write, trames)
+
+    try:
+        import RPi.GPIO as GPIO
+    except (ImportError, RuntimeError) as e:
+        print(f"RPi.GPIO indisponible ({e}) : comparaison ignorée")
+        return
+
+    GPIO.setmode(GPIO.BCM)
+    GPIO.setup(LEDS, GPIO.OUT)
+    try:
+        def par_broche(trame):
+            GPIO.output(17, trame & 0b001)
+            GPIO.output(27, trame & 0b010)
+            GPIO.output(22, trame & 0b100)
+
+        mesurer("GPIO.output par broche", par_broche, trames)
+        with PinBank(LEDS, RPiGPIODriver(LEDS, GPIO)) as banque:
+            mesurer("PinBank (RPi.GPIO)", banque.write, trames)
+    finally:
+        GPIO.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Banc d'essai : trames DHT22 décodées par seconde, bit par bit ou NumPy.
+
+- python : boucle par bit, comme ``adafruit_dht`` (niveau haut > 51 µs),
+  une trame alignée à la fois ;
+- decode : ``decodeur_dht22.decode()`` sur chaque capture brute (réponse,
+  trame, niveau bas final), recherche de la trame comprise ;
+- lot : ``decodeur_dht22.decode_frames()`` sur toutes les trames alignées
+  d'un coup (relecture de traces enregistrées).
+
+Les durées portent une gigue de ±6 µs.
+
+Usage: python3 benchmarks/bench_decodeur.py [--trames N]
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+
+from decodeur_dht22 import decode, decode_frames, encode_frame
+
+
+def decoder_python(durees):
+    """Décodage bit par bit d'une trame alignée (80 durées)."""
+    octets = []
+    for debut in range(0, 80, 16):
+        octet = 0
+        for i in range(debut + 1, debut + 16, 2):
+            octet = (octet << 1) | (durees[i] > 51)
+        octets.append(octet)
+    if sum(octets[:4]) & 0xFF != octets[4]:
+        raise RuntimeError("Checksum did not validate. Try again.")
+    brut = ((octets[2] & 0x7F) << 8) | octets[3]
+    temperature = -brut / 10 if octets[2] & 0x80 else brut / 10
+    return temperature, ((octets[0] << 8) | octets[1]) / 10
+
+
+def captures(n, graine=1):
+    hasard = random.Random(graine)
+    resultat = []
+    for _ in range(n):
+        durees = encode_frame(round(hasard.uniform(-20, 40), 1),
+                              round(hasard.uniform(10, 95), 1))
+        resultat.append([d + hasard.randint(-6, 6) for d in durees])
+    return resultat
+
+
+def debit(fonction, n):
+    debut = time.perf_counter()
+    fonction()
+    duree = time.perf_counter() - debut
+    return {"frames_per_s": round(n / duree), "us_per_frame": round(duree / n * 1e6, 3)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--trames", type=int, default=20_000, help="Nombre de trames (défaut: 20000)")
+    args = parser.parse_args()
+
+    brutes = captures(args.trames)
+    alignees = [c[2:-1] for c in brutes]
+    tableau = np.array(alignees, dtype=np.int16)
+
+    attendu = [decoder_python(a) for a in alignees]
+    _, _, valides = decode_frames(tableau)
+    assert valides.all() and decode(brutes[0]) == attendu[0]
+
+    rapport = {
+        "frames": args.trames,
+        "python": debit(lambda: [decoder_python(a) for a in alignees], args.trames),
+        "decode": debit(lambda: [decode(c) for c in brutes], args.trames),
+        "lot": debit(lambda: decode_frames(tableau), args.trames),
+    }
+
+    for nom in ("python", "decode", "lot"):
+        resultat = rapport[nom]
+        print(f"{nom:<7} {resultat['frames_per_s']:12d} trames/s  "
+              f"{resultat['us_per_frame']:9.3f} µs/trame", file=sys.stderr)
+    print(json.dumps(rapport, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Banc d'essai : latence aller-retour des commandes du démon de LEDs.
+
+Le démon tourne dans un processus séparé, sur une banque dont le pilote ne
+touche à rien : on mesure le protocole et le socket Unix, pas le GPIO.
+Avec ``--socket``, on mesure plutôt un démon déjà lancé (sur le Pi).
+
+Usage: python3 benchmarks/bench_demon.py [commandes] [--socket CHEMIN]
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from client_leds import LedClient
+from demon_leds import LEDS, LedDaemon
+from gpio_bank import PinBank
+
+
+class PiloteNul:
+    def apply(self, set_mask, clear_mask):
+        pass
+
+    def close(self):
+        pass
+
+
+def servir(path):
+    async def boucle():
+        demon = await LedDaemon(PinBank(LEDS, PiloteNul()), path).start()
+        await demon.serve_forever()
+    asyncio.run(boucle())
+
+
+def percentile(valeurs_triees, p):
+    return valeurs_triees[max(1, math.ceil(p / 100 * len(valeurs_triees))) - 1]
+
+
+def mesurer(client, commande, n):
+    """Latences (µs) de ``n`` appels à ``commande(i)``."""
+    durees = []
+    for i in range(n):
+        debut = time.perf_counter_ns()
+        commande(i)
+        durees.append((time.perf_counter_ns() - debut) / 1e3)
+    durees.sort()
+    return {
+        "p50_us": round(percentile(durees, 50), 1),
+        "p99_us": round(percentile(durees, 99), 1),
+        "max_us": round(durees[-1], 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("commandes", type=int, nargs="?", default=10_000)
+    parser.add_argument("--socket", help="Démon déjà lancé à mesurer")
+    args = parser.parse_args()
+
+    processus = None
+    path = args.socket
+    if path is None:
+        path = os.path.join(tempfile.mkdtemp(), "leds.sock")
+        processus = multiprocessing.Process(target=servir, args=(path,), daemon=True)
+        processus.start()
+        while not os.path.exists(path):
+            time.sleep(0.01)
+
+    try:
+        with LedClient(path) as leds:
+            rapport = {
+                "write": mesurer(leds, lambda i: leds.write(i & 0b111), args.commandes),
+                "state": mesurer(leds, lambda i: leds.frame, args.commandes),
+            }
+            leds.write(0)
+    finally:
+        if processus is not None:
+            processus.terminate()
+            processus.join()
+
+    for nom, resultat in rapport.items():
+        print(f"{nom:<6} p50 {resultat['p50_us']:7.1f} µs  p99 {resultat['p99_us']:7.1f} µs  "
+              f"max {resultat['max_us']:8.1f} µs", file=sys.stderr)
+    print(json.dumps(rapport, indent=2))
+
+
+if __name__ == "__main__":
+    main()
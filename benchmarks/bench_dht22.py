@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Banc d'essai : latence par lecture du DHT22, capteur neuf ou réutilisé.
+
+- avant : un ``adafruit_dht.DHT22(board.D4)`` créé puis libéré à chaque
+  lecture (réservation de la broche, programme auxiliaire sous Blinka) ;
+- après : ``dht22.read()``, sur le capteur créé une fois par broche, avec
+  température et humidité tirées d'une seule transaction.
+
+Sur le Raspberry Pi, les lectures sont espacées de 2 s (minimum du DHT22).
+Avec --fake, des modules ``board`` / ``adafruit_dht`` factices mesurent le
+coût Python seul.
+
+Usage: python3 benchmarks/bench_dht22.py [--fake] [--lectures N] [--intervalle S]
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+import types
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import dht22
+
+
+class CapteurFactice:
+    """Remplace adafruit_dht.DHT22 : valeurs fixes, aucune broche."""
+
+    def __init__(self, pin, use_pulseio=True):
+        self.pin = pin
+        self._temperature = 21.0
+        self._humidity = 45.0
+
+    def measure(self):
+        pass
+
+    @property
+    def temperature(self):
+        return self._temperature
+
+    def exit(self):
+        pass
+
+
+def installer_factices():
+    board = types.ModuleType("board")
+    board.D4 = 4
+    adafruit_dht = types.ModuleType("adafruit_dht")
+    adafruit_dht.DHT22 = CapteurFactice
+    sys.modules["board"] = board
+    sys.modules["adafruit_dht"] = adafruit_dht
+
+
+def lecture_neuve():
+    """Ancienne méthode : un capteur par lecture."""
+    import board
+    import adafruit_dht
+    dht = adafruit_dht.DHT22(getattr(board, dht22.DHT_PIN))
+    try:
+        return dht.temperature
+    finally:
+        dht.exit()
+
+
+def mesurer(lire, lectures, intervalle):
+    """Latences (ms) et nombre d'erreurs de ``lectures`` appels à ``lire``."""
+    durees = []
+    erreurs = 0
+    for i in range(lectures):
+        if i and intervalle:
+            time.sleep(intervalle)
+        debut = time.perf_counter()
+        try:
+            lire()
+        except RuntimeError:
+            erreurs += 1
+        durees.append((time.perf_counter() - debut) * 1000)
+    return {
+        "median_ms": round(statistics.median(durees), 4),
+        "max_ms": round(max(durees), 4),
+        "errors": erreurs,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--fake", action="store_true", help="Capteur factice")
+    parser.add_argument("--lectures", type=int, default=None,
+                        help="Nombre de lectures (défaut: 10, 10000 avec --fake)")
+    parser.add_argument("--intervalle", type=float, default=None,
+                        help="Secondes entre deux lectures (défaut: 2, 0 avec --fake)")
+    args = parser.parse_args()
+
+    if args.fake:
+        installer_factices()
+    lectures = args.lectures or (10_000 if args.fake else 10)
+    intervalle = args.intervalle if args.intervalle is not None else (0 if args.fake else 2.0)
+
+    rapport = {"avant": mesurer(lecture_neuve, lectures, intervalle)}
+    try:
+        rapport["apres"] = mesurer(lambda: dht22.read(), lectures, intervalle)
+    finally:
+        dht22.close()
+
+    for nom, resultat in rapport.items():
+        print(f"{nom:<6} médiane {resultat['median_ms']:9.4f} ms  "
+              f"max {resultat['max_ms']:9.4f} ms  erreurs {resultat['errors']}",
+              file=sys.stderr)
+    print(json.dumps(rapport, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Banc d'essai : gigue et dérive des motifs de LEDs.
+
+Chaque charge (labo1.py, led_simple.main(), led_rgb.chenillard()) est
+exécutée deux fois sur le GPIO simulé :
+
+1. en temps virtuel : les instants obtenus sont exactement ceux prévus ;
+2. en temps réel (``simulation(realtime=True)``) : chaque transition est
+   horodatée avec ``time.monotonic_ns()`` au moment de l'écriture.
+
+Les deux suites de trames sont appariées (origine : première trame non
+nulle). Le retard de chaque transition donne p50/p99/max, et la
+pente du retard en fonction du temps prévu donne la dérive de période en
+ppm. Le rapport JSON permet de comparer pilotes et ordonnanceurs sur une
+même machine.
+
+Avec ``--backend NOM`` (répétable, clé de ``gpio_bank.DRIVERS``), la
+seconde exécution a lieu sur le vrai GPIO du Raspberry Pi, sans
+simulateur, avec ce pilote : chaque trame est horodatée dès que le pilote
+a rendu la main. Le rapport donne alors un résultat par pilote.
+
+Usage: python3 benchmarks/bench_gigue.py [--duree 5] [--temps-reel CPU]
+                                         [--charge labo1 ...]
+                                         [--backend registre --backend rpi ...]
+"""
+
+import argparse
+import contextlib
+import json
+import math
+import os
+import platform
+import signal
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import gpio_bank
+import labo1
+import led_rgb
+import led_simple
+from sequenceur import Sequencer
+from simulateur import simulation
+from temps_reel import realtime
+
+LEDS = [17, 27, 22]
+
+
+def charge_labo1():
+    labo1.main()
+
+
+def charge_led_simple():
+    led_simple.main()
+
+
+def charge_chenillard(delai=0.1):
+    with led_rgb.leds():
+        sequenceur = Sequencer()
+        while True:
+            led_rgb.chenillard(delai, sequenceur)
+
+
+CHARGES = {
+    "labo1": charge_labo1,
+    "led_simple.main": charge_led_simple,
+    "led_rgb.chenillard": charge_chenillard,
+}
+
+
+def executer(charge, duree, temps_reel=False):
+    """
+    Exécute une charge sur le GPIO simulé.
+
+    Returns:
+        list: ``[(instant_ns, trame), ...]`` à partir de la première trame
+        non nulle, instants relatifs à celle-ci
+    """
+    with open(os.devnull, "w") as nul, contextlib.redirect_stdout(nul):
+        with simulation(duree, realtime=temps_reel) as sim:
+            try:
+                charge()
+            except KeyboardInterrupt:
+                pass
+    return depuis_premiere(sim.gpio.timeline(LEDS))
+
+
+def depuis_premiere(trames):
+    """Trames à partir de la première non nulle, instants relatifs à celle-ci."""
+    debut = next((i for i, (_, trame) in enumerate(trames) if trame), len(trames))
+    trames = trames[debut:]
+    if not trames:
+        return []
+    origine = trames[0][0]
+    return [(instant - origine, trame) for instant, trame in trames]
+
+
+class PiloteEnregistre:
+    """Enveloppe un pilote et horodate chaque trame après son écriture."""
+
+    def __init__(self, pilote, trames):
+        self.pilote = pilote
+        self.trames = trames
+        self._trame = 0
+
+    def apply(self, set_mask, clear_mask):
+        self.pilote.apply(set_mask, clear_mask)
+        self._trame = (self._trame | set_mask) & ~clear_mask
+        self.trames.append((time.monotonic_ns(), self._trame))
+
+    def close(self):
+        self.pilote.close()
+
+
+def _interrompre(signum, frame):
+    raise KeyboardInterrupt
+
+
+def executer_materiel(charge, duree, backend):
+    """
+    Exécute une charge sur le vrai GPIO, avec le pilote ``backend``.
+
+    La charge est interrompue comme par Ctrl+C au bout de ``duree`` s.
+
+    Returns:
+        list: ``[(instant_ns, trame), ...]`` (voir ``executer``)
+    """
+    trames = []
+    creer = gpio_bank.DRIVERS[backend]
+    choisir = gpio_bank.default_driver
+    ancien_backend = os.environ.get("GPIO_BACKEND")
+    gpio_bank.default_driver = lambda pins: PiloteEnregistre(creer(pins), trames)
+    os.environ["GPIO_BACKEND"] = backend
+    ancien_signal = signal.signal(signal.SIGALRM, _interrompre)
+    signal.setitimer(signal.ITIMER_REAL, duree)
+    try:
+        with open(os.devnull, "w") as nul, contextlib.redirect_stdout(nul):
+            try:
+                charge()
+            except KeyboardInterrupt:
+                pass
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, ancien_signal)
+        gpio_bank.default_driver = choisir
+        if ancien_backend is None:
+            os.environ.pop("GPIO_BACKEND", None)
+        else:
+            os.environ["GPIO_BACKEND"] = ancien_backend
+    return depuis_premiere(trames)
+
+
+def percentile(valeurs_triees, p):
+    """Percentile au rang le plus proche."""
+    rang = max(1, math.ceil(p / 100 * len(valeurs_triees)))
+    return valeurs_triees[rang - 1]
+
+
+def apparier(prevu, reel):
+    """
+    Associe chaque trame prévue à sa première occurrence mesurée.
+
+    En temps virtuel, deux écritures au même instant se confondent ; en
+    temps réel, la première reste visible quelques µs (ex. ``write(0)`` suivi
+    de ``write(ROUGE)``). Ces trames transitoires sont sautées et comptées.
+
+    Returns:
+        tuple: (paires ``((prévu_ns, trame), (réel_ns, trame))``,
+        trames transitoires sautées)
+    """
+    paires = []
+    transitoires = 0
+    j = 0
+    for attendu in prevu:
+        k = j
+        while k < len(reel) and reel[k][1] != attendu[1]:
+            k += 1
+        if k == len(reel):
+            break
+        transitoires += k - j
+        paires.append((attendu, reel[k]))
+        j = k + 1
+    return paires, transitoires
+
+
+def analyser(prevu, reel):
+    """
+    Compare les transitions prévues et mesurées.
+
+    Args:
+        prevu (list): ``[(instant_ns, trame), ...]`` en temps virtuel
+        reel (list): ``[(instant_ns, trame), ...]`` en temps réel
+
+    Returns:
+        dict: Retards p50/p99/max (µs), dérive (ppm), trames transitoires
+    """
+    paires, transitoires = apparier(prevu, reel)
+    retards = [r - p for (p, _), (r, _) in paires]
+    resultat = {
+        "transitions": len(paires),
+        "missing_frames": len(prevu) - len(paires),
+        "transient_frames": transitoires,
+    }
+    if len(paires) < 2:
+        return resultat
+
+    tries = sorted(retards)
+    # Pente des moindres carrés : retard (ns) par ns prévu
+    xs = [p for (p, _), _ in paires]
+    mx = sum(xs) / len(xs)
+    my = sum(retards) / len(retards)
+    sxx = sum((x - mx) ** 2 for x in xs)
+    sxy = sum((x - mx) * (y - my) for x, y in zip(xs, retards))
+    pente = sxy / sxx if sxx else 0.0
+
+    resultat.update({
+        "p50_us": round(percentile(tries, 50) / 1e3, 1),
+        "p99_us": round(percentile(tries, 99) / 1e3, 1),
+        "max_us": round(tries[-1] / 1e3, 1),
+        "drift_ppm": round(pente * 1e6, 1),
+        "drift_us": round((retards[-1] - retards[0]) / 1e3, 1),
+    })
+    return resultat
+
+
+def afficher(nom, resultat):
+    print(f"{nom:<30} {resultat['transitions']:>5} transitions  "
+          f"p50 {resultat.get('p50_us', 0):8.1f} µs  "
+          f"p99 {resultat.get('p99_us', 0):8.1f} µs  "
+          f"max {resultat.get('max_us', 0):8.1f} µs  "
+          f"dérive {resultat.get('drift_ppm', 0):+8.1f} ppm",
+          file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--duree", type=float, default=5.0,
+                        help="Durée de chaque charge en secondes (défaut: 5)")
+    parser.add_argument("--temps-reel", type=int, metavar="CPU",
+                        help="Mesurer en mode temps réel, épinglé sur ce cœur")
+    parser.add_argument("--charge", action="append", choices=sorted(CHARGES),
+                        help="Charge à mesurer (toutes par défaut)")
+    parser.add_argument("--backend", action="append", choices=sorted(gpio_bank.DRIVERS),
+                        help="Mesurer sur le vrai GPIO avec ce pilote (répétable)")
+    args = parser.parse_args()
+
+    if args.temps_reel is not None:
+        mode = realtime(cpu=args.temps_reel)
+    else:
+        mode = contextlib.nullcontext()
+
+    rapport = {
+        "machine": platform.node(),
+        "python": platform.python_version(),
+        "duration_s": args.duree,
+        "realtime": None,
+    }
+    if args.backend:
+        rapport["backends"] = {backend: {} for backend in args.backend}
+    else:
+        rapport["workloads"] = {}
+    with mode as etat:
+        if etat is not None:
+            rapport["realtime"] = etat.as_dict()
+        for nom in args.charge or CHARGES:
+            charge = CHARGES[nom]
+            prevu = executer(charge, args.duree)
+            if not args.backend:
+                resultat = analyser(prevu, executer(charge, args.duree, temps_reel=True))
+                rapport["workloads"][nom] = resultat
+                afficher(nom, resultat)
+                continue
+            for backend in args.backend:
+                reel = executer_materiel(charge, args.duree, backend)
+                resultat = analyser(prevu, reel)
+                rapport["backends"][backend][nom] = resultat
+                afficher(f"{backend}/{nom}", resultat)
+
+    print(json.dumps(rapport, indent=2))
+
+
+if __name__ == "__main__":
+    main()
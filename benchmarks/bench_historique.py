@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Banc d'essai : relecture d'un mois de mesures, texte ou historique binaire.
+
+- texte : les lignes « Température: … °C / Humidité: … %RH » de
+  dht22.afficher_mesures(), reparsées ligne par ligne ;
+- binaire : ``historique.replay()`` (projection NumPy), puis la moyenne de
+  la température pour toucher toutes les pages.
+
+Les deux fichiers sont écrits dans un dossier temporaire ; la durée
+d'écriture est aussi mesurée (fsync par lots de ``--lot`` mesures).
+
+Usage: python3 benchmarks/bench_historique.py [--jours N] [--lot N]
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import historique
+
+PERIODE_NS = 2_000_000_000
+
+
+def mesures(n):
+    """Mesures synthétiques : instant, température, humidité."""
+    for i in range(n):
+        yield i * PERIODE_NS, 20.0 + (i % 100) / 10, 40.0 + (i % 50) / 10
+
+
+def ecrire_texte(path, n):
+    with open(path, "w", encoding="utf-8") as f:
+        for _, temperature, humidite in mesures(n):
+            f.write(f"Température: {temperature:.1f} °C\n")
+            f.write(f"Humidité: {humidite:.1f} %RH\n")
+            f.write("-" * 40 + "\n")
+
+
+def relire_texte(path):
+    temperatures = []
+    humidites = []
+    with open(path, encoding="utf-8") as f:
+        for ligne in f:
+            if ligne.startswith("Température:"):
+                temperatures.append(float(ligne.split()[1]))
+            elif ligne.startswith("Humidité:"):
+                humidites.append(float(ligne.split()[1]))
+    return sum(temperatures) / len(temperatures)
+
+
+def ecrire_binaire(path, n, lot):
+    with historique.ReadingLog(path, sync_every=lot, sync_interval=3600) as journal:
+        for mesure in mesures(n):
+            journal.append(*mesure)
+
+
+def relire_binaire(path):
+    return float(historique.replay(path)["temperature"].mean())
+
+
+def chronometrer(fonction, *args):
+    debut = time.perf_counter()
+    fonction(*args)
+    return round((time.perf_counter() - debut) * 1000, 3)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--jours", type=float, default=30, help="Durée simulée (défaut: 30)")
+    parser.add_argument("--lot", type=int, default=512, help="Mesures par fsync (défaut: 512)")
+    args = parser.parse_args()
+    n = int(args.jours * 86400 * 1e9 / PERIODE_NS)
+
+    # NumPy importé d'avance : la relecture chronométrée ne paie pas l'import
+    historique._numpy()
+
+    with tempfile.TemporaryDirectory() as dossier:
+        texte = Path(dossier) / "mesures.txt"
+        binaire = Path(dossier) / "mesures.log"
+        rapport = {
+            "records": n,
+            "texte": {
+                "write_ms": chronometrer(ecrire_texte, texte, n),
+                "replay_ms": chronometrer(relire_texte, texte),
+                "bytes": None,
+            },
+            "binaire": {
+                "write_ms": chronometrer(ecrire_binaire, binaire, n, args.lot),
+                "replay_ms": chronometrer(relire_binaire, binaire),
+                "bytes": None,
+            },
+        }
+        rapport["texte"]["bytes"] = texte.stat().st_size
+        rapport["binaire"]["bytes"] = binaire.stat().st_size
+
+    print(f"{n} mesures", file=sys.stderr)
+    for nom in ("texte", "binaire"):
+        resultat = rapport[nom]
+        print(f"{nom:<8} écriture {resultat['write_ms']:10.1f} ms  "
+              f"relecture {resultat['replay_ms']:9.1f} ms  "
+              f"{resultat['bytes'] / 1e6:6.1f} Mo", file=sys.stderr)
+    print(json.dumps(rapport, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Banc d'essai : temps d'importation des scripts, sans accès au matériel.
+
+Chaque module est importé dans un interpréteur neuf. On vérifie ensuite
+qu'aucun module matériel (RPi.GPIO, board, adafruit_dht) n'a été chargé :
+l'initialisation n'a lieu qu'à l'appel de open().
+
+Usage: python3 benchmarks/bench_import.py [répétitions]
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+MODULES = ["led_simple", "led_rgb", "labo1", "dht22"]
+MATERIEL = ["RPi", "RPi.GPIO", "board", "adafruit_dht"]
+SEUIL_MS = 50.0
+
+_SONDE = """
+import sys, time
+debut = time.perf_counter()
+import {module}
+duree = time.perf_counter() - debut
+print(duree * 1000)
+print(",".join(m for m in {materiel!r} if m in sys.modules))
+"""
+
+
+def mesurer(module):
+    """
+    Importe ``module`` dans un nouvel interpréteur.
+
+    Returns:
+        tuple: (durée en ms, modules matériels chargés)
+    """
+    resultat = subprocess.run(
+        [sys.executable, "-c", _SONDE.format(module=module, materiel=MATERIEL)],
+        capture_output=True, text=True, cwd=str(REPO_ROOT), check=True,
+    )
+    duree, charges = resultat.stdout.splitlines()
+    return float(duree), [m for m in charges.split(",") if m]
+
+
+def main():
+    repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    rapport = {}
+    succes = True
+
+    for module in MODULES:
+        durees = []
+        charges = []
+        for _ in range(repetitions):
+            duree, charges = mesurer(module)
+            durees.append(duree)
+        mediane = statistics.median(durees)
+        ok = mediane < SEUIL_MS and not charges
+        succes = succes and ok
+        rapport[module] = {"median_ms": round(mediane, 3), "hardware_modules": charges}
+        etat = "OK" if ok else "ÉCHEC"
+        print(f"{module:<12} {mediane:8.2f} ms  matériel: {charges or 'aucun'}  {etat}",
+              file=sys.stderr)
+
+    print(json.dumps(rapport, indent=2))
+    return 0 if succes else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
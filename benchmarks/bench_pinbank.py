@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Banc d'essai : trames/seconde, appels par broche vs PinBank.
+
+À exécuter sur le Raspberry Pi, LEDs branchées sur GPIO 17, 27 et 22.
+
+Usage: python3 benchmarks/bench_pinbank.py [nombre_de_trames]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import RPi.GPIO as GPIO
+
+from gpio_bank import PinBank, RPiGPIODriver, default_driver
+
+LED_ROUGE = 17
+LED_VERTE = 27
+LED_JAUNE = 22
+
+LEDS = [LED_ROUGE, LED_VERTE, LED_JAUNE]
+
+
+def mesurer(nom, ecrire_trame, trames):
+    """Mesure le débit d'une fonction d'écriture de trame."""
+    debut = time.perf_counter()
+    for i in range(trames):
+        ecrire_trame(i & 0b111)
+    duree = time.perf_counter() - debut
+    print(f"{nom:<28} {trames / duree:>12,.0f} trames/s")
+
+
+def par_broche(trame):
+    """Méthode actuelle : un GPIO.output par broche."""
+    GPIO.output(LED_ROUGE, trame & 0b001)
+    GPIO.output(LED_VERTE, trame & 0b010)
+    GPIO.output(LED_JAUNE, trame & 0b100)
+
+
+def main():
+    trames = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    GPIO.setmode(GPIO.BCM)
+    GPIO.setup(LEDS, GPIO.OUT)
+
+    try:
+        mesurer("GPIO.output par broche", par_broche, trames)
+        with PinBank(LEDS, RPiGPIODriver(LEDS, GPIO)) as banque:
+            mesurer("PinBank (RPi.GPIO)", banque.write, trames)
+        with PinBank(LEDS, default_driver(LEDS)) as banque:
+            nom = f"PinBank ({type(banque.driver).__name__})"
+            mesurer(nom, banque.write, trames)
+    finally:
+        GPIO.cleanup()
+
+
+if __name__ == "__main__":
+    main()
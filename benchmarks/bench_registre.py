@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Banc d'essai : trames/seconde d'une chaîne de 74HC595 (64, 256, 1024 sorties).
+
+Sur le Raspberry Pi (SPI activé), le transfert réel est mesuré. Sans
+spidev, ou avec --fake, un périphérique factice mesure le coût Python seul.
+
+Usage: python3 benchmarks/bench_registre.py [--fake] [--trames N] [--vitesse HZ]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from gpio_bank import PinBank
+from registre_decalage import ShiftRegisterChain, ShiftRegisterDriver
+
+TAILLES = [64, 256, 1024]
+
+
+class SpiFactice:
+    """Périphérique SPI qui accepte les transferts sans rien envoyer."""
+
+    max_speed_hz = 0
+
+    def writebytes2(self, tampon):
+        pass
+
+    def close(self):
+        pass
+
+
+def ouvrir_spi(factice):
+    if factice:
+        return SpiFactice(), "factice"
+    try:
+        import spidev
+    except ImportError:
+        return SpiFactice(), "factice (spidev absent)"
+    spi = spidev.SpiDev()
+    spi.open(0, 0)
+    spi.mode = 0
+    return spi, "/dev/spidev0.0"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--fake", action="store_true", help="SPI factice")
+    parser.add_argument("--trames", type=int, default=2000)
+    parser.add_argument("--vitesse", type=int, default=8_000_000, help="Horloge SPI (Hz)")
+    args = parser.parse_args()
+
+    spi, nom = ouvrir_spi(args.fake)
+    print(f"SPI: {nom}, {args.vitesse / 1e6:.1f} MHz", file=sys.stderr)
+
+    rapport = {}
+    for sorties in TAILLES:
+        chaine = ShiftRegisterChain(sorties, spi=spi, speed_hz=args.vitesse)
+        banque = PinBank(range(sorties), ShiftRegisterDriver(range(sorties), chaine))
+        # Motif « chenillard » : une sortie allumée qui avance
+        trames = [1 << (i % sorties) for i in range(args.trames)]
+
+        debut = time.perf_counter()
+        for trame in trames:
+            banque.write(trame)
+        duree = time.perf_counter() - debut
+
+        debit = args.trames / duree
+        rapport[sorties] = {"frames_per_s": round(debit, 1),
+                            "outputs_per_s": round(debit * sorties)}
+        print(f"{sorties:>5} sorties  {debit:>12,.0f} trames/s", file=sys.stderr)
+
+    spi.close()
+    print(json.dumps(rapport, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Banc d'essai : insertions soutenues dans SQLite, une par commit ou par lots.
+
+- avant : ``INSERT`` + ``commit`` par mesure, journal par défaut (DELETE) ;
+- après : ``base_mesures.SQLiteWriter`` (WAL, fil d'arrière-plan, lots de
+  ``--lot`` mesures).
+
+Mesure le débit (insertions validées par seconde, jusqu'au dernier commit)
+et la latence de l'appel vu par la boucle de lecture (p50 / p99).
+
+Usage: python3 benchmarks/bench_sqlite.py [--mesures N] [--lot N]
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from base_mesures import SCHEMA, SQLiteWriter
+from dht22 import Reading
+
+
+def centile(valeurs, p):
+    """Centile au rang le plus proche."""
+    triees = sorted(valeurs)
+    return triees[min(len(triees) - 1, max(0, round(p / 100 * len(triees)) - 1))]
+
+
+def resume(durees_ns, total_s):
+    durees_us = [d / 1000 for d in durees_ns]
+    return {
+        "inserts_per_s": round(len(durees_ns) / total_s),
+        "p50_us": round(centile(durees_us, 50), 2),
+        "p99_us": round(centile(durees_us, 99), 2),
+    }
+
+
+def un_par_commit(path, mesures):
+    connexion = sqlite3.connect(path)
+    connexion.executescript(SCHEMA)
+    durees = []
+    debut = time.perf_counter()
+    for m in mesures:
+        t = time.perf_counter_ns()
+        connexion.execute("INSERT INTO readings VALUES (?, ?, ?, ?, ?)",
+                          (m.timestamp, "D4", m.temperature, m.humidity, m.attempts))
+        connexion.commit()
+        durees.append(time.perf_counter_ns() - t)
+    total = time.perf_counter() - debut
+    connexion.close()
+    return resume(durees, total)
+
+
+def par_lots(path, mesures, lot):
+    durees = []
+    ecrivain = SQLiteWriter(path, batch_size=lot, max_age=10.0).start()
+    debut = time.perf_counter()
+    for m in mesures:
+        t = time.perf_counter_ns()
+        ecrivain.append(m)
+        durees.append(time.perf_counter_ns() - t)
+    ecrivain.stop()
+    total = time.perf_counter() - debut
+    return resume(durees, total)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--mesures", type=int, default=5000, help="Nombre de mesures (défaut: 5000)")
+    parser.add_argument("--lot", type=int, default=64, help="Mesures par transaction (défaut: 64)")
+    args = parser.parse_args()
+
+    mesures = [Reading(20.0 + i % 100 / 10, 45.0, i * 2_000_000_000, 1)
+               for i in range(args.mesures)]
+    with tempfile.TemporaryDirectory() as dossier:
+        rapport = {
+            "avant": un_par_commit(str(Path(dossier) / "avant.db"), mesures),
+            "apres": par_lots(str(Path(dossier) / "apres.db"), mesures, args.lot),
+        }
+
+    for nom, resultat in rapport.items():
+        print(f"{nom:<6} {resultat['inserts_per_s']:9d} insertions/s  "
+              f"p50 {resultat['p50_us']:9.2f} µs  p99 {resultat['p99_us']:9.2f} µs",
+              file=sys.stderr)
+    print(json.dumps(rapport, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Client du démon de LEDs (demon_leds.py) et protocole binaire partagé.
+
+Le démon possède les broches ; les scripts lui envoient des commandes
+courtes sur un socket Unix au lieu d'appeler ``GPIO.output`` eux-mêmes.
+
+Requête : en-tête ``<BBI`` (commande, emplacement, taille du contenu),
+suivi du contenu :
+
+- ``CMD_SET``   : ``<QQ`` masques à mettre à 1 et à 0 (comme ``apply``)
+- ``CMD_PLAY``  : ``<BQq`` (en boucle, broches, durée en ns) puis une
+  paire ``<qQ`` (offset en ns, trame) par étape de la ``Timeline``
+- ``CMD_STOP``  : rien ; arrête le motif de l'emplacement (``TOUS`` : tous)
+- ``CMD_STATE`` : rien ; relit la trame courante
+
+Réponse : ``<BQ`` (statut, trame courante après la commande).
+
+Exemple :
+
+    with LedClient() as leds:
+        leds.write(0b001)                       # rouge
+        leds.play(1, compile_pattern(LABO1, LEDS))
+        leds.stop(1)
+
+Avec ``GPIO_BACKEND=demon``, ``PinBank`` passe par ``DaemonDriver`` : les
+scripts existants écrivent leurs trames à travers le démon.
+"""
+
+import os
+import socket
+import struct
+
+SOCKET_PATH = "/tmp/formatif-leds.sock"
+
+CMD_SET = 1
+CMD_PLAY = 2
+CMD_STOP = 3
+CMD_STATE = 4
+
+# Emplacement spécial de CMD_STOP : tous les motifs
+TOUS = 0xFF
+
+STATUS_OK = 0
+STATUS_UNKNOWN_COMMAND = 1
+STATUS_BAD_PAYLOAD = 2
+
+HEADER = struct.Struct("<BBI")
+REPLY = struct.Struct("<BQ")
+SET = struct.Struct("<QQ")
+PLAY = struct.Struct("<BQq")
+STEP = struct.Struct("<qQ")
+
+_MESSAGES = {
+    STATUS_UNKNOWN_COMMAND: "commande inconnue",
+    STATUS_BAD_PAYLOAD: "contenu invalide",
+}
+
+
+def socket_path():
+    """Chemin du socket : ``LEDS_SOCKET`` ou ``SOCKET_PATH``."""
+    return os.environ.get("LEDS_SOCKET", SOCKET_PATH)
+
+
+class LedClient:
+    """
+    Connexion au démon de LEDs, avec les mêmes écritures que ``PinBank``.
+
+    Args:
+        path (str): Socket du démon (par défaut : ``socket_path()``)
+
+    Raises:
+        OSError: Démon absent (FileNotFoundError, ConnectionRefusedError)
+    """
+
+    def __init__(self, path=None):
+        self.path = path if path is not None else socket_path()
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self._sock.connect(self.path)
+        except OSError:
+            self._sock.close()
+            raise
+        self._reponse = bytearray(REPLY.size)
+
+    def request(self, command, slot=0, payload=b""):
+        """
+        Envoie une commande et attend la réponse.
+
+        Returns:
+            int: Trame courante du démon
+
+        Raises:
+            RuntimeError: Commande refusée par le démon
+        """
+        self._sock.sendall(HEADER.pack(command, slot, len(payload)) + payload)
+        vue = memoryview(self._reponse)
+        while vue:
+            n = self._sock.recv_into(vue)
+            if not n:
+                raise ConnectionError("Connexion fermée par le démon")
+            vue = vue[n:]
+        statut, trame = REPLY.unpack(self._reponse)
+        if statut != STATUS_OK:
+            raise RuntimeError(f"Commande {command} refusée par le démon: "
+                               f"{_MESSAGES.get(statut, statut)}")
+        return trame
+
+    def apply(self, set_mask, clear_mask):
+        """Met à 1 les bits de ``set_mask`` et à 0 ceux de ``clear_mask``."""
+        return self.request(CMD_SET, 0, SET.pack(set_mask, clear_mask))
+
+    def write(self, frame):
+        """Applique une trame complète."""
+        return self.apply(frame, ~frame & 0xFFFF_FFFF_FFFF_FFFF)
+
+    def set(self, mask):
+        """Met à HIGH les broches du masque, sans toucher aux autres."""
+        return self.apply(mask, 0)
+
+    def clear(self, mask):
+        """Met à LOW les broches du masque, sans toucher aux autres."""
+        return self.apply(0, mask)
+
+    @property
+    def frame(self):
+        """Trame courante du démon."""
+        return self.request(CMD_STATE)
+
+    def play(self, slot, timeline, mask=None, repeat=True):
+        """
+        Fait jouer une ``Timeline`` par le démon.
+
+        Args:
+            slot (int): Emplacement du motif (0 à 254) ; un motif déjà à
+                cet emplacement est remplacé
+            timeline (Timeline): Ligne de temps compilée (motifs.py)
+            mask (int): Broches attribuées au motif (toutes par défaut)
+            repeat (bool): Rejouer le motif en boucle
+        """
+        contenu = bytearray(PLAY.pack(int(repeat), mask or 0, timeline.duration_ns))
+        for offset, trame in zip(timeline.offsets, timeline.masks):
+            contenu += STEP.pack(offset, trame)
+        return self.request(CMD_PLAY, slot, bytes(contenu))
+
+    def stop(self, slot=TOUS):
+        """Arrête un motif (tous par défaut) et éteint ses broches."""
+        return self.request(CMD_STOP, slot)
+
+    def close(self):
+        """Ferme la connexion (le démon garde l'état des broches)."""
+        self._sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+class DaemonDriver:
+    """
+    Pilote ``PinBank`` qui passe par le démon.
+
+    Le bit i de la trame désigne la broche i du démon : les deux côtés
+    doivent utiliser la même liste (``LEDS`` dans ce projet).
+
+    D'autres clients peuvent changer les mêmes broches : ``shared`` indique
+    à ``PinBank`` de ne pas se fier à sa dernière trame pour sauter une
+    écriture.
+
+    Args:
+        pins (sequence): Broches de la banque
+        client (LedClient): Connexion existante (sinon une nouvelle)
+    """
+
+    shared = True
+
+    def __init__(self, pins, client=None):
+        self.pins = tuple(pins)
+        self.client = client if client is not None else LedClient()
+
+    def apply(self, set_mask, clear_mask):
+        """Une commande ``CMD_SET`` par trame."""
+        self.client.apply(set_mask, clear_mask)
+
+    def close(self):
+        """Ferme la connexion."""
+        self.client.close()
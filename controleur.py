@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Contrôleur de LEDs asyncio : plusieurs motifs en parallèle, sans bloquer.
+
+Chaque motif (``Timeline`` compilée, voir motifs.py) tourne dans sa propre
+tâche asyncio et ne pilote que les broches qui lui sont attribuées. Les
+attentes utilisent ``asyncio.sleep`` jusqu'à des échéances absolues : pas
+d'attente active, et d'autres coroutines (lecture du capteur, commandes)
+partagent la même boucle d'événements.
+
+Exemple :
+
+    controleur = LedController(PinBank(LEDS))
+    controleur.run("clignote", timeline_rouge, banque.mask(LED_ROUGE))
+    controleur.run("chenille", timeline_vj, banque.mask(LED_VERTE, LED_JAUNE))
+    ...
+    controleur.run("chenille", autre_timeline)    # remplace à chaud
+    await controleur.close()
+"""
+
+import asyncio
+import time
+
+from motifs import compile_pattern
+
+
+class LedController:
+    """
+    Fait tourner des motifs concurrents sur une ``PinBank``.
+
+    Args:
+        bank (PinBank): Banque de broches partagée par tous les motifs
+    """
+
+    def __init__(self, bank):
+        self.bank = bank
+        self._tasks = {}
+        self._masks = {}
+
+    @property
+    def running(self):
+        """Noms des motifs en cours."""
+        return [nom for nom, tache in self._tasks.items() if not tache.done()]
+
+    def run(self, name, timeline, mask=None, repeat=True):
+        """
+        Démarre un motif, ou remplace celui qui porte déjà ce nom.
+
+        Args:
+            name (str): Nom du motif
+            timeline (Timeline): Ligne de temps compilée
+            mask (int): Broches attribuées au motif (toutes par défaut).
+                Elles sont retirées des autres motifs.
+            repeat (bool): Rejouer le motif en boucle
+
+        Returns:
+            asyncio.Task: Tâche qui joue le motif
+
+        Raises:
+            ValueError: Motif vide, de durée nulle, ou étape hors de
+                ``[0, duration_ns)``
+        """
+        if (not len(timeline) or timeline.duration_ns <= 0
+                or timeline.offsets[0] < 0
+                or timeline.offsets[-1] >= timeline.duration_ns):
+            raise ValueError("Motif invalide : il faut au moins une étape et "
+                             "des offsets dans [0, durée)")
+        if mask is None:
+            mask = self.bank.all_mask
+        self._forget(name)
+        for autre in self._masks:
+            self._masks[autre] &= ~mask
+        self._masks[name] = mask
+        tache = asyncio.get_running_loop().create_task(
+            self._play(name, timeline, repeat), name=f"led:{name}")
+        self._tasks[name] = tache
+        return tache
+
+    async def cancel(self, name):
+        """Arrête un motif et éteint ses broches."""
+        tache = self._tasks.get(name)
+        masque = self._masks.get(name, 0)
+        self._forget(name)
+        if tache is not None:
+            await asyncio.gather(tache, return_exceptions=True)
+        self._write(masque, 0)
+
+    async def close(self):
+        """Arrête tous les motifs et éteint toutes les LEDs."""
+        for nom in list(self._tasks):
+            await self.cancel(nom)
+        self.bank.write(0)
+
+    def _forget(self, name):
+        tache = self._tasks.pop(name, None)
+        if tache is not None:
+            tache.cancel()
+        self._masks.pop(name, None)
+
+    def _write(self, mask, frame):
+        # Seuls les bits du motif changent, les autres sont conservés
+        self.bank.write((self.bank.frame & ~mask) | (frame & mask))
+
+    async def _play(self, name, timeline, repeat):
+        t0 = time.monotonic_ns()
+        while True:
+            for offset, trame in zip(timeline.offsets, timeline.masks):
+                restant = t0 + offset - time.monotonic_ns()
+                if restant > 0:
+                    await asyncio.sleep(restant / 1e9)
+                self._write(self._masks.get(name, 0), trame)
+            t0 += timeline.duration_ns
+            if not repeat:
+                break
+            restant = t0 - time.monotonic_ns()
+            if restant > 0:
+                await asyncio.sleep(restant / 1e9)
+
+
+async def _demo():
+    """Clignotement rouge + chenillard vert/jaune, échangé après 5 s."""
+    import RPi.GPIO as GPIO
+    from gpio_bank import PinBank
+
+    leds = [17, 27, 22]
+    GPIO.setmode(GPIO.BCM)
+    GPIO.setup(leds, GPIO.OUT)
+    banque = PinBank(leds)
+    controleur = LedController(banque)
+
+    clignote = compile_pattern({"delai": 0.5, "etapes": ["R", ""]}, leds)
+    chenille = compile_pattern({"delai": 0.2, "etapes": ["V", "J"]}, leds)
+    ensemble = compile_pattern({"delai": 0.1, "etapes": ["VJ", ""]}, leds)
+
+    controleur.run("clignote", clignote, banque.mask(17))
+    controleur.run("chenille", chenille, banque.mask(27, 22))
+    try:
+        await asyncio.sleep(5)
+        print("Changement de motif sans redémarrer")
+        controleur.run("chenille", ensemble, banque.mask(27, 22))
+        await asyncio.sleep(5)
+    finally:
+        await controleur.close()
+        GPIO.cleanup()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(_demo())
+    except KeyboardInterrupt:
+        print("\nAu revoir!")
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Décodeur vectorisé de la trame du DHT22 à partir des durées d'impulsions.
+
+Le DHT22 répond par un niveau bas puis haut d'environ 80 µs chacun, puis
+envoie 40 bits. Chaque bit est un niveau bas d'environ 50 µs suivi d'un
+niveau haut de 26-28 µs (0) ou d'environ 70 µs (1). Les 5 octets sont
+l'humidité (×10), la température (×10, bit de poids fort = signe) et une
+somme de contrôle.
+
+Une capture (``pulseio.PulseIn`` sous Blinka, analyseur logique, ...)
+donne les durées entre fronts successifs, en µs. Au lieu de parcourir les
+bits un par un en Python, toutes les positions possibles d'une trame de
+80 durées sont examinées d'un coup avec NumPy :
+
+- bits : niveaux hauts comparés à ``SEUIL_UN`` ;
+- forme : tous les niveaux bas entre ``BAS_MIN`` et ``BAS_MAX`` ;
+- somme de contrôle et plausibilité (-40..80 °C, 0..100 %RH).
+
+La première position valide est retenue. Ni la réponse du capteur ni le
+niveau bas final ne sont nécessaires, et un premier front manqué (premier
+niveau bas du bit 0 perdu) est toléré : un niveau bas nominal est ajouté
+en tête. ``decode_frames`` décode des milliers de trames alignées en une
+passe (traces enregistrées, banc d'essai). Pour une seule capture, le
+coût est celui des appels NumPy (quelques dizaines de µs, négligeables
+toutes les 2 s) ; le gain est sur les lots.
+
+Les erreurs sont des RuntimeError aux messages d'adafruit_dht, classées
+de la même façon par ``reessai.classify``.
+
+Usage:
+    python3 decodeur_dht22.py trace.txt     # durées en µs, séparées par des blancs
+"""
+
+import argparse
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Durées en µs
+SEUIL_UN = 48           # niveau haut plus long : bit à 1
+BAS_MIN = 35
+BAS_MAX = 75
+BAS_NOMINAL = 50
+DUREES_PAR_TRAME = 80   # 40 × (bas, haut)
+
+
+def _numpy():
+    if np is None:
+        raise ImportError("Le décodeur vectorisé nécessite NumPy")
+    return np
+
+
+def _valeurs(octets):
+    """Température, humidité et validité de trames de 5 octets (..., 5)."""
+    o = octets.astype(np.int32)
+    humidite = ((o[..., 0] << 8) | o[..., 1]) / 10
+    brut = ((o[..., 2] & 0x7F) << 8) | o[..., 3]
+    temperature = np.where(o[..., 2] & 0x80, -brut, brut) / 10
+    somme = (o[..., 0] + o[..., 1] + o[..., 2] + o[..., 3]) & 0xFF
+    valide = ((somme == o[..., 4]) & (humidite <= 100)
+              & (temperature >= -40) & (temperature <= 80))
+    return temperature, humidite, valide
+
+
+def decode_frames(frames):
+    """
+    Décode des trames alignées : ``frames[i]`` = 80 durées (bas, haut, ...).
+
+    Args:
+        frames: Tableau (n, 80) de durées en µs
+
+    Returns:
+        tuple: (températures, humidités, masque des trames valides),
+        tableaux de longueur n
+    """
+    np = _numpy()
+    frames = np.asarray(frames)
+    if frames.ndim != 2 or frames.shape[1] != DUREES_PAR_TRAME:
+        raise ValueError(f"Attendu (n, {DUREES_PAR_TRAME}) durées, reçu {frames.shape}")
+    bas = frames[:, 0::2]
+    forme = np.all((bas >= BAS_MIN) & (bas <= BAS_MAX), axis=1)
+    octets = np.packbits(frames[:, 1::2] > SEUIL_UN, axis=1)
+    temperature, humidite, valide = _valeurs(octets)
+    return temperature, humidite, valide & forme
+
+
+def decode(durations):
+    """
+    Décode une capture : cherche la trame dans les durées entre fronts.
+
+    Args:
+        durations: Durées successives en µs (niveaux alternés), avec ou
+            sans la réponse du capteur et le niveau bas final
+
+    Returns:
+        tuple: (température en °C, humidité en %RH)
+
+    Raises:
+        RuntimeError: Capture trop courte ou aucune trame valide
+    """
+    np = _numpy()
+    d = np.asarray(durations)
+    if len(d) < 10:
+        raise RuntimeError("DHT sensor not found, check wiring")
+    # Premier front manqué : le niveau bas du bit 0 est rétabli
+    d = np.concatenate(([BAS_NOMINAL], d))
+    if len(d) < DUREES_PAR_TRAME:
+        raise RuntimeError("A full buffer was not returned. Try again.")
+    positions = np.lib.stride_tricks.sliding_window_view(d, DUREES_PAR_TRAME)
+    temperature, humidite, valide = decode_frames(positions)
+    trouvees = np.flatnonzero(valide)
+    if not len(trouvees):
+        raise RuntimeError("Checksum did not validate. Try again.")
+    i = trouvees[0]
+    return float(temperature[i]), float(humidite[i])
+
+
+def encode_frame(temperature, humidity, response=True, trailing=True,
+                 zero=27, one=70, low=BAS_NOMINAL):
+    """
+    Durées idéales de la trame d'une mesure (tests, banc d'essai).
+
+    Args:
+        temperature (float): °C, au dixième
+        humidity (float): %RH, au dixième
+        response (bool): Commencer par la réponse du capteur (80 µs, 80 µs)
+        trailing (bool): Finir par le niveau bas final
+
+    Returns:
+        list: Durées en µs
+    """
+    h = round(humidity * 10)
+    t = round(abs(temperature) * 10) | (0x8000 if temperature < 0 else 0)
+    octets = [h >> 8, h & 0xFF, t >> 8, t & 0xFF]
+    octets.append(sum(octets) & 0xFF)
+    durees = [80, 80] if response else []
+    for octet in octets:
+        for k in range(7, -1, -1):
+            durees += [low, one if octet >> k & 1 else zero]
+    if trailing:
+        durees.append(low)
+    return durees
+
+
+def load_trace(path):
+    """
+    Lit une trace enregistrée : durées en µs séparées par des blancs ou
+    des virgules ; ``#`` commence un commentaire.
+
+    Returns:
+        list: Durées (int)
+    """
+    durees = []
+    with open(path, encoding="utf-8") as f:
+        for ligne in f:
+            ligne = ligne.split("#", 1)[0].replace(",", " ")
+            durees.extend(int(float(mot)) for mot in ligne.split())
+    return durees
+
+
+def main():
+    """Point d'entrée en ligne de commande."""
+    parser = argparse.ArgumentParser(description="Décode une trace d'impulsions DHT22")
+    parser.add_argument("traces", nargs="+", help="Fichiers de durées en µs")
+    args = parser.parse_args()
+
+    for path in args.traces:
+        try:
+            temperature, humidite = decode(load_trace(path))
+        except RuntimeError as e:
+            print(f"{path}: {e}")
+        else:
+            print(f"{path}: {temperature:.1f} °C  {humidite:.1f} %RH")
+
+
+if __name__ == "__main__":
+    main()
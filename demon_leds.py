@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Démon de LEDs : un seul processus possède les GPIO.
+
+Les scripts configurent d'habitude leurs broches eux-mêmes
+(``setmode``/``setup``/``cleanup``) : deux scripts lancés en même temps se
+les disputent, et chaque lancement paie l'initialisation. Ici, le démon
+configure les broches une fois, garde une ``PinBank`` et un
+``LedController`` ouverts, et reçoit des commandes binaires compactes sur
+un socket Unix (protocole et client : client_leds.py).
+
+Usage:
+    python3 demon_leds.py [--socket /tmp/formatif-leds.sock]
+
+Puis, depuis un autre processus :
+
+    from client_leds import LedClient
+    with LedClient() as leds:
+        leds.write(0b111)
+"""
+
+import argparse
+import asyncio
+import os
+import signal
+import socket
+from array import array
+
+from client_leds import (
+    CMD_PLAY, CMD_SET, CMD_STATE, CMD_STOP, HEADER, PLAY, REPLY, SET,
+    STATUS_BAD_PAYLOAD, STATUS_OK, STATUS_UNKNOWN_COMMAND, STEP, TOUS,
+    socket_path,
+)
+from controleur import LedController
+from gpio_bank import PinBank
+from motifs import Timeline
+
+LED_ROUGE = 17
+LED_VERTE = 27
+LED_JAUNE = 22
+
+LEDS = [LED_ROUGE, LED_VERTE, LED_JAUNE]
+
+
+class LedDaemon:
+    """
+    Serveur de commandes pour une ``PinBank``.
+
+    Args:
+        bank (PinBank): Banque possédée par le démon
+        path (str): Chemin du socket Unix (par défaut : ``socket_path()``)
+    """
+
+    def __init__(self, bank, path=None):
+        self.bank = bank
+        self.path = path if path is not None else socket_path()
+        self.controller = LedController(bank)
+        self._server = None
+
+    async def start(self):
+        """
+        Ouvre le socket.
+
+        Raises:
+            OSError: Un autre démon écoute déjà sur ce chemin
+        """
+        _liberer(self.path)
+        self._server = await asyncio.start_unix_server(self._client, path=self.path)
+        return self
+
+    async def serve_forever(self):
+        """Sert les clients jusqu'à l'annulation de la tâche."""
+        await self._server.serve_forever()
+
+    async def close(self):
+        """Ferme le socket, arrête les motifs et éteint les LEDs."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+        await self.controller.close()
+
+    async def _client(self, reader, writer):
+        try:
+            while True:
+                commande, emplacement, taille = HEADER.unpack(
+                    await reader.readexactly(HEADER.size))
+                contenu = await reader.readexactly(taille) if taille else b""
+                statut = await self._executer(commande, emplacement, contenu)
+                writer.write(REPLY.pack(statut, self.bank.frame))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _executer(self, commande, emplacement, contenu):
+        if commande == CMD_SET:
+            if len(contenu) != SET.size:
+                return STATUS_BAD_PAYLOAD
+            a_un, a_zero = SET.unpack(contenu)
+            touchees = a_un | a_zero
+            self.bank.write((self.bank.frame & ~touchees) | a_un)
+        elif commande == CMD_PLAY:
+            timeline = _decoder_timeline(contenu)
+            if timeline is None or emplacement == TOUS:
+                return STATUS_BAD_PAYLOAD
+            repeter, masque, _ = PLAY.unpack_from(contenu)
+            self.controller.run(f"motif{emplacement}", timeline,
+                                masque or None, bool(repeter))
+        elif commande == CMD_STOP:
+            if emplacement == TOUS:
+                for nom in self.controller.running:
+                    await self.controller.cancel(nom)
+            else:
+                await self.controller.cancel(f"motif{emplacement}")
+        elif commande != CMD_STATE:
+            return STATUS_UNKNOWN_COMMAND
+        return STATUS_OK
+
+
+def _decoder_timeline(contenu):
+    """
+    Reconstruit une ``Timeline`` depuis le contenu de CMD_PLAY.
+
+    Returns:
+        Timeline: None si le contenu est invalide : taille incorrecte, durée
+        nulle ou négative, aucune étape, offsets décroissants ou hors de
+        ``[0, durée)``
+    """
+    if len(contenu) <= PLAY.size or (len(contenu) - PLAY.size) % STEP.size:
+        return None
+    _, _, duree = PLAY.unpack_from(contenu)
+    if duree <= 0:
+        return None
+    offsets = array("q")
+    masques = array("Q")
+    for offset, trame in STEP.iter_unpack(contenu[PLAY.size:]):
+        offsets.append(offset)
+        masques.append(trame)
+    if offsets[0] < 0 or offsets[-1] >= duree:
+        return None
+    if any(b < a for a, b in zip(offsets, offsets[1:])):
+        return None
+    return Timeline(offsets, masques, duree)
+
+
+def _liberer(path):
+    """Supprime un socket orphelin ; refuse si un démon y répond encore."""
+    if not os.path.exists(path):
+        return
+    sonde = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sonde.connect(path)
+    except ConnectionRefusedError:
+        os.unlink(path)
+    else:
+        raise OSError(f"Un démon écoute déjà sur {path}")
+    finally:
+        sonde.close()
+
+
+async def _servir(banque, path):
+    demon = await LedDaemon(banque, path).start()
+    boucle = asyncio.get_running_loop()
+    tache = asyncio.current_task()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        boucle.add_signal_handler(signum, tache.cancel)
+    print(f"Démon de LEDs prêt sur {demon.path}")
+    try:
+        await demon.serve_forever()
+    except asyncio.CancelledError:
+        pass
+    finally:
+        await demon.close()
+
+
+def main():
+    """Point d'entrée en ligne de commande."""
+    parser = argparse.ArgumentParser(description="Démon de LEDs (socket Unix)")
+    parser.add_argument("--socket", default=socket_path(),
+                        help="Chemin du socket (défaut: $LEDS_SOCKET ou %(default)s)")
+    args = parser.parse_args()
+
+    import RPi.GPIO as GPIO
+
+    GPIO.setmode(GPIO.BCM)
+    GPIO.setup(LEDS, GPIO.OUT)
+    banque = PinBank(LEDS)
+    try:
+        asyncio.run(_servir(banque, args.socket))
+    finally:
+        banque.close()
+        GPIO.cleanup()
+        print("Au revoir!")
+
+
+if __name__ == "__main__":
+    main()
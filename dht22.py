@@ -11,49 +11,283 @@ Câblage DHT22 :
 - Pin 4 (GND)  → GND
 
 Note : Le DHT22 utilise un protocole one-wire (pas I²C).
+
+Importer ce module ne touche pas au matériel : board et adafruit_dht ne
+sont importés qu'à l'ouverture du capteur (open() ou ``with capteur():``).
+Le capteur est ensuite partagé par lire_temperature(), lire_humidite() et
+afficher_mesures(), et libéré par close() (ou à la sortie du programme).
 """
 
+import argparse
+import atexit
 import time
-import board
-import adafruit_dht
+from collections import namedtuple
+from contextlib import contextmanager
+
+from reessai import INTERVALLE_MIN, RetryPolicy
 
 # Configuration du capteur DHT22
 # Le DHT22 et DHT11 utilisent le même pilote
-DHT_PIN = board.D4  # GPIO 4 (Broche 7 sur le connecteur)
-DHT_SENSOR = adafruit_dht.DHT22
+DHT_PIN = "D4"  # GPIO 4 (Broche 7 sur le connecteur), attribut de board
+
+# Capteurs ouverts, un par broche, pour tout le processus. Créer un
+# adafruit_dht.DHT22 réserve la broche (et, sous Blinka, lance un
+# programme auxiliaire de lecture des impulsions) : on ne le fait qu'une fois.
+_capteurs = {}
+
+# Politiques de réessai, une par broche (voir retry_policy())
+_politiques = {}
+
+# Échantillonneur en arrière-plan et sa broche (voir start_sampler())
+_echantillonneur = None
+_broche_echantillonnee = None
+
+# Attente maximale d'une mesure de l'échantillonneur (s)
+ATTENTE_MAX = 15.0
+
+# Au-delà de cet âge (en périodes d'échantillonnage), la dernière mesure de
+# l'échantillonneur n'est plus rendue : capteur débranché, lectures en échec
+AGE_MAX_PERIODES = 2
+
+def open(pin=DHT_PIN):
+    """
+    Retourne le capteur DHT22 de la broche, créé au premier appel.
+
+    Args:
+        pin (str): Attribut de ``board`` (ex. ``"D4"``)
+
+    Returns:
+        adafruit_dht.DHT22: Capteur prêt à être lu
+    """
+    dht = _capteurs.get(pin)
+    if dht is None:
+        import board
+        import adafruit_dht
+        dht = adafruit_dht.DHT22(getattr(board, pin))
+        if not _capteurs:
+            # Libération garantie à la sortie, même sans close()
+            atexit.register(close)
+        _capteurs[pin] = dht
+    return dht
+
+def close(pin=None):
+    """
+    Libère un capteur et sa broche avec ``exit()`` (tous par défaut).
+
+    Sans effet si le capteur n'est pas ouvert.
+    """
+    broches = list(_capteurs) if pin is None else [pin]
+    if _broche_echantillonnee in broches:
+        stop_sampler()
+    for broche in broches:
+        dht = _capteurs.pop(broche, None)
+        if dht is not None:
+            dht.exit()
+    if not _capteurs:
+        atexit.unregister(close)
+
+@contextmanager
+def capteur(pin=DHT_PIN):
+    """Contexte ``with capteur() as dht:`` qui appelle open() puis close()."""
+    try:
+        yield open(pin)
+    finally:
+        close(pin)
+
+class Reading(namedtuple("Reading", "temperature humidity timestamp attempts")):
+    """
+    Mesure immuable : température et humidité d'une même transaction.
+
+    Attributes:
+        temperature (float): Température en °C
+        humidity (float): Humidité relative en %RH
+        timestamp (int): Instant de la lecture (ns, ``time.time_ns()``)
+        attempts (int): Transactions nécessaires (1 si la première a réussi)
+    """
+
+    __slots__ = ()
+
+
+def _transaction(dht):
+    """Une transaction avec le capteur ; retourne (température, humidité)."""
+    # temperature lance la transaction ; humidity rappelle measure(), sans
+    # effet moins de 2 s après : les deux valeurs viennent de la même trame
+    return dht.temperature, dht.humidity
+
+def retry_policy(pin=DHT_PIN):
+    """
+    Politique de réessai du capteur de la broche (créée au premier appel).
+
+    Ses statistiques (``retry_policy().stats``) couvrent toutes les
+    lectures du processus sur cette broche.
+
+    Returns:
+        RetryPolicy: Politique partagée par read(), lire_temperature(), ...
+    """
+    politique = _politiques.get(pin)
+    if politique is None:
+        politique = _politiques[pin] = RetryPolicy()
+    return politique
 
-def lire_temperature():
+def read(pin=DHT_PIN, policy=None):
+    """
+    Lit température et humidité en une seule transaction.
+
+    Moins de 2 s après la précédente, adafruit_dht rend les valeurs de
+    celle-ci sans interroger le capteur : la paire reste cohérente. En cas
+    d'erreur, la politique de réessai (reessai.py) choisit l'attente la
+    plus courte sûre selon la classe d'erreur.
+
+    Args:
+        pin (str): Attribut de ``board`` (ex. ``"D4"``)
+        policy (RetryPolicy): Politique à utiliser (par défaut :
+            ``retry_policy(pin)``)
+
+    Returns:
+        Reading: Mesure complète
+
+    Raises:
+        RuntimeError: Erreur de la dernière transaction, une fois le nombre
+            de transactions ou la durée maximale atteints
+    """
+    dht = open(pin)
+    if policy is None:
+        policy = retry_policy(pin)
+
+    def transaction():
+        temperature, humidite = _transaction(dht)
+        if temperature is None or humidite is None:
+            raise RuntimeError("Lecture incomplète")
+        return temperature, humidite
+
+    (temperature, humidite), tentatives = policy.run(transaction)
+    return Reading(temperature, humidite, time.time_ns(), tentatives)
+
+def start_sampler(pin=DHT_PIN, interval=INTERVALLE_MIN):
+    """
+    Lit le capteur en arrière-plan (idempotent).
+
+    Tant qu'il tourne, lire_temperature() et lire_humidite() rendent la
+    dernière mesure en quelques microsecondes au lieu de bloquer.
+
+    Args:
+        pin (str): Attribut de ``board`` (ex. ``"D4"``)
+        interval (float): Période d'échantillonnage. Au moins
+            ``INTERVALLE_MIN`` : à 2 s tout juste, un réveil un peu en
+            avance rendrait la trame précédente d'adafruit_dht
+
+    Returns:
+        Sampler: Échantillonneur (``latest()``, ``wait_fresh()``, ...)
+
+    Raises:
+        ValueError: Intervalle plus court que ``INTERVALLE_MIN``
+    """
+    global _echantillonneur, _broche_echantillonnee
+    if interval < INTERVALLE_MIN:
+        raise ValueError(f"L'intervalle doit être d'au moins {INTERVALLE_MIN} s")
+    if _echantillonneur is None:
+        # Importé ici : seuls les programmes qui échantillonnent le chargent
+        from echantillonneur import Sampler
+
+        open(pin)
+        _echantillonneur = Sampler(lambda: read(pin), interval).start()
+        _broche_echantillonnee = pin
+    return _echantillonneur
+
+def stop_sampler():
+    """Arrête l'échantillonneur (sans effet s'il ne tourne pas)."""
+    global _echantillonneur, _broche_echantillonnee
+    if _echantillonneur is not None:
+        _echantillonneur.stop()
+        _echantillonneur = _broche_echantillonnee = None
+
+def _mesure(fresh):
+    """
+    Mesure de l'échantillonneur s'il tourne, sinon lecture directe.
+
+    Une mesure plus vieille que ``AGE_MAX_PERIODES`` périodes n'est pas
+    rendue : on attend la suivante pendant une période au plus.
+
+    Raises:
+        RuntimeError: Aucune mesure récente
+    """
+    if _echantillonneur is None:
+        return read()
+    mesure, age = _echantillonneur.latest()
+    periode = _echantillonneur.interval_ns / 1e9
+    if mesure is None:
+        mesure = _echantillonneur.wait_fresh(ATTENTE_MAX)
+    elif fresh or age > AGE_MAX_PERIODES * periode:
+        mesure = _echantillonneur.wait_fresh(ATTENTE_MAX if fresh else periode)
+    if mesure is None:
+        raise RuntimeError(f"Aucune mesure récente "
+                           f"(dernière erreur: {_echantillonneur.last_error})")
+    return mesure
+
+def lire_temperature(fresh=False):
     """
     Lit la température en degrés Celsius.
 
+    Args:
+        fresh (bool): Avec l'échantillonneur, attendre la prochaine mesure
+            au lieu de rendre la dernière
+
     Returns:
         float: Température en °C, ou None si erreur
     """
-    # TODO : Créer l'objet capteur DHT22
-    # dht = DHT_SENSOR(DHT_PIN)
-
+    # TODO : Récupérer l'objet capteur DHT22
+    # Le capteur est réutilisé d'un appel à l'autre (voir open())
     try:
         # TODO : Lire et retourner la température
-        # return dht.temperature
-        pass
+        return _mesure(fresh).temperature
     except RuntimeError as e:
         print(f"Erreur de lecture: {e}")
         return None
 
-def lire_humidite():
+def lire_humidite(fresh=False):
     """
     Lit l'humidité relative en pourcentage.
 
+    Args:
+        fresh (bool): Voir lire_temperature()
+
     Returns:
         float: Humidité relative en %RH, ou None si erreur
     """
     # TODO : Lire et retourner l'humidité
-    pass
+    try:
+        return _mesure(fresh).humidity
+    except RuntimeError as e:
+        print(f"Erreur de lecture: {e}")
+        return None
+
+def afficher_mesures(historique=None, base=None):
+    """
+    Affiche les mesures de température et d'humidité.
+
+    Args:
+        historique (str): Si fourni, fichier où les mesures brutes sont
+            aussi enregistrées en binaire (voir historique.py)
+        base (str): Si fourni, base SQLite où elles sont aussi insérées
+            par lots (voir base_mesures.py)
+    """
+    # Importés ici, et seulement si utilisés : l'import de dht22 reste rapide
+    from filtres import HampelFilter
 
-def afficher_mesures():
-    """Affiche les mesures de température et d'humidité."""
     # Créer l'objet capteur
-    dht = DHT_SENSOR(DHT_PIN)
+    open()
+    journal = ecrivain = None
+    if historique is not None:
+        from historique import ReadingLog
+        journal = ReadingLog(historique)
+    if base is not None:
+        from base_mesures import SQLiteWriter
+        ecrivain = SQLiteWriter(base, sensor=DHT_PIN).start()
+
+    # Les pics isolés (checksum valide mais +10 °C) sont remplacés par la
+    # médiane des mesures précédentes
+    filtre_temperature = HampelFilter(min_deviation=0.5)
+    filtre_humidite = HampelFilter(min_deviation=2.0)
 
     print("Capteur DHT22 - Température et Humidité")
     print("Appuyez sur Ctrl+C pour quitter")
@@ -62,24 +296,33 @@ def afficher_mesures():
     while True:
         try:
             # TODO : Lire la température et l'humidité
-            temperature = dht.temperature
-            humidite = dht.humidity
-
-            # Vérifier que les valeurs sont valides
-            if temperature is not None and humidite is not None:
-                # Afficher les résultats
-                print(f"Température: {temperature:.1f} °C")
-                print(f"Humidité: {humidite:.1f} %RH")
-                print("-" * 40)
-            else:
-                print("Échec de la lecture. Réessai...")
+            # Une seule transaction : les deux valeurs vont ensemble
+            mesure = read()
+            try:
+                if journal is not None:
+                    journal.append_reading(mesure)
+                if ecrivain is not None:
+                    ecrivain.append(mesure)
+            except (OSError, ValueError) as e:
+                # Disque plein, base verrouillée... : la lecture continue
+                print(f"Erreur d'enregistrement: {e}")
+            temperature = filtre_temperature.update(mesure.temperature)
+            humidite = filtre_humidite.update(mesure.humidity)
+
+            # Afficher les résultats
+            print(f"Température: {temperature:.1f} °C")
+            print(f"Humidité: {humidite:.1f} %RH")
+            if filtre_temperature.last_outlier or filtre_humidite.last_outlier:
+                print(f"(pic rejeté: {mesure.temperature:.1f} °C, "
+                      f"{mesure.humidity:.1f} %RH)")
+            print("-" * 40)
 
             time.sleep(2)  # Le DHT22 nécessite au moins 2 secondes entre les lectures
 
         except RuntimeError as error:
-            # Les erreurs sont fréquentes avec le DHT22
+            # Les erreurs sont fréquentes avec le DHT22 : read() a déjà
+            # réessayé et attendra ce qu'il faut avant la prochaine lecture
             print(f"Erreur de lecture: {error.args[0]}")
-            time.sleep(2.0)
             continue
 
         except KeyboardInterrupt:
@@ -94,9 +337,25 @@ def afficher_mesures():
             print("  - Une résistance 10K relie DATA à VCC")
             break
 
+    stats = retry_policy().stats
+    if stats.reads:
+        print(f"Lectures valides: {stats.reads}, temps moyen jusqu'à une "
+              f"lecture valide: {stats.mean_ns / 1e9:.2f} s")
+    if journal is not None:
+        journal.close()
+    if ecrivain is not None:
+        ecrivain.stop()
+    close()
+
 def main():
     """Fonction principale."""
-    afficher_mesures()
+    parser = argparse.ArgumentParser(description="Lecture du capteur DHT22")
+    parser.add_argument("--historique", metavar="FICHIER",
+                        help="Enregistre aussi les mesures dans un historique binaire")
+    parser.add_argument("--base", metavar="FICHIER",
+                        help="Insère aussi les mesures dans une base SQLite")
+    args = parser.parse_args()
+    afficher_mesures(args.historique, args.base)
 
 if __name__ == "__main__":
     main()
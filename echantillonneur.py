@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Échantillonneur en arrière-plan : la dernière mesure, sans attendre.
+
+Une lecture du DHT22 bloque jusqu'à 2 s (cadence du capteur), plus les
+réessais. L'échantillonneur lit le capteur à cadence fixe, dans un fil
+(``start()``) ou dans une tâche asyncio (``start_task()``), et publie la
+dernière mesure valide. Les consommateurs la récupèrent en quelques
+microsecondes avec ``latest()``, qui donne aussi son âge, ou attendent la
+prochaine avec ``wait_fresh()`` (fil) / ``await next_reading()`` (asyncio).
+
+Exemple :
+
+    with Sampler(dht22.read) as echantillonneur:
+        mesure, age = echantillonneur.latest()
+
+asyncio n'est importé que par les méthodes asyncio : importer ce module
+reste rapide pour les scripts qui n'utilisent que le fil.
+"""
+
+import threading
+import time
+
+
+class Sampler:
+    """
+    Lit une source à cadence fixe et garde la dernière valeur valide.
+
+    Args:
+        read: Fonction de lecture bloquante (ex. ``dht22.read``) ; une
+            RuntimeError compte comme un échantillon manqué
+        interval (float): Période d'échantillonnage en secondes
+        clock_ns: Horloge monotone en ns (par défaut ``time.monotonic_ns``)
+        sleep: Attente du fil entre deux lectures, ``sleep(secondes)``
+            (par défaut, une attente que stop() interrompt)
+    """
+
+    def __init__(self, read, interval=2.0, clock_ns=None, sleep=None):
+        self.read = read
+        self.interval_ns = int(interval * 1e9)
+        self.clock_ns = clock_ns if clock_ns is not None else time.monotonic_ns
+        self.samples = 0
+        self.errors = 0
+        self.last_error = None
+        self._latest = None
+        self._latest_ns = None
+        self._cond = threading.Condition()
+        self._waiters = []
+        self._stop = threading.Event()
+        self._sleep = sleep if sleep is not None else self._stop.wait
+        self._thread = None
+        self._task = None
+
+    # -----------------------------------------------------------------------
+    # Accès à la dernière mesure
+    # -----------------------------------------------------------------------
+    def latest(self):
+        """
+        Dernière mesure valide, sans attendre.
+
+        Returns:
+            tuple: (mesure, âge en secondes), ou (None, None) si aucune
+        """
+        with self._cond:
+            mesure, instant = self._latest, self._latest_ns
+        if mesure is None:
+            return None, None
+        return mesure, (self.clock_ns() - instant) / 1e9
+
+    def wait_fresh(self, timeout=None):
+        """
+        Attend une mesure publiée après l'appel (fil appelant bloqué).
+
+        Returns:
+            La nouvelle mesure, ou None (délai écoulé ou échantillonneur arrêté)
+        """
+        with self._cond:
+            numero = self.samples
+            self._cond.wait_for(
+                lambda: self.samples != numero or self._stop.is_set(), timeout)
+            return self._latest if self.samples != numero else None
+
+    async def next_reading(self):
+        """Attend la prochaine mesure publiée (coroutine)."""
+        import asyncio
+
+        boucle = asyncio.get_running_loop()
+        futur = boucle.create_future()
+        with self._cond:
+            self._waiters.append((boucle, futur))
+        return await futur
+
+    def _publier(self, mesure):
+        with self._cond:
+            self._latest = mesure
+            self._latest_ns = self.clock_ns()
+            self.samples += 1
+            self._cond.notify_all()
+            attente, self._waiters = self._waiters, []
+        for boucle, futur in attente:
+            boucle.call_soon_threadsafe(_resoudre, futur, mesure)
+
+    def _echantillonner(self):
+        try:
+            mesure = self.read()
+        except RuntimeError as e:
+            self.errors += 1
+            self.last_error = e
+            return
+        self._publier(mesure)
+
+    def _prochaine(self, echeance):
+        # Échéances absolues ; une lecture trop longue saute les manquées
+        echeance += self.interval_ns
+        maintenant = self.clock_ns()
+        if echeance < maintenant:
+            echeance = maintenant + self.interval_ns
+        return echeance, (echeance - maintenant) / 1e9
+
+    # -----------------------------------------------------------------------
+    # Fil
+    # -----------------------------------------------------------------------
+    def start(self):
+        """Démarre l'échantillonnage dans un fil d'arrière-plan."""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="echantillonneur",
+                                        daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        echeance = self.clock_ns()
+        while not self._stop.is_set():
+            self._echantillonner()
+            echeance, attente = self._prochaine(echeance)
+            self._sleep(attente)
+
+    # -----------------------------------------------------------------------
+    # Tâche asyncio
+    # -----------------------------------------------------------------------
+    def start_task(self):
+        """
+        Démarre l'échantillonnage dans une tâche de la boucle courante.
+
+        La lecture bloquante passe par ``asyncio.to_thread`` : la boucle
+        n'est jamais bloquée.
+
+        Returns:
+            asyncio.Task
+        """
+        import asyncio
+
+        self._stop.clear()
+        self._task = asyncio.get_running_loop().create_task(
+            self._run_async(), name="echantillonneur")
+        return self._task
+
+    async def _run_async(self):
+        import asyncio
+
+        echeance = self.clock_ns()
+        while not self._stop.is_set():
+            await asyncio.to_thread(self._echantillonner)
+            echeance, attente = self._prochaine(echeance)
+            await asyncio.sleep(attente)
+
+    # -----------------------------------------------------------------------
+    def stop(self):
+        """Arrête l'échantillonnage et réveille les attentes en cours."""
+        self._stop.set()
+        with self._cond:
+            self._cond.notify_all()
+            attente, self._waiters = self._waiters, []
+        for boucle, futur in attente:
+            boucle.call_soon_threadsafe(_resoudre, futur, None)
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+
+def _resoudre(futur, valeur):
+    if not futur.done():
+        futur.set_result(valeur)
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Filtres en flux pour les mesures du DHT22 : médiane glissante, Hampel, EMA.
+
+Le DHT22 renvoie parfois un pic isolé (ex. +10 °C) dont le checksum est
+pourtant valide. Trois étages, chacun mis à jour échantillon par
+échantillon :
+
+- ``RollingMedian`` : médiane des ``w`` derniers échantillons. La fenêtre
+  triée est mise à jour par dichotomie (O(log w) comparaisons ; le
+  décalage de la liste est un memmove de ``w`` pointeurs).
+- ``HampelFilter`` : rejette un échantillon trop loin de la médiane des
+  ``w`` précédents (``k`` × 1,4826 × MAD) et le remplace par cette
+  médiane. La MAD est extraite de la fenêtre triée en O(log w), sans
+  trier les écarts.
+- ``ExponentialAverage`` : moyenne mobile exponentielle, O(1).
+
+Tous sont causaux (seuls les échantillons passés comptent). Les fonctions
+``*_bulk`` appliquent les mêmes définitions à tout un historique avec
+NumPy (ex. ``RingSeries.window()``), sans boucle Python par échantillon.
+
+Exemple :
+
+    filtre = FilterChain(HampelFilter(7), ExponentialAverage(0.3))
+    propre = filtre.update(mesure.temperature)
+"""
+
+import math
+from bisect import bisect_left, insort
+from collections import deque
+
+# NumPy n'est importé que par les fonctions *_bulk (voir _numpy)
+np = None
+
+# MAD → écart type pour une distribution normale
+_ECHELLE_MAD = 1.4826
+
+# Échantillons précédents nécessaires avant de juger un échantillon
+HAMPEL_MIN = 3
+
+
+def _median_triee(s):
+    n = len(s)
+    milieu = n // 2
+    if n % 2:
+        return s[milieu]
+    return (s[milieu - 1] + s[milieu]) / 2
+
+
+def _kieme_ecart(s, m, k):
+    """
+    k-ième (à partir de 0) plus petit écart |x - m| d'une liste triée.
+
+    Les écarts à gauche de ``m`` (lus de droite à gauche) et à droite
+    forment deux suites croissantes : sélection par dichotomie, O(log w).
+    """
+    p = bisect_left(s, m)
+    na, nb = p, len(s) - p
+
+    def a(i):       # i-ème écart à gauche
+        return m - s[p - 1 - i]
+
+    def b(j):       # j-ème écart à droite
+        return s[p + j] - m
+
+    # i écarts pris à gauche, k + 1 - i à droite
+    bas, haut = max(0, k + 1 - nb), min(k + 1, na)
+    while bas < haut:
+        i = (bas + haut) // 2
+        if a(i) < b(k - i):
+            bas = i + 1
+        else:
+            haut = i
+    i = bas
+    j = k + 1 - i
+    candidats = []
+    if i > 0:
+        candidats.append(a(i - 1))
+    if j > 0:
+        candidats.append(b(j - 1))
+    return max(candidats)
+
+
+def _mad_triee(s, m):
+    """Médiane des écarts absolus à ``m`` d'une liste triée."""
+    n = len(s)
+    if n % 2:
+        return _kieme_ecart(s, m, n // 2)
+    return (_kieme_ecart(s, m, n // 2 - 1) + _kieme_ecart(s, m, n // 2)) / 2
+
+
+class _FenetreTriee:
+    """Fenêtre glissante : ordre d'arrivée + copie triée."""
+
+    def __init__(self, window):
+        if window < 1:
+            raise ValueError("La fenêtre doit contenir au moins un échantillon")
+        self.window = window
+        self.arrivee = deque()
+        self.triee = []
+
+    def push(self, x):
+        if len(self.arrivee) == self.window:
+            ancien = self.arrivee.popleft()
+            del self.triee[bisect_left(self.triee, ancien)]
+        self.arrivee.append(x)
+        insort(self.triee, x)
+
+
+class RollingMedian:
+    """
+    Médiane des ``window`` derniers échantillons (courant inclus).
+
+    Args:
+        window (int): Taille de la fenêtre (impaire de préférence)
+    """
+
+    def __init__(self, window=5):
+        self._fenetre = _FenetreTriee(window)
+
+    def update(self, x):
+        """Ajoute un échantillon et retourne la médiane courante."""
+        self._fenetre.push(x)
+        return _median_triee(self._fenetre.triee)
+
+
+def _verifier_fenetre_hampel(window):
+    # Plus petite, la fenêtre ne permettrait jamais de juger un échantillon
+    if window < HAMPEL_MIN:
+        raise ValueError(f"La fenêtre de Hampel doit contenir au moins "
+                         f"{HAMPEL_MIN} échantillons")
+
+
+class HampelFilter:
+    """
+    Rejet des pics : remplace un échantillon aberrant par la médiane.
+
+    Un échantillon est aberrant si son écart à la médiane des ``window``
+    échantillons bruts précédents dépasse ``max(k × 1,4826 × MAD,
+    min_deviation)``. Le plancher évite de rejeter un pas de 0,1 °C quand
+    les mesures précédentes sont toutes identiques (MAD nulle).
+
+    Args:
+        window (int): Échantillons précédents considérés (au moins
+            ``HAMPEL_MIN``)
+        k (float): Seuil en écarts types estimés
+        min_deviation (float): Écart toujours accepté (unités de la mesure)
+
+    Attributes:
+        rejected (int): Échantillons remplacés depuis la création
+        last_outlier (bool): Le dernier échantillon a été remplacé
+
+    Raises:
+        ValueError: ``window`` inférieure à ``HAMPEL_MIN``
+    """
+
+    def __init__(self, window=7, k=3.0, min_deviation=0.5):
+        _verifier_fenetre_hampel(window)
+        self._fenetre = _FenetreTriee(window)
+        self.k = k
+        self.min_deviation = min_deviation
+        self.rejected = 0
+        self.last_outlier = False
+
+    def update(self, x):
+        """Ajoute un échantillon brut et retourne la valeur filtrée."""
+        s = self._fenetre.triee
+        sortie = x
+        self.last_outlier = False
+        if len(s) >= HAMPEL_MIN:
+            m = _median_triee(s)
+            seuil = max(self.k * _ECHELLE_MAD * _mad_triee(s, m), self.min_deviation)
+            if abs(x - m) > seuil:
+                sortie = m
+                self.last_outlier = True
+                self.rejected += 1
+        # La fenêtre garde les valeurs brutes : un vrai changement finit
+        # par déplacer la médiane
+        self._fenetre.push(x)
+        return sortie
+
+
+class ExponentialAverage:
+    """
+    Moyenne mobile exponentielle : ``y += alpha × (x - y)``.
+
+    Args:
+        alpha (float): Poids du nouvel échantillon, entre 0 (exclu) et 1
+    """
+
+    def __init__(self, alpha=0.3):
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha doit être dans ]0, 1]")
+        self.alpha = alpha
+        self.value = None
+
+    def update(self, x):
+        """Ajoute un échantillon et retourne la moyenne."""
+        if self.value is None:
+            self.value = float(x)
+        else:
+            self.value += self.alpha * (x - self.value)
+        return self.value
+
+
+class FilterChain:
+    """Enchaîne des filtres : la sortie de l'un est l'entrée du suivant."""
+
+    def __init__(self, *filters):
+        self.filters = list(filters)
+
+    def update(self, x):
+        """Fait passer un échantillon par tous les filtres."""
+        for filtre in self.filters:
+            x = filtre.update(x)
+        return x
+
+
+# ---------------------------------------------------------------------------
+# Historique complet avec NumPy (mêmes définitions que les filtres en flux)
+# ---------------------------------------------------------------------------
+def _numpy():
+    """Module NumPy, importé au premier appel."""
+    global np
+    if np is None:
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("Les filtres en bloc nécessitent NumPy") from None
+    return np
+
+
+def rolling_median_bulk(x, window=5):
+    """
+    ``RollingMedian(window).update`` appliqué à tout ``x``.
+
+    Returns:
+        numpy.ndarray: Médianes (float64), même longueur que ``x``
+    """
+    np = _numpy()
+    x = np.asarray(x, dtype=np.float64)
+    sortie = np.empty_like(x)
+    debut = min(window - 1, len(x))
+    for i in range(debut):
+        sortie[i] = np.median(x[:i + 1])
+    if len(x) >= window:
+        vues = np.lib.stride_tricks.sliding_window_view(x, window)
+        sortie[window - 1:] = np.median(vues, axis=1)
+    return sortie
+
+
+def hampel_bulk(x, window=7, k=3.0, min_deviation=0.5):
+    """
+    ``HampelFilter(window, k, min_deviation).update`` appliqué à tout ``x``.
+
+    Returns:
+        tuple: (valeurs filtrées, masque booléen des échantillons remplacés)
+
+    Raises:
+        ValueError: ``window`` inférieure à ``HAMPEL_MIN``
+    """
+    _verifier_fenetre_hampel(window)
+    np = _numpy()
+    x = np.asarray(x, dtype=np.float64)
+    n = len(x)
+    medianes = np.full(n, np.nan)
+    seuils = np.full(n, np.inf)
+    # Début : fenêtre incomplète (HAMPEL_MIN à window - 1 échantillons)
+    for i in range(HAMPEL_MIN, min(window, n)):
+        precedents = x[:i]
+        m = np.median(precedents)
+        medianes[i] = m
+        seuils[i] = np.median(np.abs(precedents - m))
+    if n > window:
+        vues = np.lib.stride_tricks.sliding_window_view(x[:-1], window)
+        m = np.median(vues, axis=1)
+        medianes[window:] = m
+        seuils[window:] = np.median(np.abs(vues - m[:, None]), axis=1)
+    juges = np.isfinite(seuils)
+    seuils[juges] = np.maximum(k * _ECHELLE_MAD * seuils[juges], min_deviation)
+    aberrants = juges & (np.abs(x - np.where(juges, medianes, x)) > seuils)
+    return np.where(aberrants, medianes, x), aberrants
+
+
+def ema_bulk(x, alpha=0.3):
+    """
+    ``ExponentialAverage(alpha).update`` appliqué à tout ``x``.
+
+    La récurrence est résolue par blocs avec des sommes cumulées ; la
+    taille des blocs borne ``(1 - alpha) ** -taille`` pour rester précis.
+
+    Returns:
+        numpy.ndarray: Moyennes (float64), même longueur que ``x``
+    """
+    np = _numpy()
+    if not 0 < alpha <= 1:
+        raise ValueError("alpha doit être dans ]0, 1]")
+    x = np.asarray(x, dtype=np.float64)
+    if alpha == 1 or not len(x):
+        return x.copy()
+    c = 1 - alpha
+    taille = max(1, int(10 / -math.log10(c)))
+    puissances = c ** np.arange(1, taille + 1)
+    sortie = np.empty_like(x)
+    sortie[0] = y = x[0]
+    for debut in range(1, len(x), taille):
+        bloc = x[debut:debut + taille]
+        p = puissances[:len(bloc)]
+        valeurs = p * (y + alpha * np.cumsum(bloc / p))
+        sortie[debut:debut + len(bloc)] = valeurs
+        y = valeurs[-1]
+    return sortie
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Banque de broches GPIO écrite en une seule opération (masque de bits).
+
+Une « trame » est un entier dont le bit i correspond à la broche ``pins[i]``.
+Avec les LEDs du projet (``LEDS = [LED_ROUGE, LED_VERTE, LED_JAUNE]``) :
+
+- 0b001 → rouge allumée
+- 0b010 → verte allumée
+- 0b111 → toutes allumées
+
+Pilotes disponibles :
+
+- ``RegisterDriver`` : écrit directement les registres GPSET0/GPCLR0 du
+  BCM283x via ``/dev/gpiomem``. Toutes les broches changent au même instant.
+- ``ChardevDriver`` (gpio_chardev.py) : une requête de lignes
+  ``/dev/gpiochipN`` gardée ouverte, un ioctl par trame.
+- ``ShiftRegisterDriver`` (registre_decalage.py) : chaîne de 74HC595,
+  un transfert SPI par trame, pour des centaines de sorties.
+- ``DaemonDriver`` (client_leds.py) : les trames passent par le démon
+  qui possède les broches (demon_leds.py), une commande par trame.
+- ``RPiGPIODriver`` : repli sur RPi.GPIO, avec un seul appel
+  ``GPIO.output(liste, valeurs)`` par trame au lieu d'un appel par broche.
+
+Le pilote est choisi par ``default_driver`` ; la variable d'environnement
+``GPIO_BACKEND`` (une clé de ``DRIVERS``) permet d'en imposer un.
+
+Sauf avec ``ChardevDriver``, qui configure ses lignes lui-même, et
+``DaemonDriver``, dont le démon s'en charge, les broches doivent déjà être
+configurées en sortie (``GPIO.setup``). Les scripts de LEDs testent
+``uses_daemon()`` pour sauter cette configuration.
+"""
+
+import mmap
+import os
+
+GPIOMEM = "/dev/gpiomem"
+
+# Index (en mots de 32 bits) des registres du bloc GPIO BCM283x
+_GPSET0 = 0x1C // 4
+_GPCLR0 = 0x28 // 4
+
+# Au-delà, la table de traduction trame → masque matériel devient trop grosse
+_TAILLE_MAX_TABLE = 10
+
+
+def _soc_compatible():
+    """Indique si le SoC expose le bloc GPIO BCM283x via /dev/gpiomem."""
+    try:
+        with open("/proc/device-tree/compatible", "rb") as f:
+            compatible = f.read()
+    except OSError:
+        return False
+    # Le Pi 5 (bcm2712) passe par le RP1 : registres différents
+    return b"brcm,bcm2" in compatible and b"bcm2712" not in compatible
+
+
+class RegisterDriver:
+    """Pilote par accès direct aux registres GPSET0/GPCLR0."""
+
+    def __init__(self, pins, path=GPIOMEM):
+        if any(pin >= 32 for pin in pins):
+            raise ValueError("Seules les broches BCM 0 à 31 sont supportées")
+        self.pins = tuple(pins)
+        self._fd = os.open(path, os.O_RDWR | os.O_SYNC)
+        self._mmap = mmap.mmap(self._fd, 4096, mmap.MAP_SHARED,
+                               mmap.PROT_READ | mmap.PROT_WRITE)
+        # Accès par mots de 32 bits : une écriture = un registre
+        self._regs = memoryview(self._mmap).cast("I")
+        self._hw = _table_materielle(self.pins)
+
+    def apply(self, set_mask, clear_mask):
+        """Met à 1 les bits de ``set_mask`` et à 0 ceux de ``clear_mask``."""
+        if set_mask:
+            self._regs[_GPSET0] = self._hw(set_mask)
+        if clear_mask:
+            self._regs[_GPCLR0] = self._hw(clear_mask)
+
+    def close(self):
+        """Libère le mappage mémoire."""
+        if self._regs is not None:
+            self._regs.release()
+            self._regs = None
+            self._mmap.close()
+            os.close(self._fd)
+
+
+class RPiGPIODriver:
+    """Pilote de repli : un seul appel ``GPIO.output`` par trame."""
+
+    def __init__(self, pins, gpio=None):
+        if gpio is None:
+            import RPi.GPIO as gpio
+        self.pins = tuple(pins)
+        self._gpio = gpio
+        n = len(self.pins)
+        self._tous = (1 << n) - 1
+        # Valeurs précalculées pour chaque trame complète
+        if n <= _TAILLE_MAX_TABLE:
+            self._valeurs = [
+                tuple((trame >> i) & 1 for i in range(n))
+                for trame in range(1 << n)
+            ]
+        else:
+            self._valeurs = None
+
+    def apply(self, set_mask, clear_mask):
+        """Met à 1 les bits de ``set_mask`` et à 0 ceux de ``clear_mask``."""
+        if (set_mask | clear_mask) == self._tous and self._valeurs is not None:
+            self._gpio.output(self.pins, self._valeurs[set_mask])
+            return
+        canaux = []
+        valeurs = []
+        for i, pin in enumerate(self.pins):
+            bit = 1 << i
+            if set_mask & bit:
+                canaux.append(pin)
+                valeurs.append(1)
+            elif clear_mask & bit:
+                canaux.append(pin)
+                valeurs.append(0)
+        if canaux:
+            self._gpio.output(canaux, valeurs)
+
+    def close(self):
+        """Rien à libérer : ``GPIO.cleanup()`` reste à la charge du script."""
+
+
+def _table_materielle(pins):
+    """
+    Retourne une fonction qui traduit une trame logique en masque BCM.
+
+    Args:
+        pins (tuple): Broches BCM, dans l'ordre des bits de la trame
+
+    Returns:
+        callable: trame → masque de bits des registres GPIO
+    """
+    def traduire(trame):
+        masque = 0
+        for i, pin in enumerate(pins):
+            if trame & (1 << i):
+                masque |= 1 << pin
+        return masque
+
+    if len(pins) > _TAILLE_MAX_TABLE:
+        return traduire
+    return [traduire(trame) for trame in range(1 << len(pins))].__getitem__
+
+
+# Les pilotes des autres modules ne sont importés qu'à leur création :
+# importer ce module ne charge ni socket, ni fcntl, ni spidev
+def _chardev(pins):
+    from gpio_chardev import ChardevDriver
+    return ChardevDriver(pins)
+
+
+def _spi595(pins):
+    from registre_decalage import ShiftRegisterDriver
+    return ShiftRegisterDriver(pins)
+
+
+def _demon(pins):
+    from client_leds import DaemonDriver
+    return DaemonDriver(pins)
+
+
+# Pilotes sélectionnables par nom (variable d'environnement GPIO_BACKEND)
+DRIVERS = {
+    "registre": RegisterDriver,
+    "chardev": _chardev,
+    "rpi": RPiGPIODriver,
+    "spi595": _spi595,
+    "demon": _demon,
+}
+
+
+def uses_daemon():
+    """
+    Indique si les trames passent par le démon (``GPIO_BACKEND=demon``).
+
+    Le démon configure et libère lui-même les broches : les scripts ne
+    doivent alors ni importer RPi.GPIO, ni appeler ``setup``/``cleanup``.
+    """
+    return os.environ.get("GPIO_BACKEND") == "demon"
+
+
+def default_driver(pins):
+    """
+    Choisit le pilote le plus rapide disponible.
+
+    Args:
+        pins (sequence): Broches BCM de la banque
+
+    Returns:
+        Le pilote imposé par ``GPIO_BACKEND`` s'il est défini, sinon
+        RegisterDriver si /dev/gpiomem est utilisable, sinon ChardevDriver
+        si une puce /dev/gpiochipN accepte la requête, sinon RPiGPIODriver
+
+    Raises:
+        ValueError: ``GPIO_BACKEND`` ne correspond à aucun pilote
+    """
+    nom = os.environ.get("GPIO_BACKEND")
+    if nom:
+        if nom not in DRIVERS:
+            raise ValueError(f"GPIO_BACKEND inconnu: {nom!r} "
+                             f"(choix: {', '.join(sorted(DRIVERS))})")
+        return DRIVERS[nom](pins)
+    if os.path.exists(GPIOMEM) and _soc_compatible() and max(pins) < 32:
+        try:
+            return RegisterDriver(pins)
+        except OSError:
+            pass
+    import glob
+
+    if glob.glob("/dev/gpiochip*"):
+        try:
+            return _chardev(pins)
+        except OSError:
+            # Lignes déjà prises (ex. par rpi-lgpio) : on passe par RPi.GPIO
+            pass
+    return RPiGPIODriver(pins)
+
+
+class PinBank:
+    """
+    Groupe de broches piloté par trames (masques de bits).
+
+    La banque garde la dernière trame écrite et n'envoie au pilote que les
+    bits qui ont changé ; une trame identique ne coûte aucun appel. Les
+    compteurs ``writes_issued`` / ``writes_suppressed`` (par broche) et
+    ``frames_issued`` / ``frames_suppressed`` (par appel au pilote)
+    mesurent l'économie réalisée.
+
+    Avec un pilote partagé (``driver.shared``, ex. ``DaemonDriver``),
+    d'autres processus écrivent les mêmes broches : l'état réel reste
+    inconnu et chaque bit adressé est envoyé.
+
+    Args:
+        pins (sequence): Broches BCM, ex. ``LEDS``
+        driver: Pilote à utiliser (par défaut : ``default_driver(pins)``)
+        log (EventLog): Journal où noter chaque trame écrite (journal.py)
+    """
+
+    def __init__(self, pins, driver=None, log=None):
+        self.pins = tuple(pins)
+        if not self.pins:
+            raise ValueError("Une banque doit contenir au moins une broche")
+        self.all_mask = (1 << len(self.pins)) - 1
+        self.driver = driver if driver is not None else default_driver(self.pins)
+        self.log = log
+        self.frame = 0
+        self._partage = getattr(self.driver, "shared", False)
+        # Bits dont l'état réel est inconnu : réécrits au prochain passage
+        self._unknown = self.all_mask
+        self.writes_issued = 0
+        self.writes_suppressed = 0
+        self.frames_issued = 0
+        self.frames_suppressed = 0
+
+    def mask(self, *pins):
+        """
+        Retourne le masque logique correspondant à des broches BCM.
+
+        Exemple : ``banque.mask(LED_ROUGE, LED_JAUNE)`` → 0b101
+        """
+        masque = 0
+        for pin in pins:
+            masque |= 1 << self.pins.index(pin)
+        return masque
+
+    def write(self, frame):
+        """Applique une trame complète : chaque broche prend la valeur de son bit."""
+        self._commit(frame & self.all_mask, self.all_mask)
+
+    def set(self, mask):
+        """Met à HIGH les broches du masque, sans toucher aux autres."""
+        mask &= self.all_mask
+        self._commit(self.frame | mask, mask)
+
+    def clear(self, mask):
+        """Met à LOW les broches du masque, sans toucher aux autres."""
+        mask &= self.all_mask
+        self._commit(self.frame & ~mask, mask)
+
+    def invalidate(self, mask=None):
+        """
+        Oublie l'état des broches du masque (toutes par défaut).
+
+        À appeler quand autre chose que la banque a modifié les broches
+        (PWM, ``GPIO.output`` direct) : elles seront réécrites au prochain
+        passage même si la trame n'a pas changé.
+        """
+        self._unknown |= self.all_mask if mask is None else mask & self.all_mask
+
+    def counters(self):
+        """Retourne les compteurs d'écritures envoyées et évitées."""
+        return {
+            "writes_issued": self.writes_issued,
+            "writes_suppressed": self.writes_suppressed,
+            "frames_issued": self.frames_issued,
+            "frames_suppressed": self.frames_suppressed,
+        }
+
+    def _commit(self, frame, addressed):
+        change = ((frame ^ self.frame) | self._unknown) & addressed
+        touchees = bin(addressed).count("1")
+        if not change:
+            self.frames_suppressed += 1
+            self.writes_suppressed += touchees
+            return
+        self.driver.apply(frame & change, ~frame & change)
+        ecrites = bin(change).count("1")
+        self.frames_issued += 1
+        self.writes_issued += ecrites
+        self.writes_suppressed += touchees - ecrites
+        if not self._partage:
+            self._unknown &= ~addressed
+        self.frame = frame
+        if self.log is not None:
+            self.log.record(frame)
+
+    def close(self):
+        """Libère le pilote."""
+        self.driver.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Pilote GPIO par périphérique caractère (``/dev/gpiochipN``, uAPI v2).
+
+C'est l'interface que libgpiod utilise sous le capot. Le pilote garde une
+seule requête multi-lignes ouverte pour toutes les broches de la banque
+(ex. LED_ROUGE, LED_VERTE, LED_JAUNE) : la ligne i de la requête correspond
+au bit i de la trame, donc une trame s'écrit en un seul ioctl
+``GPIO_V2_LINE_SET_VALUES`` (``bits`` = valeurs, ``mask`` = lignes touchées).
+
+Les appels passent directement par ``fcntl.ioctl`` : aucune dépendance à
+installer, et RPi.GPIO (déprécié sur les noyaux récents et absent du Pi 5)
+n'est plus nécessaire.
+
+Tests : le module noyau ``gpio-sim`` fournit un /dev/gpiochipN virtuel ;
+sinon, la fonction ``ioctl`` peut être remplacée par un substitut local.
+"""
+
+import fcntl
+import glob
+import os
+import struct
+
+# ---------------------------------------------------------------------------
+# Constantes de <linux/gpio.h>
+# ---------------------------------------------------------------------------
+GPIO_MAX_LINES = 64
+_CONSUMER_SIZE = 32
+_MAX_ATTRS = 10
+
+GPIO_V2_LINE_FLAG_OUTPUT = 1 << 3
+GPIO_V2_LINE_ATTR_ID_OUTPUT_VALUES = 2
+
+# struct gpiochip_info { char name[32]; char label[32]; __u32 lines; }
+_CHIP_INFO = struct.Struct("<32s32sI")
+
+# struct gpio_v2_line_request {
+#     __u32 offsets[64]; char consumer[32];
+#     struct gpio_v2_line_config {
+#         __u64 flags; __u32 num_attrs; __u32 padding[5];
+#         struct gpio_v2_line_config_attribute {
+#             struct gpio_v2_line_attribute { __u32 id; __u32 padding; __u64 values; };
+#             __u64 mask;
+#         } attrs[10];
+#     } config;
+#     __u32 num_lines; __u32 event_buffer_size; __u32 padding[5]; __s32 fd;
+# }
+_LINE_REQUEST = struct.Struct(
+    f"<{GPIO_MAX_LINES}I{_CONSUMER_SIZE}s"
+    f"QI20x{'IIQQ' * _MAX_ATTRS}"
+    "II20xi"
+)
+_FD_OFFSET = _LINE_REQUEST.size - 4
+
+# struct gpio_v2_line_values { __u64 bits; __u64 mask; }
+_LINE_VALUES = struct.Struct("<QQ")
+
+
+def _iowr(nr, size):
+    return (3 << 30) | (size << 16) | (0xB4 << 8) | nr
+
+
+def _ior(nr, size):
+    return (2 << 30) | (size << 16) | (0xB4 << 8) | nr
+
+
+GPIO_GET_CHIPINFO_IOCTL = _ior(0x01, _CHIP_INFO.size)
+GPIO_V2_GET_LINE_IOCTL = _iowr(0x07, _LINE_REQUEST.size)
+GPIO_V2_LINE_SET_VALUES_IOCTL = _iowr(0x0F, _LINE_VALUES.size)
+GPIO_V2_LINE_GET_VALUES_IOCTL = _iowr(0x0E, _LINE_VALUES.size)
+
+# Étiquettes des contrôleurs qui portent le connecteur 40 broches
+_LABELS_PI = ("pinctrl-bcm2711", "pinctrl-bcm2835", "pinctrl-rp1")
+
+
+def chip_label(path, ioctl=fcntl.ioctl):
+    """Retourne l'étiquette d'un /dev/gpiochipN (ex. ``pinctrl-bcm2711``)."""
+    fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+    try:
+        tampon = bytearray(_CHIP_INFO.size)
+        ioctl(fd, GPIO_GET_CHIPINFO_IOCTL, tampon)
+    finally:
+        os.close(fd)
+    _, label, _ = _CHIP_INFO.unpack(tampon)
+    return label.rstrip(b"\0").decode()
+
+
+def find_chip():
+    """
+    Trouve le /dev/gpiochipN du connecteur GPIO du Raspberry Pi.
+
+    Returns:
+        str: Chemin du périphérique, ou None si aucune puce ne porte
+        l'étiquette d'un contrôleur du Pi (on ne prend pas la première
+        venue : ce pourrait être un expandeur I²C)
+    """
+    for puce in sorted(glob.glob("/dev/gpiochip*")):
+        try:
+            if chip_label(puce) in _LABELS_PI:
+                return puce
+        except OSError:
+            continue
+    return None
+
+
+class ChardevDriver:
+    """
+    Pilote ``PinBank`` par requête de lignes GPIO v2.
+
+    Args:
+        pins (sequence): Numéros de lignes (= numéros BCM sur le Pi)
+        chip (str): Périphérique ``/dev/gpiochipN`` (par défaut : détecté)
+        consumer (str): Nom affiché par ``gpioinfo`` pour les lignes prises
+        ioctl: Fonction ioctl (remplaçable pour les tests)
+
+    Raises:
+        OSError: Puce absente ou lignes déjà utilisées (EBUSY)
+    """
+
+    def __init__(self, pins, chip=None, consumer="formatif-leds", ioctl=fcntl.ioctl):
+        self.pins = tuple(pins)
+        if not 0 < len(self.pins) <= GPIO_MAX_LINES:
+            raise ValueError(f"Entre 1 et {GPIO_MAX_LINES} lignes par requête")
+        self.chip = chip if chip is not None else find_chip()
+        if self.chip is None:
+            raise FileNotFoundError("Aucun /dev/gpiochipN du connecteur du Pi")
+        self._ioctl = ioctl
+
+        offsets = list(self.pins) + [0] * (GPIO_MAX_LINES - len(self.pins))
+        # Un attribut : toutes les lignes démarrent à 0
+        attrs = [GPIO_V2_LINE_ATTR_ID_OUTPUT_VALUES, 0, 0,
+                 (1 << len(self.pins)) - 1]
+        attrs += [0, 0, 0, 0] * (_MAX_ATTRS - 1)
+        requete = bytearray(_LINE_REQUEST.pack(
+            *offsets, consumer.encode()[:_CONSUMER_SIZE - 1],
+            GPIO_V2_LINE_FLAG_OUTPUT, 1, *attrs,
+            len(self.pins), 0, -1,
+        ))
+
+        fd_puce = os.open(self.chip, os.O_RDWR | os.O_CLOEXEC)
+        try:
+            ioctl(fd_puce, GPIO_V2_GET_LINE_IOCTL, requete)
+        finally:
+            # La requête garde son propre fd, celui de la puce n'est plus utile
+            os.close(fd_puce)
+        (self._fd,) = struct.unpack_from("<i", requete, _FD_OFFSET)
+        self._valeurs = bytearray(_LINE_VALUES.size)
+
+    def apply(self, set_mask, clear_mask):
+        """Met à 1 les bits de ``set_mask`` et à 0 ceux de ``clear_mask`` (1 ioctl)."""
+        _LINE_VALUES.pack_into(self._valeurs, 0, set_mask, set_mask | clear_mask)
+        self._ioctl(self._fd, GPIO_V2_LINE_SET_VALUES_IOCTL, self._valeurs)
+
+    def read(self):
+        """Relit l'état des lignes sous forme de trame."""
+        tampon = bytearray(_LINE_VALUES.pack(0, (1 << len(self.pins)) - 1))
+        self._ioctl(self._fd, GPIO_V2_LINE_GET_VALUES_IOCTL, tampon)
+        return _LINE_VALUES.unpack(tampon)[0]
+
+    def close(self):
+        """Libère les lignes (elles redeviennent disponibles)."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Historique des mesures sur disque : enregistrements binaires en ajout seul.
+
+Écrire « Température: 21.5 °C » sur stdout puis le reparser coûte cher
+dans les deux sens. Ici, chaque mesure est un enregistrement fixe de
+16 octets (mêmes types que ``serie.RingSeries``) :
+
+    instant      q   int64, ns (``Reading.timestamp``)
+    température  f   float32
+    humidité     f   float32
+
+après un en-tête de 16 octets (magic ``b"DHTLOG01"`` et taille d'un
+enregistrement). Les enregistrements sont donc alignés sur 16 octets.
+
+L'écriture est groupée : les mesures s'accumulent en mémoire et sont
+écrites d'un seul ``write`` suivi d'un ``fsync`` toutes les ``sync_every``
+mesures ou ``sync_interval`` secondes. Une coupure de courant perd au plus
+ce lot ; un enregistrement incomplet en fin de fichier est ignoré à la
+relecture et tronqué à la réouverture.
+
+La relecture projette le fichier en mémoire (``numpy.memmap``) : un
+tableau structuré sans copie ni analyse, quelle que soit la taille. Un
+mois à une mesure toutes les 2 s (1,3 million d'enregistrements, 21 Mo)
+est disponible en quelques millisecondes.
+
+Exemple :
+
+    with ReadingLog("mesures.log") as historique:
+        historique.append_reading(dht22.read())
+
+    mesures = replay("mesures.log")
+    mesures["temperature"].mean()
+"""
+
+import mmap
+import os
+import struct
+import time
+
+LOG_MAGIC = b"DHTLOG01"
+LOG_HEADER = struct.Struct("<8sQ")   # magic, taille d'un enregistrement
+LOG_RECORD = struct.Struct("<qff")   # instant (ns), température, humidité
+
+# NumPy et le type des enregistrements, chargés à la première relecture
+# projetée : l'écriture (dht22 --historique) n'en a pas besoin
+np = None
+DTYPE = None
+
+
+def _numpy():
+    """Importe NumPy au premier appel et construit ``DTYPE``."""
+    global np, DTYPE
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("La relecture projetée nécessite NumPy "
+                              "(voir iter_records)") from None
+        DTYPE = numpy.dtype([("timestamp", "<i8"), ("temperature", "<f4"),
+                             ("humidity", "<f4")])
+        assert DTYPE.itemsize == LOG_RECORD.size
+        np = numpy
+    return np
+
+
+def _verifier_entete(entete, path):
+    if len(entete) < LOG_HEADER.size:
+        raise ValueError(f"{path} n'est pas un historique de mesures")
+    magic, taille = LOG_HEADER.unpack_from(entete)
+    if magic != LOG_MAGIC or taille != LOG_RECORD.size:
+        raise ValueError(f"{path} n'est pas un historique de mesures")
+
+
+def _nombre(taille_fichier):
+    """Enregistrements complets dans un fichier de ``taille_fichier`` octets."""
+    return max(0, taille_fichier - LOG_HEADER.size) // LOG_RECORD.size
+
+
+class ReadingLog:
+    """
+    Écrivain d'historique, en ajout seul, avec ``fsync`` groupés.
+
+    Un seul écrivain par fichier. Les instants sont ceux de l'horloge
+    murale (``time.time_ns``) : ils peuvent reculer (NTP, heure réglée à la
+    main). Une telle mesure est gardée telle quelle et comptée dans
+    ``out_of_order`` ; ``between()`` accepte les historiques non triés.
+
+    Args:
+        path (str): Fichier d'historique (créé s'il n'existe pas)
+        sync_every (int): Mesures au plus par lot écrit et synchronisé
+        sync_interval (float): Âge maximal d'un lot avant écriture (s)
+        clock_ns: Horloge monotone en ns (par défaut ``time.monotonic_ns``)
+
+    Raises:
+        ValueError: Le fichier existe mais n'est pas un historique
+    """
+
+    def __init__(self, path, sync_every=64, sync_interval=10.0, clock_ns=None):
+        if sync_every < 1:
+            raise ValueError("Un lot contient au moins une mesure")
+        self.path = path
+        self.sync_every = sync_every
+        self.sync_interval_ns = int(sync_interval * 1e9)
+        self.clock_ns = clock_ns if clock_ns is not None else time.monotonic_ns
+        self.syncs = 0
+        self.out_of_order = 0
+        self._dernier = None
+        self._f = self._ouvrir(path)
+        self._lot = bytearray(LOG_RECORD.size * sync_every)
+        self._en_attente = 0
+        self._debut_lot_ns = None
+
+    def _ouvrir(self, path):
+        f = open(path, "a+b")
+        try:
+            taille = f.seek(0, os.SEEK_END)
+            if not taille:
+                f.write(LOG_HEADER.pack(LOG_MAGIC, LOG_RECORD.size))
+                f.flush()
+                os.fsync(f.fileno())
+                return f
+            f.seek(0)
+            _verifier_entete(f.read(LOG_HEADER.size), path)
+            n = _nombre(taille)
+            fin = LOG_HEADER.size + n * LOG_RECORD.size
+            if fin != taille:
+                # Dernier enregistrement coupé (arrêt pendant l'écriture)
+                f.truncate(fin)
+            if n:
+                f.seek(fin - LOG_RECORD.size)
+                self._dernier = LOG_RECORD.unpack(f.read(LOG_RECORD.size))[0]
+            return f
+        except BaseException:
+            f.close()
+            raise
+
+    def __len__(self):
+        """Mesures écrites, lot en attente compris."""
+        return _nombre(os.fstat(self._f.fileno()).st_size) + self._en_attente
+
+    @property
+    def pending(self):
+        """Mesures pas encore écrites sur disque."""
+        return self._en_attente
+
+    def append(self, timestamp, temperature, humidity):
+        """
+        Ajoute une mesure au lot ; le lot est écrit s'il est plein ou trop vieux.
+
+        Un instant antérieur à la mesure précédente est accepté (horloge
+        murale reculée) et compté dans ``out_of_order``.
+        """
+        if self._dernier is not None and timestamp < self._dernier:
+            self.out_of_order += 1
+        LOG_RECORD.pack_into(self._lot, self._en_attente * LOG_RECORD.size,
+                             timestamp, temperature, humidity)
+        self._dernier = timestamp
+        self._en_attente += 1
+        maintenant = self.clock_ns()
+        if self._debut_lot_ns is None:
+            self._debut_lot_ns = maintenant
+        if (self._en_attente == self.sync_every
+                or maintenant - self._debut_lot_ns >= self.sync_interval_ns):
+            self.sync()
+
+    def append_reading(self, reading):
+        """Ajoute une ``dht22.Reading``."""
+        self.append(reading.timestamp, reading.temperature, reading.humidity)
+
+    def sync(self):
+        """Écrit le lot en attente et attend qu'il soit sur disque."""
+        if not self._en_attente:
+            return
+        self._f.write(memoryview(self._lot)[:self._en_attente * LOG_RECORD.size])
+        self._f.flush()
+        os.fsync(self._f.fileno())
+        self.syncs += 1
+        self._en_attente = 0
+        self._debut_lot_ns = None
+
+    def close(self):
+        """Écrit le dernier lot et ferme le fichier."""
+        if self._f is None:
+            return
+        try:
+            self.sync()
+        finally:
+            self._f.close()
+            self._f = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def replay(path):
+    """
+    Projette un historique en mémoire, sans copie.
+
+    Args:
+        path (str): Fichier d'historique
+
+    Returns:
+        numpy.ndarray: Tableau structuré en lecture seule (champs
+        ``timestamp``, ``temperature``, ``humidity``), enregistrements
+        complets seulement
+
+    Raises:
+        ImportError: NumPy absent (voir ``iter_records``)
+        ValueError: Le fichier n'est pas un historique
+    """
+    np = _numpy()
+    with open(path, "rb") as f:
+        _verifier_entete(f.read(LOG_HEADER.size), path)
+        n = _nombre(os.fstat(f.fileno()).st_size)
+    if not n:
+        # mmap refuse une projection de longueur nulle
+        return np.empty(0, DTYPE)
+    return np.memmap(path, dtype=DTYPE, mode="r", offset=LOG_HEADER.size, shape=(n,))
+
+
+def between(records, start_ns=None, end_ns=None):
+    """
+    Mesures de ``[start_ns, end_ns[``.
+
+    Si les instants sont croissants (cas courant), la tranche est trouvée
+    par dichotomie ; si l'horloge a reculé pendant l'enregistrement, un
+    masque garde toutes les mesures de l'intervalle, dans l'ordre du fichier.
+
+    Returns:
+        numpy.ndarray: Tranche (vue) de ``records``, ou copie des mesures
+        retenues si les instants ne sont pas triés
+    """
+    np = _numpy()
+    instants = records["timestamp"]
+    if len(instants) > 1 and not np.all(instants[1:] >= instants[:-1]):
+        garder = np.ones(len(records), dtype=bool)
+        if start_ns is not None:
+            garder &= instants >= start_ns
+        if end_ns is not None:
+            garder &= instants < end_ns
+        return records[garder]
+    debut = 0 if start_ns is None else np.searchsorted(instants, start_ns, "left")
+    fin = len(records) if end_ns is None else np.searchsorted(instants, end_ns, "left")
+    return records[debut:fin]
+
+
+def iter_records(path):
+    """
+    Relit un historique sans NumPy.
+
+    Yields:
+        tuple: (instant en ns, température, humidité)
+
+    Raises:
+        ValueError: Le fichier n'est pas un historique
+    """
+    with open(path, "rb") as f:
+        _verifier_entete(f.read(LOG_HEADER.size), path)
+        n = _nombre(os.fstat(f.fileno()).st_size)
+        if not n:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as projection:
+            vue = memoryview(projection)
+            try:
+                corps = vue[LOG_HEADER.size:LOG_HEADER.size + n * LOG_RECORD.size]
+                yield from LOG_RECORD.iter_unpack(corps)
+            finally:
+                corps.release()
+                vue.release()
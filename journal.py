@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Journal des transitions GPIO, hors du chemin critique.
+
+Un ``print()`` après chaque ``GPIO.output`` bloque sur stdout (SSH, terminal
+lent, tube) et allonge les délais des LEDs. Ici, chaque écriture de trame
+est seulement notée dans un tampon circulaire préalloué (deux tableaux :
+instant en ns et trame) ; un fil d'arrière-plan vide le tampon et écrit
+les lignes de texte, ou un fichier de trace binaire compact.
+
+Exemple :
+
+    journal = EventLog()
+    banque = PinBank(LEDS, log=journal)
+    with BackgroundWriter(journal, names=["LED_ROUGE", "LED_VERTE", "LED_JAUNE"]):
+        ...  # banque.write() ne fait plus aucune écriture sur stdout
+"""
+
+import struct
+import sys
+import threading
+import time
+from array import array
+
+# Trace binaire : en-tête, puis un enregistrement par transition
+TRACE_MAGIC = b"LEDTRC01"
+TRACE_RECORD = struct.Struct("<qQ")  # instant (ns), trame
+
+
+class EventLog:
+    """
+    Tampon circulaire d'événements (instant, trame), un producteur / un lecteur.
+
+    Args:
+        capacity (int): Nombre d'événements conservés (puissance de 2)
+        clock_ns: Horloge en ns (par défaut ``time.monotonic_ns``)
+    """
+
+    def __init__(self, capacity=4096, clock_ns=None):
+        if capacity <= 0 or capacity & (capacity - 1):
+            raise ValueError("La capacité doit être une puissance de 2")
+        self.capacity = capacity
+        self._index_mask = capacity - 1
+        self._times = array("q", bytes(8 * capacity))
+        self._frames = array("Q", bytes(8 * capacity))
+        self._clock_ns = clock_ns if clock_ns is not None else time.monotonic_ns
+        # Compteurs toujours croissants ; l'index réel est compteur & masque
+        self._head = 0
+        self._tail = 0
+        self.dropped = 0
+
+    def record(self, frame):
+        """Note une trame avec l'instant présent (quelques centaines de ns)."""
+        i = self._head & self._index_mask
+        self._times[i] = self._clock_ns()
+        self._frames[i] = frame
+        self._head += 1
+
+    def __len__(self):
+        return min(self._head - self._tail, self.capacity)
+
+    def drain(self):
+        """
+        Retire les événements en attente.
+
+        Returns:
+            list: ``[(instant_ns, trame), ...]`` dans l'ordre chronologique.
+            Si le lecteur a pris trop de retard, les plus anciens sont
+            perdus et comptés dans ``dropped``.
+        """
+        head = self._head
+        tail = self._tail
+        if head - tail > self.capacity:
+            self.dropped += head - tail - self.capacity
+            tail = head - self.capacity
+        evenements = []
+        for n in range(tail, head):
+            i = n & self._index_mask
+            evenements.append((self._times[i], self._frames[i]))
+        self._tail = head
+        return evenements
+
+
+def format_transitions(evenements, names, previous=0):
+    """
+    Convertit des trames successives en lignes « NOM HIGH/LOW ».
+
+    Args:
+        evenements (list): ``[(instant_ns, trame), ...]``
+        names (sequence): Nom de chaque bit de la trame
+        previous (int): Trame précédant le premier événement
+
+    Returns:
+        tuple: (lignes, dernière trame)
+    """
+    lignes = []
+    for _, trame in evenements:
+        change = trame ^ previous
+        # Les extinctions d'abord, comme dans les scripts d'origine
+        for i, nom in enumerate(names):
+            if change & (1 << i) and not trame & (1 << i):
+                lignes.append(f"{nom} LOW")
+        for i, nom in enumerate(names):
+            if change & (1 << i) and trame & (1 << i):
+                lignes.append(f"{nom} HIGH")
+        previous = trame
+    return lignes, previous
+
+
+class BackgroundWriter:
+    """
+    Fil d'arrière-plan qui vide un ``EventLog`` périodiquement.
+
+    Args:
+        log (EventLog): Journal à vider
+        names (sequence): Noms des bits, pour la sortie texte
+        stream: Flux texte de sortie (par défaut ``sys.stdout``)
+        trace (str): Si fourni, chemin d'une trace binaire écrite à la place
+            du texte
+        interval (float): Période de vidage en secondes
+    """
+
+    def __init__(self, log, names=(), stream=None, trace=None, interval=0.1):
+        self.log = log
+        self.names = list(names)
+        self.stream = stream if stream is not None else sys.stdout
+        self.interval = interval
+        self._trace = None
+        if trace is not None:
+            self._trace = open(trace, "wb")
+            self._trace.write(TRACE_MAGIC)
+        self._previous = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="journal-gpio",
+                                        daemon=True)
+
+    def start(self):
+        """Démarre le fil d'écriture."""
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Arrête le fil et écrit les derniers événements."""
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        self.flush()
+        if self._trace is not None:
+            self._trace.close()
+            self._trace = None
+
+    def flush(self):
+        """Écrit les événements en attente."""
+        evenements = self.log.drain()
+        if not evenements:
+            return
+        if self._trace is not None:
+            tampon = bytearray(TRACE_RECORD.size * len(evenements))
+            for n, (instant, trame) in enumerate(evenements):
+                TRACE_RECORD.pack_into(tampon, n * TRACE_RECORD.size, instant, trame)
+            self._trace.write(tampon)
+            self._trace.flush()
+        else:
+            lignes, self._previous = format_transitions(
+                evenements, self.names, self._previous)
+            if lignes:
+                self.stream.write("\n".join(lignes) + "\n")
+                self.stream.flush()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.flush()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+
+def read_trace(path):
+    """
+    Relit une trace binaire.
+
+    Args:
+        path (str): Chemin du fichier de trace
+
+    Returns:
+        list: ``[(instant_ns, trame), ...]``
+
+    Raises:
+        ValueError: Le fichier n'est pas une trace valide
+    """
+    with open(path, "rb") as f:
+        donnees = f.read()
+    if not donnees.startswith(TRACE_MAGIC):
+        raise ValueError(f"{path} n'est pas une trace de transitions")
+    corps = memoryview(donnees)[len(TRACE_MAGIC):]
+    complet = len(corps) - len(corps) % TRACE_RECORD.size
+    return list(TRACE_RECORD.iter_unpack(corps[:complet]))
@@ -1,30 +1,38 @@
-import RPi.GPIO as GPIO
-import time
+from gpio_bank import PinBank, uses_daemon
+from journal import BackgroundWriter, EventLog
+from motifs import LABO1, compile_pattern, play
 
 LED_ROUGE = 17
 LED_VERTE = 27
 LED_JAUNE = 22
 
-# Configuration
-GPIO.setmode(GPIO.BCM)
-GPIO.setup([LED_ROUGE, LED_VERTE, LED_JAUNE], GPIO.OUT)
-
-for i in range(100) :
-    # Allumer la LED rouge
-    GPIO.output(LED_ROUGE, GPIO.HIGH)
-    print("LED_ROUGE HIGH")
-    time.sleep(0.1)
-    GPIO.output(LED_ROUGE, GPIO.LOW)
-    print("LED_ROUGE LOW")
-    GPIO.output(LED_VERTE, GPIO.HIGH)
-    print("LED_VERTE HIGH")
-    time.sleep(0.1)
-    GPIO.output(LED_VERTE, GPIO.LOW)
-    print("LED_VERTE LOW")
-    GPIO.output(LED_JAUNE, GPIO.HIGH)
-    print("LED_JAUNE HIGH")
-    time.sleep(0.1)
-    GPIO.output(LED_JAUNE, GPIO.LOW)
-    print("LED_JAUNE LOW")
-
-GPIO.cleanup()
\ No newline at end of file
+
+def main():
+    # Configuration (avec GPIO_BACKEND=demon, le démon possède les broches)
+    GPIO = None
+    if not uses_daemon():
+        import RPi.GPIO as GPIO
+
+        GPIO.setmode(GPIO.BCM)
+        GPIO.setup([LED_ROUGE, LED_VERTE, LED_JAUNE], GPIO.OUT)
+
+    # Banque et broches libérées même sur Ctrl+C (ou SIGALRM du banc d'essai)
+    try:
+        # Les transitions sont notées en mémoire et affichées par un fil séparé
+        journal = EventLog()
+        with PinBank([LED_ROUGE, LED_VERTE, LED_JAUNE], log=journal) as banque:
+            # Rouge, verte, jaune (0.1 s chacune) × 100, compilé avant la lecture
+            timeline = compile_pattern(LABO1, banque.pins)
+
+            print(f"Lecture de {len(timeline)} étapes "
+                  f"({timeline.duration_ns / 1e9:.1f} s)")
+            with BackgroundWriter(journal, names=["LED_ROUGE", "LED_VERTE", "LED_JAUNE"]):
+                retard = play(timeline, banque)
+            print(f"Terminé, retard max: {retard / 1e6:.3f} ms")
+    finally:
+        if GPIO is not None:
+            GPIO.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -8,10 +8,16 @@ Câblage :
 - LED rouge : GPIO 17 → résistance 330Ω → GND
 - LED verte : GPIO 27 → résistance 330Ω → GND
 - LED jaune : GPIO 22 → résistance 330Ω → GND
+
+Importer ce module ne touche pas au matériel : voir open() / close().
 """
 
-import time
-import RPi.GPIO as GPIO
+from contextlib import contextmanager, nullcontext
+
+from gpio_bank import PinBank, uses_daemon
+from journal import BackgroundWriter, EventLog
+from motifs import CHENILLARD_ALLUME, compile_pattern, play
+from sequenceur import Sequencer
 
 # Configuration des broches GPIO
 LED_ROUGE = 17
@@ -19,81 +25,198 @@ LED_VERTE = 27
 LED_JAUNE = 22
 
 LEDS = [LED_ROUGE, LED_VERTE, LED_JAUNE]
+NOMS = ["LED_ROUGE", "LED_VERTE", "LED_JAUNE"]
+
+# Trames (bit 0 = rouge, bit 1 = verte, bit 2 = jaune)
+ROUGE = 0b001
+VERTE = 0b010
+JAUNE = 0b100
+
+# Module RPi.GPIO, banque de broches et son journal, créés par open()
+GPIO = None
+banque = None
+journal = None
+
+# Lignes de temps compilées, par délai
+_timelines = {}
 
-def chenillard(delai=0.3):
+def chenillard(delai=0.3, sequenceur=None):
     """
     Effet chenillard : les LEDs s'allument successivement.
 
     Args:
         delai (float): Délai entre chaque LED en secondes
+        sequenceur (Sequencer): Séquenceur partagé entre les appels, pour
+            que la période ne dérive pas d'un appel à l'autre
     """
+    if sequenceur is None:
+        sequenceur = Sequencer()
+
     # TODO : Implémenter l'effet chenillard
     # Allumer LED 1, attendre, éteindre LED 1
     # Allumer LED 2, attendre, éteindre LED 2
     # Allumer LED 3, attendre, éteindre LED 3
     # Répéter
 
+    # Les transitions sont notées dans le journal de la banque : aucun
+    # print() entre deux écritures. La banque est créée au premier usage si
+    # open() n'a pas encore été appelée.
+    banque_leds = open()
     for i in range(5) :
-        # Allumer la LED rouge
-        GPIO.output(LED_ROUGE, GPIO.HIGH)
-        print("LED_ROUGE HIGH")
-        time.sleep(delai)
-        GPIO.output(LED_ROUGE, GPIO.LOW)
-        print("LED_ROUGE LOW")
-        GPIO.output(LED_VERTE, GPIO.HIGH)
-        print("LED_VERTE HIGH")
-        time.sleep(delai)
-        GPIO.output(LED_VERTE, GPIO.LOW)
-        print("LED_VERTE LOW")
-        GPIO.output(LED_JAUNE, GPIO.HIGH)
-        print("LED_JAUNE HIGH")
-        time.sleep(delai)
-        GPIO.output(LED_JAUNE, GPIO.LOW)
-        print("LED_JAUNE LOW")
+        banque_leds.write(ROUGE)
+        sequenceur.sleep(delai)
+        banque_leds.write(VERTE)
+        sequenceur.sleep(delai)
+        banque_leds.write(JAUNE)
+        sequenceur.sleep(delai)
+        banque_leds.write(0)
 
     pass
 
-def chenillard_allume(delai=0.3):
+def chenillard_allume(delai=0.3, sequenceur=None):
     """
     Effet chenillard où les LEDs restent allumées.
 
     Args:
         delai (float): Délai entre chaque LED en secondes
+        sequenceur (Sequencer): Séquenceur partagé entre les appels
     """
-    # TODO : Implémenter l'effet chenillard "qui reste allumé"
-
-    GPIO.output(LED_ROUGE, GPIO.HIGH)
-    time.sleep(delai)
-    GPIO.output(LED_VERTE, GPIO.HIGH)
-    time.sleep(delai)
-    GPIO.output(LED_JAUNE, GPIO.HIGH)
-    time.sleep(delai)
-    pass
+    timeline = _timelines.get(delai)
+    if timeline is None:
+        timeline = compile_pattern(CHENILLARD_ALLUME, LEDS, delai=delai)
+        _timelines[delai] = timeline
 
-def main():
+    play(timeline, open(), sequenceur)
+
+def fondu(depart, arrivee, duree=1.0, sequenceur=None):
+    """
+    Fondu de couleur par PWM logiciel, avec correction gamma.
+
+    Args:
+        depart (tuple): Niveaux (rouge, verte, jaune) de départ, 0 à 255
+        arrivee (tuple): Niveaux d'arrivée, 0 à 255
+        duree (float): Durée du fondu en secondes
+        sequenceur (Sequencer): Séquenceur partagé entre les appels
+
+    À la fin, le PWM est arrêté (son fil terminé, voir SoftwarePWM.close) :
+    les LEDs à 255 restent allumées, les autres sont éteintes.
+
+    Avec ``GPIO_BACKEND=demon``, le démon ne fait pas de PWM : les LEDs
+    passent directement à l'état final, puis l'effet dure ``duree``.
+    """
+    banque_leds = open()
+    if GPIO is None:
+        banque_leds.write(sum(1 << i for i, n in enumerate(arrivee) if n >= 255))
+        (sequenceur or Sequencer()).sleep(duree)
+        return
+
+    # Importé ici : pwm charge NumPy, trop lent pour l'import de led_rgb
+    from pwm import Fader, SoftwarePWM
+
+    fader = Fader([SoftwarePWM(GPIO, led) for led in LEDS])
+    try:
+        fader.set_levels(depart)
+        fader.fade(arrivee, duree, sequencer=sequenceur)
+    finally:
+        fader.close()
+    # Le PWM a piloté les broches sans passer par la banque
+    banque_leds.invalidate()
+    banque_leds.write(sum(1 << i for i, n in enumerate(arrivee) if n >= fader.levels - 1))
+
+def open():
+    """
+    Configure les GPIO et crée la banque de broches (idempotent).
+
+    Returns:
+        PinBank: Banque des 3 LEDs, reliée au journal des transitions
+    """
+    global GPIO, banque, journal
+    if banque is not None:
+        return banque
+
+    if uses_daemon():
+        # Le démon possède les broches : ni setmode, ni setup
+        GPIO = None
+    else:
+        import RPi.GPIO as GPIO
+
+        GPIO.setmode(GPIO.BCM)
+        GPIO.setup(LEDS, GPIO.OUT)
+    journal = EventLog()
+    banque = PinBank(LEDS, log=journal)
+    return banque
+
+def close():
+    """Libère les GPIO (sans effet si open() n'a pas été appelée)."""
+    global banque
+    if banque is None:
+        return
+    banque.close()
+    if GPIO is not None:
+        GPIO.cleanup()
+    banque = None
+
+@contextmanager
+def leds():
+    """Contexte ``with leds() as banque:`` qui appelle open() puis close()."""
+    try:
+        yield open()
+    finally:
+        close()
+
+def main(argv=None):
     """Fonction principale."""
+    # Importé ici : seul le lancement en script analyse la ligne de commande
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Effet chenillard sur 3 LEDs")
+    parser.add_argument("--temps-reel", type=int, metavar="CPU",
+                        help="Épingler sur ce cœur, en SCHED_FIFO et mémoire "
+                             "verrouillée (si les privilèges le permettent)")
+    args = parser.parse_args(argv)
+
     # Configuration
-    GPIO.setmode(GPIO.BCM)
-    GPIO.setup(LEDS, GPIO.OUT)
+    open()
+    ecrivain = BackgroundWriter(journal, names=NOMS).start()
 
     # Éteindre toutes les LEDs au départ
-    for led in LEDS:
-        GPIO.output(led, GPIO.LOW)
+    banque.write(0)
 
     print("Effet chenillator sur 3 LEDs")
     print("Appuyez sur Ctrl+C pour quitter")
 
+    # Un seul séquenceur : les échéances s'enchaînent sans dérive
+    sequenceur = Sequencer()
+
+    if args.temps_reel is not None:
+        from temps_reel import realtime
+
+        mode = realtime(cpu=args.temps_reel)
+    else:
+        mode = nullcontext()
+
     try:
-        while True:
-            # TODO : Appeler votre fonction chenillard
-            chenillard(0.1)
-            chenillard_allume(0.3)
-            pass
+        with mode as rapport:
+            if rapport is not None:
+                print(rapport)
+            while True:
+                # TODO : Appeler votre fonction chenillard
+                chenillard(0.1, sequenceur)
+                chenillard_allume(0.3, sequenceur)
+                fondu((255, 255, 255), (0, 0, 0), 1.0, sequenceur)
+                pass
 
     except KeyboardInterrupt:
         print("\nAu revoir!")
+        stats = sequenceur.stats
+        print(f"Retard moyen: {stats.mean_ns / 1e6:.3f} ms, "
+              f"max: {stats.max_ns / 1e6:.3f} ms, "
+              f"étapes en retard: {stats.late_steps}/{stats.steps}")
+        print(f"Écritures de broches: {banque.writes_issued} envoyées, "
+              f"{banque.writes_suppressed} évitées")
     finally:
-        GPIO.cleanup()
+        ecrivain.stop()
+        close()
 
 if __name__ == "__main__":
     main()
@@ -11,10 +11,16 @@ Câblage :
 - LED rouge : GPIO 17 → résistance 330Ω → GND
 - LED verte : GPIO 27 → résistance 330Ω → GND
 - LED jaune : GPIO 22 → résistance 330Ω → GND
+
+Importer ce module ne touche pas au matériel : les GPIO sont configurés
+par open() (ou ``with leds():``) et libérés par close().
 """
 
 import time
-import RPi.GPIO as GPIO
+from contextlib import contextmanager
+
+from gpio_bank import PinBank, uses_daemon
+from motifs import UNE_PAR_UNE, compile_pattern, play
 
 # Configuration des broches GPIO
 LED_ROUGE = 17
@@ -23,38 +29,76 @@ LED_JAUNE = 22
 
 LEDS = [LED_ROUGE, LED_VERTE, LED_JAUNE]
 
-# TODO : Configurer le mode BCM
-# GPIO.setmode(GPIO.???)
-GPIO.setmode(GPIO.BCM)
+# Module RPi.GPIO et banque de broches, créés par open()
+GPIO = None
+banque = None
+
+# Rouge, puis rouge + verte, puis les 3 (1 s chacune)
+UNE_PAR_UNE_TIMELINE = compile_pattern(UNE_PAR_UNE, LEDS)
+
+def open():
+    """
+    Configure les GPIO et crée la banque de broches.
+
+    Peut être appelée plusieurs fois : seul le premier appel configure.
+
+    Returns:
+        PinBank: Banque des 3 LEDs
+    """
+    global GPIO, banque
+    if banque is not None:
+        return banque
+
+    if uses_daemon():
+        # Le démon possède les broches : ni setmode, ni setup
+        GPIO = None
+        banque = PinBank(LEDS)
+        return banque
+
+    import RPi.GPIO as GPIO
 
-# TODO : Configurer les broches en sortie
-# GPIO.setup(..., GPIO.OUT)
-GPIO.setup(LEDS, GPIO.OUT)
+    # TODO : Configurer le mode BCM
+    # GPIO.setmode(GPIO.???)
+    GPIO.setmode(GPIO.BCM)
+
+    # TODO : Configurer les broches en sortie
+    # GPIO.setup(..., GPIO.OUT)
+    GPIO.setup(LEDS, GPIO.OUT)
+
+    # Les 3 LEDs changent d'état en une seule écriture
+    banque = PinBank(LEDS)
+    return banque
+
+def close():
+    """Libère les GPIO (sans effet si open() n'a pas été appelée)."""
+    global banque
+    if banque is None:
+        return
+    banque.close()
+    if GPIO is not None:
+        GPIO.cleanup()
+    banque = None
+
+@contextmanager
+def leds():
+    """Contexte ``with leds() as banque:`` qui appelle open() puis close()."""
+    try:
+        yield open()
+    finally:
+        close()
 
 def allumer_toutes():
-    """Allume toutes les LEDs."""
-    # TODO : Implémenter
-    GPIO.output(LED_ROUGE, GPIO.HIGH)
-    GPIO.output(LED_VERTE, GPIO.HIGH)
-    GPIO.output(LED_JAUNE, GPIO.HIGH)
-    pass
+    """Allume toutes les LEDs (ouvre la banque au premier usage)."""
+    banque_leds = open()
+    banque_leds.write(banque_leds.all_mask)
 
 def eteindre_toutes():
     """Éteint toutes les LEDs."""
-    # TODO : Implémenter
-    GPIO.output(LED_ROUGE, GPIO.LOW)
-    GPIO.output(LED_VERTE, GPIO.LOW)
-    GPIO.output(LED_JAUNE, GPIO.LOW)
-    pass
+    open().write(0)
 
 def uneParUne():
-    GPIO.output(LED_ROUGE, GPIO.HIGH)
-    time.sleep(1)
-    GPIO.output(LED_VERTE, GPIO.HIGH)
-    time.sleep(1)
-    GPIO.output(LED_JAUNE, GPIO.HIGH)
-    time.sleep(1)
-    pass
+    """Allume les LEDs une à une, à 1 seconde d'intervalle."""
+    play(UNE_PAR_UNE_TIMELINE, open())
 
 def main():
     """Fonction principale."""
@@ -62,6 +106,7 @@ def main():
     print("Rouge = GPIO 17, Verte = GPIO 27, Jaune = GPIO 22")
     print("Appuyez sur Ctrl+C pour quitter")
 
+    open()
     try:
         while True:
             # TODO : Allumer chaque LED une par une
@@ -80,7 +125,7 @@ def main():
     finally:
         # TODO : Nettoyer les GPIO avant de quitter
         # GPIO.cleanup()
-        GPIO.cleanup()
+        close()
         pass
 
 if __name__ == "__main__":
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Mémoire partagée entre le processus du capteur et celui des LEDs.
+
+Un segment ``multiprocessing.shared_memory`` contient la dernière mesure
+du DHT22 et la trame de LEDs voulue. Les accès passent par un verrou
+``fcntl.flock`` sur un fichier voisin (``<name>.lock``) : partagé pour
+lire, exclusif pour écrire. Un seqlock sans barrière mémoire ne serait sûr
+que sur x86 ; sur ARM (le Raspberry Pi), le lecteur pourrait voir le
+compteur à jour avant les valeurs. Prendre et rendre le verrou sont des
+appels système, qui ordonnent les accès mémoire sur toutes les
+architectures. Le verrou est rendu par le noyau si le processus meurt.
+
+Chaque section porte un compteur de publications, incrémenté à chaque
+écriture : le lecteur sait ainsi si la valeur a changé depuis sa dernière
+lecture.
+
+Disposition (petit-boutiste, champs alignés sur 8 octets) :
+
+    0   magic      8s   b"LEDSHM02"
+    8   numero     Q    ┐
+    16  temperature d   │ mesure (NaN : aucune)
+    24  humidity   d    │
+    32  timestamp  q    ┘ ns (time.time_ns)
+    40  numero     Q    ┐
+    48  frame      Q    │ trame voulue
+    56  timestamp  q    ┘
+
+Usage (deux terminaux) :
+    python3 memoire_partagee.py capteur     # DHT22 → mémoire partagée
+    python3 memoire_partagee.py leds        # mémoire partagée → couleur
+"""
+
+import argparse
+import fcntl
+import math
+import os
+import struct
+import tempfile
+import time
+from multiprocessing import resource_tracker, shared_memory
+
+NOM = "formatif-leds"
+MAGIC = b"LEDSHM02"
+
+_MAGIC = struct.Struct("<8s")
+_SEQ = struct.Struct("<Q")
+_MESURE = struct.Struct("<ddq")
+_TRAME = struct.Struct("<Qq")
+
+_OFFSET_MESURE = _MAGIC.size
+_OFFSET_TRAME = _OFFSET_MESURE + _SEQ.size + _MESURE.size
+TAILLE = _OFFSET_TRAME + _SEQ.size + _TRAME.size
+
+# Répertoire des fichiers de verrou, à côté des segments s'il existe
+_DOSSIER_VERROUS = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+
+
+def lock_path(name):
+    """Fichier de verrou du segment ``name``."""
+    return os.path.join(_DOSSIER_VERROUS, f"{name}.lock")
+
+
+class SharedState:
+    """
+    Segment partagé : dernière mesure et trame voulue.
+
+    Args:
+        name (str): Nom du segment (``/dev/shm/<name>``)
+        create (bool): Créer le segment (sinon s'attacher à un existant)
+
+    Raises:
+        FileNotFoundError: Segment absent (create=False)
+        FileExistsError: Segment déjà créé (create=True)
+        ValueError: Le segment n'a pas la disposition attendue
+    """
+
+    def __init__(self, name=NOM, create=False):
+        self._verrou = None
+        if create:
+            self._shm = shared_memory.SharedMemory(name, create=True, size=TAILLE)
+            self._buf = self._shm.buf
+            _MESURE.pack_into(self._buf, _OFFSET_MESURE + _SEQ.size, math.nan, math.nan, 0)
+            _MAGIC.pack_into(self._buf, 0, MAGIC)
+        else:
+            self._shm = _attacher(name)
+            self._buf = self._shm.buf
+            if self._shm.size < TAILLE or bytes(self._buf[:len(MAGIC)]) != MAGIC:
+                self.close()
+                raise ValueError(f"Segment {name!r} invalide (magic attendu {MAGIC!r})")
+        self.name = name
+        self.owner = create
+        self._verrou = os.open(lock_path(name), os.O_RDWR | os.O_CREAT, 0o666)
+
+    @classmethod
+    def create(cls, name=NOM):
+        """Crée le segment (à faire par un seul processus)."""
+        return cls(name, create=True)
+
+    @classmethod
+    def attach(cls, name=NOM):
+        """S'attache à un segment existant."""
+        return cls(name)
+
+    def _ecrire(self, offset, structure, *valeurs):
+        fcntl.flock(self._verrou, fcntl.LOCK_EX)
+        try:
+            numero = _SEQ.unpack_from(self._buf, offset)[0]
+            structure.pack_into(self._buf, offset + _SEQ.size, *valeurs)
+            _SEQ.pack_into(self._buf, offset, numero + 1)
+        finally:
+            fcntl.flock(self._verrou, fcntl.LOCK_UN)
+
+    def _lire(self, offset, structure):
+        fcntl.flock(self._verrou, fcntl.LOCK_SH)
+        try:
+            numero = _SEQ.unpack_from(self._buf, offset)[0]
+            return structure.unpack_from(self._buf, offset + _SEQ.size), numero
+        finally:
+            fcntl.flock(self._verrou, fcntl.LOCK_UN)
+
+    def publish_reading(self, temperature, humidity, timestamp_ns=None):
+        """Publie une mesure (en pratique, par le processus du capteur)."""
+        if timestamp_ns is None:
+            timestamp_ns = time.time_ns()
+        self._ecrire(_OFFSET_MESURE, _MESURE, temperature, humidity, timestamp_ns)
+
+    def read_reading(self):
+        """
+        Lit la dernière mesure (verrou partagé).
+
+        Returns:
+            tuple: (température, humidité, instant en ns, numéro de la
+            publication), ou None si aucune mesure n'a été publiée
+        """
+        (temperature, humidite, instant), numero = self._lire(_OFFSET_MESURE, _MESURE)
+        if not numero:
+            return None
+        return temperature, humidite, instant, numero
+
+    def publish_frame(self, frame, timestamp_ns=None):
+        """Publie la trame voulue (en pratique, par le processus des LEDs)."""
+        if timestamp_ns is None:
+            timestamp_ns = time.time_ns()
+        self._ecrire(_OFFSET_TRAME, _TRAME, frame, timestamp_ns)
+
+    def read_frame(self):
+        """
+        Lit la trame voulue (verrou partagé).
+
+        Returns:
+            tuple: (trame, instant en ns, numéro de la publication)
+        """
+        (trame, instant), numero = self._lire(_OFFSET_TRAME, _TRAME)
+        return trame, instant, numero
+
+    def close(self):
+        """Détache le segment de ce processus."""
+        self._buf = None
+        self._shm.close()
+        if self._verrou is not None:
+            os.close(self._verrou)
+            self._verrou = None
+
+    def unlink(self):
+        """Supprime le segment et son verrou (processus créateur)."""
+        self._shm.unlink()
+        try:
+            os.unlink(lock_path(self.name))
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        if self.owner:
+            self.unlink()
+        return False
+
+
+def _attacher(name):
+    """S'attache sans que le resource_tracker supprime le segment à la sortie."""
+    try:
+        return shared_memory.SharedMemory(name, track=False)
+    except TypeError:
+        # Python < 3.13 : le segment est suivi même quand on ne fait que
+        # l'ouvrir ; on saute l'enregistrement plutôt que de l'annuler, ce
+        # qui retirerait aussi celui du créateur s'il partage le suivi
+        enregistrer = resource_tracker.register
+        resource_tracker.register = lambda *args: None
+        try:
+            return shared_memory.SharedMemory(name)
+        finally:
+            resource_tracker.register = enregistrer
+
+
+# Couleur suivant la température (bit 0 = rouge, bit 1 = verte, bit 2 = jaune)
+SEUIL_FROID = 18.0
+SEUIL_CHAUD = 25.0
+
+
+def couleur_temperature(temperature):
+    """
+    Trame correspondant à une température.
+
+    Returns:
+        int: Verte sous ``SEUIL_FROID``, jaune entre les seuils, rouge
+        au-dessus de ``SEUIL_CHAUD`` ; tout éteint si la mesure manque
+    """
+    if temperature is None or math.isnan(temperature):
+        return 0
+    if temperature < SEUIL_FROID:
+        return 0b010
+    if temperature <= SEUIL_CHAUD:
+        return 0b100
+    return 0b001
+
+
+def _capteur(etat):
+    """Lit le DHT22 toutes les 2 s et publie chaque mesure."""
+    import dht22
+
+    # Un seul open() : température et humidité viennent de la même
+    # transaction (le capteur garde ses valeurs 2 s) ; les erreurs sont
+    # affichées par lire_temperature/lire_humidite
+    with dht22.capteur():
+        while True:
+            temperature = dht22.lire_temperature()
+            humidite = dht22.lire_humidite()
+            if temperature is not None and humidite is not None:
+                etat.publish_reading(temperature, humidite)
+            time.sleep(2.0)
+
+
+def _leds(etat):
+    """Suit la dernière mesure et affiche sa couleur."""
+    import led_rgb
+
+    with led_rgb.leds() as banque:
+        dernier = None
+        while True:
+            mesure = etat.read_reading()
+            if mesure is not None and mesure[3] != dernier:
+                dernier = mesure[3]
+                trame = couleur_temperature(mesure[0])
+                etat.publish_frame(trame)
+                banque.write(trame)
+            time.sleep(0.05)
+
+
+def main():
+    """Point d'entrée en ligne de commande."""
+    parser = argparse.ArgumentParser(description="Mémoire partagée capteur → LEDs")
+    parser.add_argument("role", choices=["capteur", "leds"])
+    parser.add_argument("--nom", default=NOM, help="Nom du segment (défaut: %(default)s)")
+    args = parser.parse_args()
+
+    try:
+        etat = SharedState.create(args.nom)
+    except FileExistsError:
+        etat = SharedState.attach(args.nom)
+    try:
+        with etat:
+            (_capteur if args.role == "capteur" else _leds)(etat)
+    except KeyboardInterrupt:
+        print("\nAu revoir!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Motifs de LEDs décrits comme des données et compilés en lignes de temps.
+
+Format d'un motif (compatible JSON) :
+
+    {
+        "delai": 0.1,                   # durée par défaut d'une étape (s)
+        "etapes": ["R", "V", ["J", 0.2], ["", 0]],
+        "repetitions": 100,             # optionnel, 1 par défaut
+    }
+
+Chaque étape donne les LEDs allumées (lettres de ``NOMS_LEDS``, chaîne vide
+pour tout éteindre), éventuellement avec sa propre durée. La compilation
+produit une ``Timeline`` : deux tableaux plats ``offsets`` (ns depuis le
+début) et ``masks`` (trames pour ``PinBank.write``). La lecture ne fait
+plus qu'avancer dans ces tableaux : aucune interprétation par étape.
+"""
+
+import time
+from array import array
+
+# Lettres utilisées dans les motifs → broches BCM
+NOMS_LEDS = {"R": 17, "V": 27, "J": 22}
+
+# led_simple.uneParUne() : les LEDs s'allument une à une et restent allumées
+UNE_PAR_UNE = {"delai": 1.0, "etapes": ["R", "RV", "RVJ"]}
+
+# led_rgb.chenillard_allume()
+CHENILLARD_ALLUME = {"delai": 0.3, "etapes": ["R", "RV", "RVJ"]}
+
+# labo1.py : rouge, verte, jaune, 100 fois, puis tout éteint
+LABO1 = {
+    "delai": 0.1,
+    "etapes": ["R", "V", "J"],
+    "repetitions": 100,
+    "fin": "",
+}
+
+
+class Timeline:
+    """
+    Ligne de temps compilée : ``(offsets[i], masks[i])`` triés par offset.
+
+    Attributes:
+        offsets (array): Instants d'écriture en ns depuis le début
+        masks (array): Trame à écrire à chaque instant
+        duration_ns (int): Durée totale (la dernière étape incluse)
+    """
+
+    def __init__(self, offsets, masks, duration_ns):
+        self.offsets = offsets
+        self.masks = masks
+        self.duration_ns = duration_ns
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __iter__(self):
+        return zip(self.offsets, self.masks)
+
+
+def compile_pattern(motif, pins, noms=NOMS_LEDS, delai=None):
+    """
+    Compile un motif en ``Timeline``.
+
+    Args:
+        motif (dict): Description du motif (voir le format ci-dessus)
+        pins (sequence): Broches de la banque, dans l'ordre des bits
+        noms (dict): Lettre → broche BCM
+        delai (float): Remplace le délai par défaut du motif
+
+    Returns:
+        Timeline: Ligne de temps prête à être jouée
+
+    Raises:
+        ValueError: Lettre inconnue ou durée négative
+    """
+    pins = list(pins)
+    if delai is None:
+        delai = motif.get("delai", 0.0)
+
+    # Résolution des étapes une seule fois, avant le déroulage
+    etapes = []
+    for etape in motif["etapes"]:
+        if isinstance(etape, str):
+            leds, duree = etape, delai
+        else:
+            leds, duree = etape
+        if duree < 0:
+            raise ValueError(f"Durée négative dans l'étape {etape!r}")
+        etapes.append((_masque(leds, pins, noms), int(duree * 1e9)))
+
+    etapes = etapes * motif.get("repetitions", 1)
+    if "fin" in motif:
+        etapes.append((_masque(motif["fin"], pins, noms), 0))
+
+    offsets = array("q")
+    masks = array("Q")
+    t = 0
+    for masque, duree_ns in etapes:
+        if offsets and offsets[-1] == t:
+            # Étape de durée nulle : la suivante la remplace au même instant
+            masks[-1] = masque
+        else:
+            offsets.append(t)
+            masks.append(masque)
+        t += duree_ns
+    return Timeline(offsets, masks, t)
+
+
+def _masque(leds, pins, noms):
+    """Trame correspondant à une chaîne de lettres."""
+    masque = 0
+    for lettre in leds.replace("-", ""):
+        if lettre not in noms:
+            raise ValueError(f"LED inconnue {lettre!r} dans {leds!r}")
+        masque |= 1 << pins.index(noms[lettre])
+    return masque
+
+
+def play(timeline, bank, sequencer=None, clock_ns=None, sleep=None):
+    """
+    Joue une ligne de temps sur une ``PinBank``.
+
+    Args:
+        timeline (Timeline): Ligne de temps compilée
+        bank (PinBank): Banque de broches à piloter
+        sequencer (Sequencer): Si fourni, la lecture démarre à son échéance
+            courante et l'avance de ``timeline.duration_ns`` : on peut
+            enchaîner motifs compilés et ``sequencer.sleep()`` sans dérive
+        clock_ns: Horloge en ns (par défaut ``time.monotonic_ns``)
+        sleep: Fonction d'attente (par défaut ``time.sleep``)
+
+    Returns:
+        int: Retard maximal observé à l'écriture, en ns
+    """
+    if sequencer is not None:
+        clock_ns = sequencer.clock_ns
+        sleep = sequencer.sleep_func
+        if sequencer.deadline_ns is None:
+            sequencer.start()
+        t0 = sequencer.deadline_ns
+    else:
+        clock_ns = clock_ns if clock_ns is not None else time.monotonic_ns
+        sleep = sleep if sleep is not None else time.sleep
+        t0 = clock_ns()
+
+    write = bank.write
+    retard_max = 0
+    for offset, masque in zip(timeline.offsets, timeline.masks):
+        restant = t0 + offset - clock_ns()
+        if restant > 0:
+            sleep(restant / 1e9)
+        retard = clock_ns() - (t0 + offset)
+        if retard > retard_max:
+            retard_max = retard
+        write(masque)
+
+    fin = t0 + timeline.duration_ns
+    restant = fin - clock_ns()
+    if restant > 0:
+        sleep(restant / 1e9)
+    if sequencer is not None:
+        sequencer.deadline_ns = fin
+    return retard_max
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Lecture de plusieurs DHT22 sur des broches différentes, à créneaux décalés.
+
+Lire N capteurs l'un après l'autre avec 2 s d'attente chacun multiplie la
+période par N ; les lire tous en même temps (un fil par capteur) met en
+concurrence les décodages d'impulsions, sensibles au moindre retard du
+processeur. Ici, un seul fil suit un calendrier : le capteur k est lu aux
+instants ``k × interval / N + n × interval``. Les lectures sont donc
+réparties régulièrement dans l'intervalle et ne se chevauchent jamais.
+
+Chaque capteur garde son intervalle minimal (2 s pour le DHT22) : une
+lecture en retard décale la suivante d'un nombre entier d'intervalles,
+sans toucher aux créneaux des autres. Une erreur n'est pas réessayée sur
+place (elle bloquerait les autres capteurs) : le capteur est relu à son
+prochain créneau.
+
+Usage:
+    python3 multi_capteurs.py D4 D17 D27 [--duree 60]
+"""
+
+import argparse
+import heapq
+import threading
+import time
+
+import dht22
+from reessai import INTERVALLE_MIN, RetryPolicy
+
+
+class SensorStats:
+    """
+    Compteurs d'un capteur.
+
+    Attributes:
+        pin (str): Broche du capteur
+        samples (int): Lectures valides
+        errors (int): Lectures ratées
+        last_error: Dernière erreur
+        latest: Dernière mesure valide, ou None
+        busy_ns (int): Temps total passé à lire ce capteur
+    """
+
+    def __init__(self, pin):
+        self.pin = pin
+        self.samples = 0
+        self.errors = 0
+        self.last_error = None
+        self.latest = None
+        self.busy_ns = 0
+
+    def as_dict(self, elapsed_s):
+        """Retourne les compteurs et le débit obtenu sur ``elapsed_s`` secondes."""
+        lectures = self.samples + self.errors
+        return {
+            "samples": self.samples,
+            "errors": self.errors,
+            "samples_per_s": self.samples / elapsed_s if elapsed_s > 0 else 0.0,
+            "mean_read_ms": self.busy_ns / lectures / 1e6 if lectures else 0.0,
+        }
+
+
+class MultiSensorPoller:
+    """
+    Lit plusieurs capteurs à tour de rôle, sur des créneaux décalés.
+
+    Args:
+        pins (sequence): Broches (attributs de ``board``, ex. ``["D4", "D17"]``)
+        interval (float): Période de lecture de chaque capteur (s)
+        min_interval (float): Intervalle minimal entre deux lectures d'un
+            même capteur (s)
+        read: Fonction ``read(pin)`` retournant une mesure (par défaut
+            ``dht22.read`` avec une seule transaction par appel)
+        clock_ns: Horloge monotone en ns (par défaut ``time.monotonic_ns``)
+        sleep: Fonction d'attente en s (par défaut : interrompue par stop())
+
+    Raises:
+        ValueError: Aucune broche, broche en double, ou ``interval`` plus
+            court que ``min_interval``
+    """
+
+    def __init__(self, pins, interval=INTERVALLE_MIN, min_interval=INTERVALLE_MIN,
+                 read=None, clock_ns=None, sleep=None):
+        pins = list(pins)
+        if not pins or len(set(pins)) != len(pins):
+            raise ValueError("Il faut au moins une broche, chacune une seule fois")
+        if interval < min_interval:
+            raise ValueError(f"L'intervalle doit être d'au moins {min_interval} s")
+        self.pins = pins
+        self.interval_ns = int(interval * 1e9)
+        self.min_interval_ns = int(min_interval * 1e9)
+        self.clock_ns = clock_ns if clock_ns is not None else time.monotonic_ns
+        self._stop = threading.Event()
+        self.sleep_func = sleep if sleep is not None else self._stop.wait
+        if read is None:
+            # Un seul essai : le réessai attend le prochain créneau du capteur
+            self._politiques = {pin: RetryPolicy(min_interval, max_attempts=1,
+                                                 clock_ns=self.clock_ns,
+                                                 sleep=self.sleep_func)
+                                for pin in pins}
+            read = self._lire_dht22
+        self.read = read
+        self.stats = {pin: SensorStats(pin) for pin in pins}
+        self._calendrier = []
+        self._debut_ns = None
+        self._thread = None
+
+    def _lire_dht22(self, pin):
+        return dht22.read(pin, policy=self._politiques[pin])
+
+    def _planifier(self):
+        self._debut_ns = maintenant = self.clock_ns()
+        pas = self.interval_ns // len(self.pins)
+        # (échéance, rang) : le rang départage deux échéances égales
+        self._calendrier = [(maintenant + k * pas, k) for k in range(len(self.pins))]
+        heapq.heapify(self._calendrier)
+
+    def poll_once(self):
+        """
+        Attend le prochain créneau et lit le capteur correspondant.
+
+        Returns:
+            tuple: (broche, mesure), mesure à None si la lecture a échoué ;
+            None si stop() a interrompu l'attente
+        """
+        if not self._calendrier:
+            self._planifier()
+        echeance, rang = self._calendrier[0]
+        attente = echeance - self.clock_ns()
+        if attente > 0:
+            self.sleep_func(attente / 1e9)
+            if self._stop.is_set():
+                return None
+        pin = self.pins[rang]
+        stats = self.stats[pin]
+        debut = self.clock_ns()
+        try:
+            mesure = self.read(pin)
+        except RuntimeError as e:
+            mesure = None
+            stats.errors += 1
+            stats.last_error = e
+        else:
+            stats.samples += 1
+            stats.latest = mesure
+        stats.busy_ns += self.clock_ns() - debut
+        # Prochain créneau du même capteur : même phase, au moins
+        # min_interval après le début de cette lecture
+        echeance += self.interval_ns
+        while echeance < debut + self.min_interval_ns:
+            echeance += self.interval_ns
+        heapq.heapreplace(self._calendrier, (echeance, rang))
+        return pin, mesure
+
+    def run(self, duration=None):
+        """Lit les capteurs jusqu'à stop() ou pendant ``duration`` secondes."""
+        fin = None if duration is None else self.clock_ns() + int(duration * 1e9)
+        while not self._stop.is_set():
+            if fin is not None and self._calendrier and self._calendrier[0][0] >= fin:
+                break
+            self.poll_once()
+
+    def latest(self, pin):
+        """Dernière mesure valide du capteur, ou None."""
+        return self.stats[pin].latest
+
+    def report(self):
+        """
+        Débit obtenu par capteur depuis le premier créneau.
+
+        Returns:
+            dict: ``{broche: {"samples", "errors", "samples_per_s", "mean_read_ms"}}``
+        """
+        ecoule = 0.0
+        if self._debut_ns is not None:
+            ecoule = (self.clock_ns() - self._debut_ns) / 1e9
+        return {pin: self.stats[pin].as_dict(ecoule) for pin in self.pins}
+
+    def start(self):
+        """Démarre la lecture dans un fil d'arrière-plan."""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, name="multi-capteurs",
+                                        daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Arrête la lecture (la lecture en cours se termine)."""
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+
+def main():
+    """Point d'entrée en ligne de commande."""
+    parser = argparse.ArgumentParser(description="Lecture de plusieurs DHT22")
+    parser.add_argument("pins", nargs="+", help="Broches (ex. D4 D17 D27)")
+    parser.add_argument("--intervalle", type=float, default=INTERVALLE_MIN,
+                        help="Période par capteur en s (défaut: %(default)s)")
+    parser.add_argument("--duree", type=float, default=None,
+                        help="Durée en s (défaut: jusqu'à Ctrl+C)")
+    args = parser.parse_args()
+
+    poller = MultiSensorPoller(args.pins, args.intervalle)
+    fin = None if args.duree is None else time.monotonic() + args.duree
+    try:
+        while fin is None or time.monotonic() < fin:
+            pin, mesure = poller.poll_once()
+            if mesure is None:
+                print(f"{pin}: erreur de lecture: {poller.stats[pin].last_error}")
+            else:
+                print(f"{pin}: {mesure.temperature:.1f} °C  {mesure.humidity:.1f} %RH")
+    except KeyboardInterrupt:
+        print("\nAu revoir!")
+    finally:
+        for pin, resultat in poller.report().items():
+            print(f"{pin}: {resultat['samples']} mesures, {resultat['errors']} erreurs, "
+                  f"{resultat['samples_per_s']:.3f} mesures/s")
+        dht22.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Fondus et mélanges de couleurs par PWM, avec correction gamma précalculée.
+
+L'œil perçoit la luminosité de façon non linéaire : un rapport cyclique de
+50 % paraît presque aussi brillant que 100 %. On passe donc par une table
+gamma (niveau 0-255 → rapport cyclique), calculée une seule fois. Un fondu
+est planifié d'avance pour tous les canaux (vectorisé avec NumPy s'il est
+installé, importé seulement au premier plan) : à chaque pas, il ne reste
+qu'à envoyer les rapports cycliques qui ont changé, sans calcul en
+virgule flottante.
+
+Sorties disponibles :
+
+- ``SoftwarePWM`` : PWM logiciel de RPi.GPIO (toutes les broches)
+- ``SysfsPWM`` : PWM matériel via /sys/class/pwm (GPIO 12, 13, 18, 19)
+"""
+
+import os
+import time
+from array import array
+
+from sequenceur import Sequencer
+
+# NumPy n'est importé qu'au premier plan de fondu : importer ce module (et
+# led_rgb) reste rapide
+np = None
+_NUMPY_CHERCHE = False
+
+GAMMA = 2.2
+NIVEAUX = 256
+
+
+def _numpy():
+    """Module NumPy, importé au premier appel (None s'il est absent)."""
+    global np, _NUMPY_CHERCHE
+    if not _NUMPY_CHERCHE:
+        _NUMPY_CHERCHE = True
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+    return np
+
+
+def gamma_table(gamma=GAMMA, levels=NIVEAUX, max_duty=100.0):
+    """
+    Table niveau → rapport cyclique corrigé.
+
+    Args:
+        gamma (float): Exposant de correction (2.2 pour des LEDs courantes)
+        levels (int): Nombre de niveaux de luminosité
+        max_duty (float): Rapport cyclique à pleine luminosité
+            (100 pour RPi.GPIO, la période en ns pour sysfs)
+
+    Returns:
+        array: ``levels`` rapports cycliques croissants
+    """
+    dernier = levels - 1
+    return array("d", (max_duty * (i / dernier) ** gamma for i in range(levels)))
+
+
+class SoftwarePWM:
+    """
+    Canal PWM logiciel de RPi.GPIO.
+
+    Args:
+        gpio: Module RPi.GPIO (broche déjà configurée en sortie)
+        pin (int): Broche BCM
+        frequency (float): Fréquence en Hz
+    """
+
+    max_duty = 100.0
+
+    def __init__(self, gpio, pin, frequency=200.0):
+        self.pin = pin
+        self.frequency = frequency
+        self._pwm = gpio.PWM(pin, frequency)
+        self._pwm.start(0)
+
+    def set(self, duty):
+        """Change le rapport cyclique (0 à 100)."""
+        self._pwm.ChangeDutyCycle(duty)
+
+    def close(self):
+        """
+        Arrête le PWM et attend la fin de son fil.
+
+        RPi.GPIO ne joint pas le fil du PWM logiciel, qui remet la broche à
+        0 en sortant, jusqu'à une période après stop() : on attend deux
+        périodes pour qu'une écriture suivante ne soit pas écrasée.
+        """
+        self._pwm.stop()
+        time.sleep(2 / self.frequency)
+
+
+class SysfsPWM:
+    """
+    Canal PWM matériel via ``/sys/class/pwm`` (overlay ``pwm-2chan``).
+
+    Args:
+        chip (int): Numéro de pwmchip
+        channel (int): Canal du pwmchip (0 → GPIO 18, 1 → GPIO 19)
+        frequency (float): Fréquence en Hz
+    """
+
+    def __init__(self, chip=0, channel=0, frequency=1000.0):
+        base = f"/sys/class/pwm/pwmchip{chip}"
+        self._dir = f"{base}/pwm{channel}"
+        if not os.path.isdir(self._dir):
+            with open(f"{base}/export", "w") as f:
+                f.write(str(channel))
+        self.max_duty = int(1e9 / frequency)
+        self._ecrire("duty_cycle", 0)
+        self._ecrire("period", self.max_duty)
+        self._ecrire("enable", 1)
+        # Fichier gardé ouvert : un seul pwrite par changement
+        self._fd = os.open(f"{self._dir}/duty_cycle", os.O_WRONLY)
+
+    def _ecrire(self, nom, valeur):
+        with open(f"{self._dir}/{nom}", "w") as f:
+            f.write(str(valeur))
+
+    def set(self, duty):
+        """Change le rapport cyclique (en ns, 0 à ``max_duty``)."""
+        os.pwrite(self._fd, b"%d" % duty, 0)
+
+    def close(self):
+        """Désactive le canal."""
+        os.close(self._fd)
+        self._ecrire("enable", 0)
+
+
+class Fader:
+    """
+    Fondus simultanés sur plusieurs canaux PWM.
+
+    Args:
+        channels (sequence): Canaux (``SoftwarePWM``, ``SysfsPWM``, ...)
+        gamma (float): Exposant de correction gamma
+        levels (int): Nombre de niveaux de luminosité par canal
+    """
+
+    def __init__(self, channels, gamma=GAMMA, levels=NIVEAUX):
+        self.channels = list(channels)
+        self.levels = levels
+        self.level = [0] * len(self.channels)
+        self._duty = [None] * len(self.channels)
+        # Une table par canal : les unités diffèrent (%, ns)
+        self.tables = [gamma_table(gamma, levels, c.max_duty) for c in self.channels]
+        self._tables_np = None
+
+    def plan(self, start, end, steps):
+        """
+        Précalcule les rapports cycliques d'un fondu.
+
+        Args:
+            start (sequence): Niveau de départ de chaque canal
+            end (sequence): Niveau d'arrivée de chaque canal
+            steps (int): Nombre de pas (le départ n'est pas inclus)
+
+        Returns:
+            list: ``steps`` tuples, un rapport cyclique par canal
+        """
+        np = _numpy()
+        if np is not None:
+            if self._tables_np is None:
+                self._tables_np = np.array(self.tables)
+            a = np.asarray(start, dtype=np.intp)
+            b = np.asarray(end, dtype=np.intp)
+            k = np.arange(1, steps + 1)[:, None]
+            # Même arrondi entier que sans NumPy (moitiés vers le haut)
+            niveaux = a + ((b - a) * k * 2 + steps) // (2 * steps)
+            canaux = np.arange(len(self.channels))
+            return [tuple(ligne) for ligne in self._tables_np[canaux, niveaux].tolist()]
+
+        plan = []
+        for k in range(1, steps + 1):
+            plan.append(tuple(
+                table[a + ((b - a) * k * 2 + steps) // (2 * steps)]
+                for table, a, b in zip(self.tables, start, end)
+            ))
+        return plan
+
+    def apply(self, duties):
+        """Envoie les rapports cycliques qui ont changé."""
+        for i, duty in enumerate(duties):
+            if duty != self._duty[i]:
+                self.channels[i].set(duty)
+                self._duty[i] = duty
+
+    def set_levels(self, levels):
+        """Règle immédiatement le niveau de chaque canal."""
+        self.apply([table[n] for table, n in zip(self.tables, levels)])
+        self.level = list(levels)
+
+    def fade(self, end, duration, rate=100.0, sequencer=None):
+        """
+        Fondu des niveaux actuels vers ``end``.
+
+        Args:
+            end (sequence): Niveaux d'arrivée (0 à ``levels - 1``)
+            duration (float): Durée du fondu en secondes
+            rate (float): Pas par seconde
+            sequencer (Sequencer): Séquenceur à utiliser (sinon un nouveau)
+        """
+        steps = max(1, round(duration * rate))
+        plan = self.plan(self.level, end, steps)
+        if sequencer is None:
+            sequencer = Sequencer()
+        delai = duration / steps
+        for duties in plan:
+            self.apply(duties)
+            sequencer.sleep(delai)
+        self.level = list(end)
+
+    def close(self):
+        """Ferme tous les canaux."""
+        for canal in self.channels:
+            canal.close()
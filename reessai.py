@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Politique de réessai adaptative pour les lectures du DHT22.
+
+Attendre 2 s fixes après n'importe quelle erreur est à la fois trop et pas
+assez : une erreur de checksum ou une trame incomplète se corrige dès la
+transaction suivante, tandis qu'un capteur introuvable (câblage) ne
+reviendra pas en 2 s. Les erreurs d'adafruit_dht sont donc classées :
+
+- ``checksum``  : « Checksum did not validate », « unplausible data »
+- ``timeout``   : « A full buffer was not returned » (impulsions manquées)
+- ``not_found`` : « DHT sensor not found, check wiring »
+- ``other``     : tout le reste
+
+Pour chaque classe, l'attente est la plus courte sûre : le reste de
+l'intervalle minimal du capteur, compté depuis le *début* de la transaction
+ratée (pas 2 s de plus après l'erreur), ou un recul exponentiel pour
+``not_found``. Le nombre de transactions et la durée totale sont plafonnés,
+et ``RetryStats`` mesure le temps moyen jusqu'à une lecture valide.
+"""
+
+import time
+
+CHECKSUM = "checksum"
+TIMEOUT = "timeout"
+NOT_FOUND = "not_found"
+OTHER = "other"
+
+# Fragments des messages d'adafruit_dht → classe
+_MOTIFS = (
+    ("checksum", CHECKSUM),
+    ("unplausible", CHECKSUM),
+    ("full buffer", TIMEOUT),
+    ("timed out", TIMEOUT),
+    ("timeout", TIMEOUT),
+    ("not found", NOT_FOUND),
+)
+
+# Recul par classe : (attente de base en s, facteur par transaction ratée).
+# L'attente réelle n'est jamais plus courte que l'intervalle minimal.
+BACKOFF = {
+    CHECKSUM: (0.0, 1.0),
+    TIMEOUT: (0.0, 1.0),
+    NOT_FOUND: (4.0, 2.0),
+    OTHER: (0.0, 1.0),
+}
+
+# Le DHT22 échantillonne au plus toutes les 2 s, et adafruit_dht ignore les
+# appels à measure() moins de 2 s après le précédent : petite marge en plus
+INTERVALLE_MIN = 2.05
+
+
+def classify(error):
+    """
+    Classe une erreur de lecture du DHT22.
+
+    Returns:
+        str: ``CHECKSUM``, ``TIMEOUT``, ``NOT_FOUND`` ou ``OTHER``
+    """
+    message = str(error).lower()
+    for fragment, classe in _MOTIFS:
+        if fragment in message:
+            return classe
+    return OTHER
+
+
+class RetryStats:
+    """Statistiques des lectures : transactions, erreurs, temps jusqu'au succès."""
+
+    def __init__(self):
+        self.reads = 0
+        self.failures = 0
+        self.attempts = 0
+        self.errors = {classe: 0 for classe in BACKOFF}
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def record(self, attempts, elapsed_ns):
+        """Ajoute une lecture valide obtenue en ``attempts`` transactions."""
+        self.reads += 1
+        self.attempts += attempts
+        self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+
+    def record_failure(self, attempts):
+        """Ajoute une lecture abandonnée après ``attempts`` transactions."""
+        self.failures += 1
+        self.attempts += attempts
+
+    @property
+    def mean_ns(self):
+        """Temps moyen jusqu'à une lecture valide."""
+        return self.total_ns / self.reads if self.reads else 0.0
+
+    def as_dict(self):
+        """Retourne les statistiques sous forme de dictionnaire."""
+        return {
+            "reads": self.reads,
+            "failures": self.failures,
+            "attempts": self.attempts,
+            "errors": dict(self.errors),
+            "mean_time_to_valid_s": self.mean_ns / 1e9,
+            "max_time_to_valid_s": self.max_ns / 1e9,
+        }
+
+
+class RetryPolicy:
+    """
+    Exécute une transaction avec réessais adaptés à chaque erreur.
+
+    Une politique suit un seul capteur : elle retient le début de la
+    dernière transaction pour respecter l'intervalle minimal.
+
+    Args:
+        min_interval (float): Intervalle minimal entre deux transactions (s)
+        max_attempts (int): Transactions au plus par lecture
+        max_time (float): Durée maximale d'une lecture, attentes comprises (s)
+        backoff (dict): Recul par classe (voir ``BACKOFF``)
+        clock_ns: Horloge monotone en ns (par défaut ``time.monotonic_ns``)
+        sleep: Fonction d'attente en s (par défaut ``time.sleep``)
+    """
+
+    def __init__(self, min_interval=INTERVALLE_MIN, max_attempts=5, max_time=10.0,
+                 backoff=None, clock_ns=None, sleep=None):
+        self.min_interval_ns = int(min_interval * 1e9)
+        self.max_attempts = max_attempts
+        self.max_time_ns = int(max_time * 1e9)
+        self.backoff = dict(BACKOFF if backoff is None else backoff)
+        self.clock_ns = clock_ns if clock_ns is not None else time.monotonic_ns
+        self.sleep_func = sleep if sleep is not None else time.sleep
+        self.stats = RetryStats()
+        self.last_attempt_ns = None
+        self._last_failed = False
+
+    def delay_ns(self, classe, failures):
+        """
+        Attente avant la prochaine transaction.
+
+        Args:
+            classe (str): Classe de la dernière erreur
+            failures (int): Transactions ratées de suite dans cette lecture
+
+        Returns:
+            int: Attente en ns depuis maintenant
+        """
+        base, facteur = self.backoff.get(classe, self.backoff[OTHER])
+        recul = int(base * facteur ** (failures - 1) * 1e9)
+        return max(recul, self._reste_intervalle())
+
+    def _reste_intervalle(self):
+        if self.last_attempt_ns is None:
+            return 0
+        return max(0, self.last_attempt_ns + self.min_interval_ns - self.clock_ns())
+
+    def run(self, transaction):
+        """
+        Appelle ``transaction()`` jusqu'au succès ou à l'épuisement.
+
+        Returns:
+            tuple: (résultat, nombre de transactions)
+
+        Raises:
+            RuntimeError: Erreur de la dernière transaction
+        """
+        debut = self.clock_ns()
+        echeance = debut + self.max_time_ns
+        if self._last_failed:
+            # La transaction ratée précédente a laissé des valeurs périmées
+            self.sleep_func(self._reste_intervalle() / 1e9)
+        tentative = 0
+        while True:
+            tentative += 1
+            self.last_attempt_ns = self.clock_ns()
+            try:
+                resultat = transaction()
+            except RuntimeError as e:
+                self._last_failed = True
+                classe = classify(e)
+                self.stats.errors[classe] = self.stats.errors.get(classe, 0) + 1
+                attente = self.delay_ns(classe, tentative)
+                if tentative >= self.max_attempts or self.clock_ns() + attente > echeance:
+                    self.stats.record_failure(tentative)
+                    raise
+                self.sleep_func(attente / 1e9)
+                continue
+            self._last_failed = False
+            self.stats.record(tentative, self.clock_ns() - debut)
+            return resultat, tentative
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Sorties chaînées par registres à décalage 74HC595, poussées par SPI.
+
+Au lieu d'une broche GPIO par LED, une chaîne de 74HC595 reçoit toute la
+trame en un seul transfert ``spidev`` :
+
+- MOSI (GPIO 10) → SER du premier registre
+- SCLK (GPIO 11) → SRCLK de tous les registres
+- CE0  (GPIO 8)  → RCLK de tous les registres (le front montant en fin de
+  transfert verrouille les sorties, toutes en même temps)
+- QH' de chaque registre → SER du suivant
+
+La sortie i correspond au bit i de la trame : registre i // 8, broche
+Q(i % 8). Le premier octet envoyé finit dans le dernier registre de la
+chaîne ; le tampon est donc rangé dans l'ordre du transfert, ce qui revient
+à écrire la trame en gros-boutiste (``int.to_bytes(n, "big")``).
+"""
+
+
+class ShiftRegisterChain:
+    """
+    Tampon de trame d'une chaîne de 74HC595.
+
+    Args:
+        outputs (int): Nombre de sorties (multiple de 8)
+        spi: Objet ``spidev.SpiDev`` ouvert (sinon ouvert sur bus/device)
+        bus (int): Bus SPI
+        device (int): Chip select (0 → CE0)
+        speed_hz (int): Fréquence d'horloge SPI
+    """
+
+    def __init__(self, outputs, spi=None, bus=0, device=0, speed_hz=8_000_000):
+        if outputs <= 0 or outputs % 8:
+            raise ValueError("Le nombre de sorties doit être un multiple de 8")
+        self.outputs = outputs
+        self.buffer = bytearray(outputs // 8)
+        if spi is None:
+            import spidev
+            spi = spidev.SpiDev()
+            spi.open(bus, device)
+            spi.mode = 0
+        spi.max_speed_hz = speed_hz
+        self.spi = spi
+
+    def __len__(self):
+        return self.outputs
+
+    def _position(self, index):
+        if not 0 <= index < self.outputs:
+            raise IndexError(f"Sortie {index} hors de la chaîne ({self.outputs})")
+        return len(self.buffer) - 1 - (index >> 3), 1 << (index & 7)
+
+    def __getitem__(self, index):
+        octet, bit = self._position(index)
+        return int(bool(self.buffer[octet] & bit))
+
+    def __setitem__(self, index, value):
+        octet, bit = self._position(index)
+        if value:
+            self.buffer[octet] |= bit
+        else:
+            self.buffer[octet] &= ~bit
+
+    @property
+    def frame(self):
+        """Trame courante (bit i = sortie i)."""
+        return int.from_bytes(self.buffer, "big")
+
+    def write(self, frame):
+        """Remplace tout le tampon par une trame et l'envoie."""
+        self.buffer[:] = frame.to_bytes(len(self.buffer), "big")
+        self.show()
+
+    def show(self):
+        """Envoie le tampon en un seul transfert SPI."""
+        self.spi.writebytes2(self.buffer)
+
+    def close(self):
+        """Ferme le périphérique SPI."""
+        self.spi.close()
+
+
+class ShiftRegisterDriver:
+    """
+    Pilote ``PinBank`` sur une chaîne de 74HC595.
+
+    Le bit i de la trame pilote la sortie i de la chaîne, quel que soit
+    le numéro de la broche correspondante : avec ``LEDS = [17, 27, 22]``
+    (``GPIO_BACKEND=spi595``), rouge → Q0, verte → Q1, jaune → Q2 du
+    premier registre. Pour une grande chaîne, numéroter les « broches »
+    comme les sorties : ``PinBank(range(256), ShiftRegisterDriver(range(256)))``.
+
+    Args:
+        pins (sequence): Broches de la banque, dans l'ordre des sorties
+        chain (ShiftRegisterChain): Chaîne existante (sinon une nouvelle,
+            arrondie au multiple de 8 supérieur)
+    """
+
+    def __init__(self, pins, chain=None):
+        self.pins = tuple(pins)
+        if len(set(self.pins)) != len(self.pins):
+            raise ValueError("Chaque broche ne peut piloter qu'une sortie")
+        if chain is None:
+            chain = ShiftRegisterChain((len(self.pins) + 7) // 8 * 8)
+        self.chain = chain
+        self._frame = chain.frame
+
+    def apply(self, set_mask, clear_mask):
+        """Met à jour la trame et l'envoie en un transfert."""
+        self._frame = (self._frame | set_mask) & ~clear_mask
+        self.chain.write(self._frame)
+
+    def close(self):
+        """Ferme la chaîne."""
+        self.chain.close()
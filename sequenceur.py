@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Séquenceur à échéances absolues pour les effets de LEDs.
+
+Avec ``time.sleep(delai)``, chaque étape ajoute le temps passé dans
+``print`` et ``GPIO.output`` : la période dérive vers le haut. Le séquenceur
+calcule plutôt chaque échéance à partir de la précédente
+(``échéance += délai``) et dort jusqu'à cette échéance, mesurée avec
+``time.monotonic_ns()``. Un retard à une étape raccourcit automatiquement
+l'attente suivante : après des heures, un chenillard à 0.1 s reste à 0.1 s.
+
+Exemple :
+
+    seq = Sequencer()
+    while True:
+        GPIO.output(LED_ROUGE, GPIO.HIGH)
+        seq.sleep(0.1)          # au lieu de time.sleep(0.1)
+"""
+
+import time
+
+
+class LatenessStats:
+    """Statistiques de retard au réveil (en nanosecondes)."""
+
+    def __init__(self):
+        self.steps = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.late_steps = 0
+        self.resyncs = 0
+
+    def record(self, lateness_ns, tolerance_ns):
+        """Ajoute le retard mesuré pour une étape."""
+        self.steps += 1
+        self.total_ns += lateness_ns
+        if lateness_ns > self.max_ns:
+            self.max_ns = lateness_ns
+        if lateness_ns > tolerance_ns:
+            self.late_steps += 1
+
+    @property
+    def mean_ns(self):
+        """Retard moyen par étape."""
+        return self.total_ns / self.steps if self.steps else 0.0
+
+    def as_dict(self):
+        """Retourne les statistiques sous forme de dictionnaire."""
+        return {
+            "steps": self.steps,
+            "mean_ns": self.mean_ns,
+            "max_ns": self.max_ns,
+            "late_steps": self.late_steps,
+            "resyncs": self.resyncs,
+        }
+
+
+class Sequencer:
+    """
+    Remplace ``time.sleep`` par une attente jusqu'à une échéance absolue.
+
+    Args:
+        resync_after (float): Si une étape se réveille avec plus de retard
+            que ce seuil (en secondes), on repart de l'instant présent au
+            lieu d'enchaîner les étapes en rafale pour rattraper
+        tolerance (float): Retard (en secondes) au-delà duquel une étape
+            est comptée comme en retard
+        clock_ns: Horloge monotone en nanosecondes
+            (par défaut ``time.monotonic_ns``)
+        sleep: Fonction d'attente en secondes (par défaut ``time.sleep``)
+    """
+
+    def __init__(self, resync_after=1.0, tolerance=0.001,
+                 clock_ns=None, sleep=None):
+        self.resync_after_ns = int(resync_after * 1e9)
+        self.tolerance_ns = int(tolerance * 1e9)
+        self.clock_ns = clock_ns if clock_ns is not None else time.monotonic_ns
+        self.sleep_func = sleep if sleep is not None else time.sleep
+        self.stats = LatenessStats()
+        self.deadline_ns = None
+        self.last_lateness_ns = 0
+
+    def start(self):
+        """Fixe l'origine des échéances à l'instant présent."""
+        self.deadline_ns = self.clock_ns()
+
+    def sleep(self, delai):
+        """
+        Attend jusqu'à l'échéance suivante (précédente + ``delai``).
+
+        Args:
+            delai (float): Durée de l'étape en secondes
+
+        Returns:
+            int: Retard au réveil par rapport à l'échéance, en ns
+        """
+        if self.deadline_ns is None:
+            self.start()
+        self.deadline_ns += int(delai * 1e9)
+
+        restant = self.deadline_ns - self.clock_ns()
+        if restant > 0:
+            self.sleep_func(restant / 1e9)
+
+        retard = self.clock_ns() - self.deadline_ns
+        if retard < 0:
+            retard = 0
+        self.stats.record(retard, self.tolerance_ns)
+        self.last_lateness_ns = retard
+
+        if retard > self.resync_after_ns:
+            # Trop en retard (processus suspendu, etc.) : on se recale
+            self.deadline_ns += retard
+            self.stats.resyncs += 1
+        return retard
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Série temporelle des mesures en tampon circulaire à tableaux contigus.
+
+Des semaines de mesures toutes les 2 s ne tiennent pas dans une liste de
+``float`` et de ``datetime`` sur un Pi à 512 Mo (plus de 100 octets par
+mesure). Ici, trois tableaux préalloués à capacité fixe :
+
+- instants en ns : int64 (``array("q")``), 8 octets
+- température : float32 (``array("f")``), 4 octets
+- humidité : float32 (``array("f")``), 4 octets
+
+soit 16 octets par échantillon : **16 Mo par million d'échantillons**
+(une semaine à 2 s = 302 400 échantillons ≈ 4,8 Mo). Le float32 garde
+largement la résolution du DHT22 (0,1 °C, 0,1 %RH).
+
+L'ajout est en O(1) : une écriture à l'index courant, la plus ancienne
+mesure est écrasée une fois la capacité atteinte. Les fenêtres sont des
+vues sans copie (``memoryview``, ou tableaux NumPy si installé) ; une
+fenêtre qui chevauche la fin du tampon se compose de deux segments.
+
+Exemple :
+
+    serie = RingSeries(302_400)
+    serie.append_reading(dht22.read())
+    instants, temperature, humidite = serie.window(debut_ns, fin_ns)
+"""
+
+from array import array
+from bisect import bisect_left
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+OCTETS_PAR_ECHANTILLON = 8 + 4 + 4
+
+
+class RingSeries:
+    """
+    Tampon circulaire (instant, température, humidité) à capacité fixe.
+
+    Les instants sont ceux de ``Reading.timestamp`` (``time.time_ns()``) :
+    ils peuvent reculer (NTP, heure réglée à la main). Un tel échantillon
+    est gardé et compté dans ``out_of_order``. Tant que les échantillons
+    gardés sont triés, les fenêtres sont cherchées par dichotomie ; sinon
+    par un parcours complet.
+
+    Args:
+        capacity (int): Nombre maximal d'échantillons gardés
+    """
+
+    def __init__(self, capacity):
+        if capacity <= 0:
+            raise ValueError("La capacité doit être positive")
+        self.capacity = capacity
+        self.timestamps = array("q", bytes(8 * capacity))
+        self.temperature = array("f", bytes(4 * capacity))
+        self.humidity = array("f", bytes(4 * capacity))
+        self._debut = 0
+        self._taille = 0
+        self.out_of_order = 0
+        # Paires voisines décroissantes parmi les échantillons gardés
+        self._reculs = 0
+
+    def __len__(self):
+        return self._taille
+
+    @property
+    def memory_bytes(self):
+        """Mémoire occupée par les tableaux (fixe, quel que soit le remplissage)."""
+        return OCTETS_PAR_ECHANTILLON * self.capacity
+
+    def append(self, timestamp, temperature, humidity):
+        """
+        Ajoute un échantillon (écrase le plus ancien si le tampon est plein).
+
+        Un instant antérieur au dernier échantillon est accepté (horloge
+        murale reculée) et compté dans ``out_of_order``.
+        """
+        ts = self.timestamps
+        if self._taille and timestamp < ts[self._index(self._taille - 1)]:
+            self.out_of_order += 1
+            # À capacité 1, le nouvel échantillon remplace seul le précédent :
+            # aucune paire voisine n'est gardée
+            if self.capacity > 1:
+                self._reculs += 1
+        if self._taille < self.capacity:
+            i = self._index(self._taille)
+            self._taille += 1
+        else:
+            i = self._debut
+            self._debut = (self._debut + 1) % self.capacity
+            # Le plus ancien sort : sa paire avec le suivant aussi
+            if self.capacity > 1 and ts[self._debut] < ts[i]:
+                self._reculs -= 1
+        self.timestamps[i] = timestamp
+        self.temperature[i] = temperature
+        self.humidity[i] = humidity
+
+    def append_reading(self, reading):
+        """Ajoute une ``dht22.Reading``."""
+        self.append(reading.timestamp, reading.temperature, reading.humidity)
+
+    def latest(self):
+        """Dernier échantillon ``(instant, température, humidité)``, ou None."""
+        if not self._taille:
+            return None
+        i = self._index(self._taille - 1)
+        return self.timestamps[i], self.temperature[i], self.humidity[i]
+
+    def __iter__(self):
+        for instants, temperatures, humidites in self.segments():
+            yield from zip(instants, temperatures, humidites)
+
+    def _index(self, rang):
+        return (self._debut + rang) % self.capacity
+
+    def _rang(self, instant):
+        """Rang du premier échantillon dont l'instant est >= ``instant``."""
+        n, debut, cap = self._taille, self._debut, self.capacity
+        ts = self.timestamps
+        # Dichotomie sur les rangs : 1 ou 2 tranches contiguës
+        fin_premiere = min(n, cap - debut)
+        if fin_premiere and instant <= ts[debut + fin_premiere - 1]:
+            return bisect_left(ts, instant, debut, debut + fin_premiere) - debut
+        return fin_premiere + bisect_left(ts, instant, 0, n - fin_premiere)
+
+    def _tranches(self, start_ns, end_ns):
+        """Tranches ``(a, b)`` d'index de ``[start_ns, end_ns[`` (instants triés)."""
+        premier = 0 if start_ns is None else self._rang(start_ns)
+        dernier = self._taille if end_ns is None else self._rang(end_ns)
+        if premier >= dernier:
+            return []
+        debut = self._index(premier)
+        fin = debut + (dernier - premier)
+        if fin <= self.capacity:
+            return [(debut, fin)]
+        return [(debut, self.capacity), (0, fin - self.capacity)]
+
+    def _tranches_filtrees(self, start_ns, end_ns):
+        """Tranches ``(a, b)`` d'index retenus par un parcours complet."""
+        ts = self.timestamps
+        tranches = []
+        a = b = None
+        for rang in range(self._taille):
+            i = self._index(rang)
+            t = ts[i]
+            garde = ((start_ns is None or t >= start_ns)
+                     and (end_ns is None or t < end_ns))
+            # Une tranche s'arrête à un rejet ou au retour à l'index 0
+            if a is not None and (not garde or i == 0):
+                tranches.append((a, b))
+                a = None
+            if garde:
+                if a is None:
+                    a = i
+                b = i + 1
+        if a is not None:
+            tranches.append((a, b))
+        return tranches
+
+    def segments(self, start_ns=None, end_ns=None):
+        """
+        Vues sans copie des échantillons de ``[start_ns, end_ns[``.
+
+        Args:
+            start_ns (int): Premier instant inclus (le plus ancien par défaut)
+            end_ns (int): Instant exclu (jusqu'au plus récent par défaut)
+
+        Returns:
+            list: Triplets ``(instants, températures, humidités)`` de
+            ``memoryview``, dans l'ordre d'ajout : 0 à 2 si les instants
+            sont triés, davantage si l'horloge a reculé
+        """
+        if self._reculs and (start_ns is not None or end_ns is not None):
+            tranches = self._tranches_filtrees(start_ns, end_ns)
+        else:
+            tranches = self._tranches(start_ns, end_ns)
+        vues = (memoryview(self.timestamps), memoryview(self.temperature),
+                memoryview(self.humidity))
+        return [tuple(v[a:b] for v in vues) for a, b in tranches]
+
+    def window(self, start_ns=None, end_ns=None):
+        """
+        Échantillons de ``[start_ns, end_ns[`` en trois tableaux.
+
+        Avec NumPy, ce sont des vues int64/float32 sans copie, sauf si la
+        fenêtre chevauche la fin du tampon ou si l'horloge a reculé (les
+        segments sont alors concaténés). Sans NumPy, des ``array`` copiés.
+
+        Returns:
+            tuple: (instants, températures, humidités)
+        """
+        segments = self.segments(start_ns, end_ns)
+        if np is not None:
+            if len(segments) == 1:
+                return tuple(np.asarray(v) for v in segments[0])
+            if not segments:
+                return (np.empty(0, np.int64), np.empty(0, np.float32),
+                        np.empty(0, np.float32))
+            return tuple(np.concatenate([np.asarray(s[k]) for s in segments])
+                         for k in range(3))
+        resultat = (array("q"), array("f"), array("f"))
+        for segment in segments:
+            for tableau, vue in zip(resultat, segment):
+                tableau.frombytes(vue.tobytes())
+        return resultat
@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+Simulateur GPIO en mémoire avec horloge virtuelle.
+
+Permet d'exécuter les scripts de LEDs sans Raspberry Pi et sans attendre :
+``RPi.GPIO`` est remplacé par ``SimulatedGPIO`` et ``time.sleep`` fait
+simplement avancer une horloge virtuelle. Les 100 itérations de labo1.py
+(30 s réelles) se terminent en quelques millisecondes, et chaque changement
+d'état des broches est enregistré avec son instant exact.
+
+Usage:
+    python3 simulateur.py labo1.py
+    python3 simulateur.py led_rgb.py --duree 10 --timeline
+    python3 simulateur.py led_rgb.py --temps-reel 0
+
+Depuis Python :
+
+    with simulation(duree=5.0) as sim:
+        runpy.run_path("led_simple.py", run_name="__main__")
+    print(sim.gpio.history)
+"""
+
+import argparse
+import os
+import runpy
+import sys
+import time
+import types
+from contextlib import contextmanager
+from pathlib import Path
+
+
+class VirtualClock:
+    """
+    Horloge virtuelle : ``sleep()`` avance le temps instantanément.
+
+    Args:
+        limit (float): Durée virtuelle maximale en secondes. Au-delà,
+            ``sleep()`` lève KeyboardInterrupt, comme un Ctrl+C, pour
+            arrêter proprement les scripts qui bouclent à l'infini.
+    """
+
+    def __init__(self, limit=None):
+        self.now_ns = 0
+        self.limit_ns = None if limit is None else int(limit * 1e9)
+        self._epoch = time.time()
+
+    def sleep(self, secondes):
+        if secondes < 0:
+            raise ValueError("sleep length must be non-negative")
+        self.now_ns += int(secondes * 1e9)
+        if self.limit_ns is not None and self.now_ns >= self.limit_ns:
+            self.now_ns = self.limit_ns
+            raise KeyboardInterrupt("fin de la simulation")
+
+    def monotonic_ns(self):
+        return self.now_ns
+
+    def monotonic(self):
+        return self.now_ns / 1e9
+
+    def time(self):
+        return self._epoch + self.now_ns / 1e9
+
+
+class WallClock:
+    """
+    Horloge réelle, même interface que ``VirtualClock``.
+
+    Sert à instrumenter une exécution en temps réel : ``SimulatedGPIO``
+    horodate alors chaque changement avec ``time.monotonic_ns()``, compté
+    depuis la création de l'horloge.
+
+    Args:
+        limit (float): Durée réelle maximale en secondes (KeyboardInterrupt
+            au premier ``sleep()`` qui la dépasse)
+    """
+
+    def __init__(self, limit=None):
+        # Fonctions d'origine, prises avant que simulation() ne remplace sleep
+        self._sleep = time.sleep
+        self._monotonic_ns = time.monotonic_ns
+        self._origin = self._monotonic_ns()
+        self.limit_ns = None if limit is None else int(limit * 1e9)
+
+    @property
+    def now_ns(self):
+        return self._monotonic_ns() - self._origin
+
+    def sleep(self, secondes):
+        self._sleep(secondes)
+        if self.limit_ns is not None and self.now_ns >= self.limit_ns:
+            raise KeyboardInterrupt("fin de la mesure")
+
+
+class SimulatedGPIO(types.ModuleType):
+    """
+    Remplaçant de ``RPi.GPIO`` : mêmes constantes et mêmes fonctions.
+
+    Attributes:
+        state (dict): Broche → valeur courante (0 ou 1)
+        history (list): ``(instant_ns, broche, valeur)`` à chaque changement
+        pwm_history (list): ``(instant_ns, broche, rapport_cyclique)``
+        writes (int): Nombre d'écritures de broche (changement ou non)
+    """
+
+    BCM = 11
+    BOARD = 10
+    OUT = 0
+    IN = 1
+    LOW = 0
+    HIGH = 1
+    PUD_OFF = 20
+    PUD_DOWN = 21
+    PUD_UP = 22
+    RPI_INFO = {"TYPE": "Simulateur"}
+
+    def __init__(self, clock):
+        super().__init__("RPi.GPIO")
+        self.clock = clock
+        self.mode = None
+        self.modes = {}
+        self.state = {}
+        self.history = []
+        self.pwm_history = []
+        self.writes = 0
+
+    def setwarnings(self, flag):
+        pass
+
+    def setmode(self, mode):
+        if self.mode is not None and mode != self.mode:
+            raise ValueError("A different mode has already been set!")
+        self.mode = mode
+
+    def getmode(self):
+        return self.mode
+
+    def setup(self, channel, direction, pull_up_down=None, initial=None):
+        if self.mode is None:
+            raise RuntimeError("Please set pin numbering mode using "
+                               "GPIO.setmode(GPIO.BOARD) or GPIO.setmode(GPIO.BCM)")
+        instant = self.clock.now_ns
+        for pin in _liste(channel):
+            self.modes[pin] = direction
+            if direction == self.OUT:
+                self._set(pin, 0 if initial is None else int(bool(initial)), instant)
+
+    def output(self, channel, value):
+        canaux = _liste(channel)
+        valeurs = _liste(value)
+        if len(valeurs) == 1:
+            valeurs = valeurs * len(canaux)
+        if len(valeurs) != len(canaux):
+            raise RuntimeError("Number of channels != number of values")
+        # Un seul horodatage par appel : une trame reste un seul instant
+        instant = self.clock.now_ns
+        for pin, valeur in zip(canaux, valeurs):
+            if self.modes.get(pin) != self.OUT:
+                raise RuntimeError("The GPIO channel has not been set up as an OUTPUT")
+            self.writes += 1
+            self._set(pin, int(bool(valeur)), instant)
+
+    def input(self, channel):
+        if channel not in self.modes:
+            raise RuntimeError("You must setup() the GPIO channel first")
+        return self.state.get(channel, 0)
+
+    def cleanup(self, channel=None):
+        canaux = list(self.modes) if channel is None else _liste(channel)
+        for pin in canaux:
+            if self.state.get(pin):
+                self._set(pin, 0)
+            self.modes.pop(pin, None)
+        if channel is None:
+            self.mode = None
+
+    def PWM(self, channel, frequency):
+        if self.modes.get(channel) != self.OUT:
+            raise RuntimeError("You must setup() the GPIO channel as an output first")
+        return SimulatedPWM(self, channel, frequency)
+
+    def _set(self, pin, valeur, instant=None):
+        if self.state.get(pin) != valeur:
+            self.state[pin] = valeur
+            if instant is None:
+                instant = self.clock.now_ns
+            self.history.append((instant, pin, valeur))
+
+    def timeline(self, pins=None):
+        """
+        Retourne l'historique sous forme de trames.
+
+        Args:
+            pins (sequence): Broches dans l'ordre des bits (toutes par défaut)
+
+        Returns:
+            list: ``[(instant_ns, trame), ...]``, une entrée par instant
+        """
+        if pins is None:
+            pins = sorted({pin for _, pin, _ in self.history})
+        bits = {pin: 1 << i for i, pin in enumerate(pins)}
+        trame = 0
+        trames = []
+        for instant, pin, valeur in self.history:
+            if pin not in bits:
+                continue
+            trame = trame | bits[pin] if valeur else trame & ~bits[pin]
+            if trames and trames[-1][0] == instant:
+                trames[-1] = (instant, trame)
+            else:
+                trames.append((instant, trame))
+        return trames
+
+
+class SimulatedPWM:
+    """Remplaçant de ``RPi.GPIO.PWM`` : note chaque rapport cyclique."""
+
+    def __init__(self, gpio, pin, frequency):
+        self._gpio = gpio
+        self.pin = pin
+        self.frequency = frequency
+        self.duty = None
+
+    def start(self, duty):
+        self.ChangeDutyCycle(duty)
+
+    def ChangeDutyCycle(self, duty):
+        if not 0.0 <= duty <= 100.0:
+            raise ValueError("dutycycle must have a value from 0.0 to 100.0")
+        self.duty = duty
+        self._gpio.pwm_history.append((self._gpio.clock.now_ns, self.pin, duty))
+
+    def ChangeFrequency(self, frequency):
+        self.frequency = frequency
+
+    def stop(self):
+        self.duty = None
+        self._gpio._set(self.pin, 0)
+
+
+def _liste(valeur):
+    if isinstance(valeur, (list, tuple)):
+        return list(valeur)
+    return [valeur]
+
+
+class Simulation:
+    """
+    Horloge et GPIO simulé d'une exécution.
+
+    Args:
+        limit (float): Durée maximale en secondes
+        realtime (bool): Horloge réelle (``WallClock``) au lieu de virtuelle
+    """
+
+    def __init__(self, limit=None, realtime=False):
+        self.clock = WallClock(limit) if realtime else VirtualClock(limit)
+        self.gpio = SimulatedGPIO(self.clock)
+
+
+# Fonctions du module time remplacées pendant la simulation
+_HORLOGES = ("sleep", "monotonic", "monotonic_ns", "time")
+
+
+@contextmanager
+def simulation(duree=None, realtime=False):
+    """
+    Installe le simulateur le temps d'un bloc ``with``.
+
+    ``RPi.GPIO`` devient un ``SimulatedGPIO``, les fonctions d'horloge du
+    module ``time`` passent sur l'horloge virtuelle et ``GPIO_BACKEND`` vaut
+    ``rpi`` pour que ``PinBank`` écrive aussi dans le simulateur (et jamais
+    dans les registres, même sur un vrai Pi).
+
+    Avec ``realtime=True``, le temps s'écoule normalement : seul
+    ``time.sleep`` est remplacé, pour arrêter l'exécution après ``duree``.
+    L'historique donne alors les instants réels des transitions.
+
+    Args:
+        duree (float): Durée maximale (voir ``VirtualClock``)
+        realtime (bool): Exécuter en temps réel (voir ``WallClock``)
+
+    Yields:
+        Simulation
+    """
+    sim = Simulation(duree, realtime)
+    horloges_remplacees = ("sleep",) if realtime else _HORLOGES
+    rpi = types.ModuleType("RPi")
+    rpi.GPIO = sim.gpio
+
+    modules = {nom: sys.modules.get(nom) for nom in ("RPi", "RPi.GPIO")}
+    horloges = {nom: getattr(time, nom) for nom in horloges_remplacees}
+    backend = os.environ.get("GPIO_BACKEND")
+
+    sys.modules["RPi"] = rpi
+    sys.modules["RPi.GPIO"] = sim.gpio
+    for nom in horloges_remplacees:
+        setattr(time, nom, getattr(sim.clock, nom))
+    os.environ["GPIO_BACKEND"] = "rpi"
+    try:
+        yield sim
+    finally:
+        for nom, fonction in horloges.items():
+            setattr(time, nom, fonction)
+        for nom, module in modules.items():
+            if module is None:
+                sys.modules.pop(nom, None)
+            else:
+                sys.modules[nom] = module
+        if backend is None:
+            os.environ.pop("GPIO_BACKEND", None)
+        else:
+            os.environ["GPIO_BACKEND"] = backend
+
+
+def run_script(path, duree=None, args=()):
+    """
+    Exécute un script de LEDs dans le simulateur.
+
+    Args:
+        path (str): Chemin du script (ex. ``labo1.py``)
+        duree (float): Durée virtuelle maximale
+        args (sequence): Arguments passés au script (``sys.argv[1:]``)
+
+    Returns:
+        Simulation: Horloge et historique des broches après l'exécution
+    """
+    path = Path(path).resolve()
+    argv = sys.argv
+    sys.argv = [str(path), *args]
+    sys.path.insert(0, str(path.parent))
+    try:
+        with simulation(duree) as sim:
+            try:
+                runpy.run_path(str(path), run_name="__main__")
+            except KeyboardInterrupt:
+                pass
+    finally:
+        sys.path.remove(str(path.parent))
+        sys.argv = argv
+    return sim
+
+
+def main():
+    """Point d'entrée en ligne de commande."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("script", help="Script à simuler (ex. labo1.py)")
+    parser.add_argument("--duree", type=float, default=60.0,
+                        help="Durée virtuelle maximale en secondes (défaut: 60)")
+    parser.add_argument("--timeline", action="store_true",
+                        help="Afficher chaque changement d'état")
+    # Les options inconnues sont transmises au script
+    args, extra = parser.parse_known_args()
+
+    debut = time.perf_counter()
+    sim = run_script(args.script, args.duree, extra)
+    reel = time.perf_counter() - debut
+
+    if args.timeline:
+        for instant, pin, valeur in sim.gpio.history:
+            print(f"{instant / 1e9:12.6f} s  GPIO {pin:<2} {'HIGH' if valeur else 'LOW'}")
+    print(f"Temps virtuel: {sim.clock.now_ns / 1e9:.3f} s, "
+          f"temps réel: {reel * 1000:.1f} ms, "
+          f"changements: {len(sim.gpio.history)}, écritures: {sim.gpio.writes}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Mode temps réel (optionnel) pour la lecture des motifs de LEDs.
+
+Sur un Pi chargé, ``time.sleep`` peut se réveiller avec plusieurs
+millisecondes de retard. Ce mode :
+
+1. épingle le processus sur un cœur (``os.sched_setaffinity``) ;
+2. demande l'ordonnancement ``SCHED_FIFO`` (priorité temps réel) ;
+3. verrouille la mémoire (``mlockall``) pour éviter les défauts de page.
+
+Chaque étape peut échouer sans privilèges (ex. hors ``sudo`` ou sans
+``CAP_SYS_NICE`` / ``RLIMIT_MEMLOCK``) : on continue avec ce qui a été
+obtenu, et le rapport indique la politique réellement en vigueur.
+
+Exemple :
+
+    with realtime(cpu=3) as rapport:
+        print(rapport)
+        play(timeline, banque)
+"""
+
+import os
+from contextlib import contextmanager
+
+MCL_CURRENT = 1
+MCL_FUTURE = 2
+
+_POLITIQUES = {
+    getattr(os, nom): nom
+    for nom in ("SCHED_OTHER", "SCHED_FIFO", "SCHED_RR", "SCHED_BATCH", "SCHED_IDLE")
+    if hasattr(os, nom)
+}
+
+
+def _libc():
+    # ctypes n'est chargé qu'ici : importer ce module reste léger
+    import ctypes
+    import ctypes.util
+
+    nom = ctypes.util.find_library("c")
+    return ctypes.CDLL(nom, use_errno=True) if nom else None
+
+
+class RealtimeReport:
+    """
+    Ce que le mode temps réel a réellement obtenu.
+
+    Attributes:
+        cpus (set): Cœurs autorisés après l'épinglage
+        policy (str): Politique d'ordonnancement en vigueur
+        priority (int): Priorité temps réel (0 hors SCHED_FIFO/RR)
+        memory_locked (bool): ``mlockall`` a réussi
+        errors (list): Étapes refusées et raison
+    """
+
+    def __init__(self):
+        self.cpus = set()
+        self.policy = "inconnue"
+        self.priority = 0
+        self.memory_locked = False
+        self.errors = []
+
+    def as_dict(self):
+        """Retourne le rapport sous forme de dictionnaire."""
+        return {
+            "cpus": sorted(self.cpus),
+            "policy": self.policy,
+            "priority": self.priority,
+            "memory_locked": self.memory_locked,
+            "errors": list(self.errors),
+        }
+
+    def __str__(self):
+        cpus = ",".join(str(c) for c in sorted(self.cpus)) or "?"
+        texte = (f"Politique: {self.policy} (priorité {self.priority}), "
+                 f"cœurs: {cpus}, mémoire verrouillée: "
+                 f"{'oui' if self.memory_locked else 'non'}")
+        for erreur in self.errors:
+            texte += f"\n  - {erreur}"
+        return texte
+
+
+def enter_realtime(cpu=None, priority=50, lock_memory=True):
+    """
+    Passe le processus courant en mode temps réel, au mieux.
+
+    Args:
+        cpu (int): Cœur sur lequel épingler (aucun épinglage si None)
+        priority (int): Priorité SCHED_FIFO (1 à 99)
+        lock_memory (bool): Verrouiller la mémoire avec mlockall
+
+    Returns:
+        tuple: (RealtimeReport, état précédent pour ``leave_realtime``)
+    """
+    rapport = RealtimeReport()
+    precedent = {}
+
+    if cpu is not None:
+        try:
+            precedent["cpus"] = os.sched_getaffinity(0)
+            os.sched_setaffinity(0, {cpu})
+        except (OSError, AttributeError) as e:
+            precedent.pop("cpus", None)
+            rapport.errors.append(f"épinglage sur le cœur {cpu}: {e}")
+
+    if priority:
+        try:
+            precedent["policy"] = (os.sched_getscheduler(0), os.sched_getparam(0))
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+        except (OSError, AttributeError) as e:
+            precedent.pop("policy", None)
+            rapport.errors.append(f"SCHED_FIFO priorité {priority}: {e}")
+
+    if lock_memory:
+        libc = _libc()
+        if libc is None:
+            rapport.errors.append("mlockall: libc introuvable")
+        elif libc.mlockall(MCL_CURRENT | MCL_FUTURE) != 0:
+            import ctypes
+
+            erreur = ctypes.get_errno()
+            rapport.errors.append(f"mlockall: {os.strerror(erreur)}")
+        else:
+            rapport.memory_locked = True
+            precedent["mlock"] = True
+
+    _constater(rapport)
+    return rapport, precedent
+
+
+def leave_realtime(precedent):
+    """Rétablit l'affinité, la politique et la mémoire d'avant."""
+    if "mlock" in precedent:
+        libc = _libc()
+        if libc is not None:
+            libc.munlockall()
+    if "policy" in precedent:
+        politique, param = precedent["policy"]
+        try:
+            os.sched_setscheduler(0, politique, param)
+        except OSError:
+            pass
+    if "cpus" in precedent:
+        try:
+            os.sched_setaffinity(0, precedent["cpus"])
+        except OSError:
+            pass
+
+
+def _constater(rapport):
+    """Relit ce que le noyau applique vraiment."""
+    try:
+        rapport.cpus = set(os.sched_getaffinity(0))
+    except (OSError, AttributeError):
+        pass
+    try:
+        politique = os.sched_getscheduler(0)
+        rapport.policy = _POLITIQUES.get(politique, str(politique))
+        rapport.priority = os.sched_getparam(0).sched_priority
+    except (OSError, AttributeError):
+        pass
+
+
+@contextmanager
+def realtime(cpu=None, priority=50, lock_memory=True):
+    """
+    Contexte ``with realtime(...) as rapport:`` (voir ``enter_realtime``).
+
+    Yields:
+        RealtimeReport
+    """
+    rapport, precedent = enter_realtime(cpu, priority, lock_memory)
+    try:
+        yield rapport
+    finally:
+        leave_realtime(precedent)
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Tests de la base SQLite écrite par lots (base_mesures.py).
+"""
+
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from base_mesures import SQLiteWriter, query
+from dht22 import Reading
+
+
+def mesure(i):
+    """Mesure i : instant 10*i, température i, humidité 2*i."""
+    return Reading(float(i), float(2 * i), 10 * i, 1)
+
+
+# ---------------------------------------------------------------------------
+# Lots
+# ---------------------------------------------------------------------------
+def test_commit_par_nombre(tmp_path):
+    base = tmp_path / "mesures.db"
+    with SQLiteWriter(base, batch_size=4, max_age=3600) as ecrivain:
+        for i in range(8):
+            ecrivain.append(mesure(i))
+        ecrivain.flush(timeout=5)
+        assert ecrivain.commits == 2
+        assert ecrivain.written == 8
+
+
+def test_commit_par_age(tmp_path):
+    base = tmp_path / "mesures.db"
+    with SQLiteWriter(base, batch_size=1000, max_age=0.05) as ecrivain:
+        ecrivain.append(mesure(1))
+        limite = time.monotonic() + 5
+        while not ecrivain.commits and time.monotonic() < limite:
+            time.sleep(0.01)
+        assert ecrivain.commits == 1
+        assert len(query(base)) == 1
+
+
+def test_arret_valide_le_dernier_lot(tmp_path):
+    base = tmp_path / "mesures.db"
+    with SQLiteWriter(base, batch_size=1000, max_age=3600) as ecrivain:
+        for i in range(3):
+            ecrivain.append(mesure(i))
+
+    assert ecrivain.commits == 1
+    assert [ligne[0] for ligne in query(base)] == [0, 10, 20]
+
+
+# ---------------------------------------------------------------------------
+# Schéma et requêtes
+# ---------------------------------------------------------------------------
+def test_wal_et_index(tmp_path):
+    base = tmp_path / "mesures.db"
+    SQLiteWriter(base).start().stop()
+
+    connexion = sqlite3.connect(base)
+    try:
+        assert connexion.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        plan = connexion.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM readings WHERE timestamp >= 5 "
+            "AND timestamp < 9").fetchall()
+    finally:
+        connexion.close()
+    assert any("readings_timestamp" in ligne[-1] for ligne in plan)
+
+
+def test_query_par_intervalle_et_capteur(tmp_path):
+    base = tmp_path / "mesures.db"
+    with SQLiteWriter(base, batch_size=2) as ecrivain:
+        for i in range(10):
+            ecrivain.append(mesure(i), sensor="D4" if i % 2 else "D17")
+
+    assert query(base, 30, 60) == [
+        (30, "D4", 3.0, 6.0, 1),
+        (40, "D17", 4.0, 8.0, 1),
+        (50, "D4", 5.0, 10.0, 1),
+    ]
+    assert [ligne[0] for ligne in query(base, sensor="D17")] == [0, 20, 40, 60, 80]
+
+
+def test_lecture_pendant_l_ecriture(tmp_path):
+    base = tmp_path / "mesures.db"
+    with SQLiteWriter(base, batch_size=1) as ecrivain:
+        ecrivain.append(mesure(1))
+        ecrivain.flush(timeout=5)
+        assert len(query(base)) == 1
+        ecrivain.append(mesure(2))
+
+
+def test_base_inaccessible(tmp_path):
+    with pytest.raises(sqlite3.Error):
+        SQLiteWriter(tmp_path / "absent" / "mesures.db").start()
+
+
+def test_flush_sans_fil(tmp_path):
+    """flush() lève au lieu d'attendre un fil qui ne tourne pas."""
+    ecrivain = SQLiteWriter(tmp_path / "mesures.db")
+    with pytest.raises(RuntimeError):
+        ecrivain.flush()
+    ecrivain.start()
+    ecrivain.stop()
+    with pytest.raises(RuntimeError):
+        ecrivain.flush()
+
+
+def test_query_chemin_special(tmp_path):
+    """Un chemin avec ?, # ou % reste un chemin, pas une URI à compléter."""
+    dossier = tmp_path / "a?b#c%20d"
+    dossier.mkdir()
+    base = dossier / "mesures.db"
+    with SQLiteWriter(base, batch_size=1) as ecrivain:
+        ecrivain.append(mesure(3))
+    assert query(base) == [(30, "D4", 3.0, 6.0, 1)]
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Tests du contrôleur asyncio (controleur.LedController).
+"""
+
+import asyncio
+import sys
+from array import array
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from controleur import LedController
+from motifs import Timeline, compile_pattern
+
+
+LEDS = [17, 27, 22]
+
+
+class BanqueMemoire:
+    """Remplace PinBank : garde la trame courante et l'historique."""
+
+    all_mask = 0b111
+
+    def __init__(self):
+        self.frame = 0
+        self.trames = []
+
+    def write(self, trame):
+        self.frame = trame
+        self.trames.append(trame)
+
+
+# ---------------------------------------------------------------------------
+# Motifs concurrents
+# ---------------------------------------------------------------------------
+def test_motifs_sur_broches_separees():
+    """Deux motifs ne touchent que leurs propres broches."""
+    async def scenario():
+        banque = BanqueMemoire()
+        controleur = LedController(banque)
+        rouge = compile_pattern({"delai": 0.002, "etapes": ["R", ""]}, LEDS)
+        jaune = compile_pattern({"delai": 0.003, "etapes": ["J", "V"]}, LEDS)
+
+        controleur.run("rouge", rouge, 0b001)
+        controleur.run("vj", jaune, 0b110)
+        # Une autre coroutine progresse pendant ce temps
+        compteur = 0
+        for _ in range(10):
+            await asyncio.sleep(0.001)
+            compteur += 1
+
+        assert sorted(controleur.running) == ["rouge", "vj"]
+        await controleur.close()
+        return banque, compteur
+
+    banque, compteur = asyncio.run(scenario())
+
+    assert compteur == 10
+    assert 0b101 in banque.trames or 0b011 in banque.trames
+    assert banque.frame == 0
+
+
+def test_remplacement_a_chaud():
+    """run() avec un nom existant remplace le motif sans redémarrer."""
+    async def scenario():
+        banque = BanqueMemoire()
+        controleur = LedController(banque)
+        controleur.run("m", compile_pattern({"delai": 1, "etapes": ["R"]}, LEDS))
+        await asyncio.sleep(0)
+        premiere = controleur._tasks["m"]
+        controleur.run("m", compile_pattern({"delai": 1, "etapes": ["J"]}, LEDS))
+        await asyncio.sleep(0)
+
+        assert premiere.cancelled()
+        assert banque.frame == 0b100
+        await controleur.cancel("m")
+        assert controleur.running == []
+        return banque
+
+    assert asyncio.run(scenario()).frame == 0
+
+
+# ---------------------------------------------------------------------------
+# Motifs invalides
+# ---------------------------------------------------------------------------
+@pytest.mark.parametrize("offsets, duree", [
+    ([], 1000),           # aucune étape
+    ([0], 0),             # durée nulle : boucle sans fin
+    ([-1], 1000),         # avant le début
+    ([0, 1000], 1000),    # à la fin : hors de [0, durée)
+])
+def test_motif_invalide_refuse(offsets, duree):
+    controleur = LedController(BanqueMemoire())
+    timeline = Timeline(array("q", offsets), array("Q", [1] * len(offsets)), duree)
+    with pytest.raises(ValueError):
+        controleur.run("m", timeline)
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Tests du décodeur vectorisé de trames DHT22 (decodeur_dht22.py).
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from decodeur_dht22 import decode, decode_frames, encode_frame, load_trace
+from reessai import CHECKSUM, NOT_FOUND, TIMEOUT, classify
+
+
+def bruiter(durees, ecart=6, graine=1):
+    """Gigue de capture : ± ``ecart`` µs sur chaque durée."""
+    hasard = random.Random(graine)
+    return [d + hasard.randint(-ecart, ecart) for d in durees]
+
+
+# ---------------------------------------------------------------------------
+# Capture complète
+# ---------------------------------------------------------------------------
+def test_trame_complete():
+    assert decode(encode_frame(21.5, 45.3)) == (21.5, 45.3)
+
+
+def test_temperature_negative():
+    assert decode(encode_frame(-10.1, 80.0)) == (-10.1, 80.0)
+
+
+def test_gigue_de_capture():
+    for graine in range(20):
+        durees = bruiter(encode_frame(23.4, 56.7), graine=graine)
+        assert decode(durees) == (23.4, 56.7)
+
+
+def test_impulsions_parasites_avant_la_trame():
+    """Fin du signal de départ de l'hôte et rebonds avant la réponse."""
+    durees = [1100, 30, 12] + encode_frame(19.0, 60.2)
+    assert decode(durees) == (19.0, 60.2)
+
+
+# ---------------------------------------------------------------------------
+# Captures incomplètes
+# ---------------------------------------------------------------------------
+def test_sans_reponse_ni_bas_final():
+    assert decode(encode_frame(21.5, 45.3, response=False, trailing=False)) == (21.5, 45.3)
+
+
+def test_premier_front_manque():
+    """Le niveau bas du bit 0 n'a pas été mesuré : 79 durées seulement."""
+    durees = encode_frame(21.5, 45.3, response=False, trailing=False)[1:]
+    assert len(durees) == 79
+    assert decode(durees) == (21.5, 45.3)
+
+
+def test_somme_de_controle():
+    durees = encode_frame(21.5, 45.3)
+    # Bit 39 (dernier bit de la somme de contrôle) inversé
+    durees[-2] = 70 if durees[-2] < 48 else 27
+    with pytest.raises(RuntimeError) as erreur:
+        decode(durees)
+    assert classify(erreur.value) == CHECKSUM
+
+
+def test_captures_trop_courtes():
+    with pytest.raises(RuntimeError) as erreur:
+        decode([80, 80, 50])
+    assert classify(erreur.value) == NOT_FOUND
+
+    with pytest.raises(RuntimeError) as erreur:
+        decode(encode_frame(21.5, 45.3)[:60])
+    assert classify(erreur.value) == TIMEOUT
+
+
+# ---------------------------------------------------------------------------
+# Trames en lot et traces enregistrées
+# ---------------------------------------------------------------------------
+def test_decode_frames_en_lot():
+    mesures = [(20.0 + i / 10, 40.0 + i / 10) for i in range(100)]
+    trames = np.array([encode_frame(t, h, response=False, trailing=False)
+                       for t, h in mesures])
+    trames[7, 1] = 70   # bit 0 inversé : somme fausse
+
+    temperatures, humidites, valides = decode_frames(trames)
+    assert valides.sum() == 99 and not valides[7]
+    np.testing.assert_allclose(temperatures[valides],
+                               [t for i, (t, _) in enumerate(mesures) if i != 7])
+    np.testing.assert_allclose(humidites[valides],
+                               [h for i, (_, h) in enumerate(mesures) if i != 7])
+
+
+def test_trace_enregistree(tmp_path):
+    trace = tmp_path / "capture.txt"
+    durees = bruiter(encode_frame(24.8, 38.1), graine=7)
+    trace.write_text("# capture PulseIn, µs\n" + ", ".join(map(str, durees)) + "\n")
+
+    assert load_trace(trace) == durees
+    assert decode(load_trace(trace)) == (24.8, 38.1)
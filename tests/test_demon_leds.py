@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Tests du démon de LEDs (demon_leds.py) et de son client (client_leds.py).
+
+Le démon tourne dans un fil avec sa propre boucle asyncio, sur une banque
+dont le pilote note les trames en mémoire.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from client_leds import CMD_PLAY, CMD_SET, PLAY, STEP, DaemonDriver, LedClient
+from demon_leds import LedDaemon, _decoder_timeline
+from gpio_bank import PinBank
+from motifs import compile_pattern
+
+
+LEDS = [17, 27, 22]
+
+
+class PiloteMemoire:
+    """Pilote PinBank qui garde l'état des broches."""
+
+    def __init__(self):
+        self.trame = 0
+
+    def apply(self, set_mask, clear_mask):
+        self.trame = (self.trame | set_mask) & ~clear_mask
+
+    def close(self):
+        pass
+
+
+class DemonEnFond:
+    """Démon servi par un fil séparé, le temps d'un test."""
+
+    def __init__(self, path):
+        self.pilote = PiloteMemoire()
+        self.demon = LedDaemon(PinBank(LEDS, self.pilote), str(path))
+        self.boucle = asyncio.new_event_loop()
+        self._fil = threading.Thread(target=self.boucle.run_forever, daemon=True)
+        self._fil.start()
+        self._appeler(self.demon.start())
+
+    def _appeler(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self.boucle).result(5)
+
+    def arreter(self):
+        self._appeler(self.demon.close())
+        self.boucle.call_soon_threadsafe(self.boucle.stop)
+        self._fil.join(5)
+        self.boucle.close()
+
+
+@pytest.fixture
+def demon(tmp_path):
+    fond = DemonEnFond(tmp_path / "leds.sock")
+    yield fond
+    fond.arreter()
+
+
+# ---------------------------------------------------------------------------
+# Écritures
+# ---------------------------------------------------------------------------
+def test_write_set_clear(demon):
+    with LedClient(demon.demon.path) as leds:
+        assert leds.write(0b101) == 0b101
+        assert leds.set(0b010) == 0b111
+        assert leds.clear(0b001) == 0b110
+        assert leds.frame == 0b110
+    assert demon.pilote.trame == 0b110
+
+
+def test_deux_clients_partagent_les_broches(demon):
+    """Deux scripts écrivent chacun leurs broches sans se gêner."""
+    with LedClient(demon.demon.path) as a, LedClient(demon.demon.path) as b:
+        a.set(0b001)
+        b.set(0b100)
+        assert a.frame == b.frame == 0b101
+
+
+def test_pinbank_par_le_demon(demon):
+    """DaemonDriver : une PinBank locale écrit à travers le démon."""
+    with PinBank(LEDS, DaemonDriver(LEDS, LedClient(demon.demon.path))) as banque:
+        banque.write(0b011)
+        banque.clear(banque.mask(17))
+    assert demon.pilote.trame == 0b010
+
+
+def test_pinbank_reecrit_apres_un_autre_client(demon):
+    """Une trame identique est renvoyée si un autre client a changé les broches."""
+    with PinBank(LEDS, DaemonDriver(LEDS, LedClient(demon.demon.path))) as banque, \
+            LedClient(demon.demon.path) as autre:
+        banque.write(0b011)
+        autre.write(0b100)
+        banque.write(0b011)
+        assert demon.pilote.trame == 0b011
+        assert banque.frames_suppressed == 0
+
+
+# ---------------------------------------------------------------------------
+# Motifs
+# ---------------------------------------------------------------------------
+def test_play_puis_stop(demon):
+    timeline = compile_pattern({"delai": 0.002, "etapes": ["R", "V", "J"]}, LEDS)
+    with LedClient(demon.demon.path) as leds:
+        leds.play(1, timeline)
+        vues = set()
+        fin = time.monotonic() + 0.5
+        while len(vues) < 3 and time.monotonic() < fin:
+            vues.add(leds.frame)
+        assert {0b001, 0b010, 0b100} <= vues
+
+        assert leds.stop(1) == 0
+        time.sleep(0.01)
+        assert leds.frame == 0
+
+
+def test_play_sans_repetition(demon):
+    timeline = compile_pattern({"delai": 0.001, "etapes": ["R", "J"]}, LEDS)
+    with LedClient(demon.demon.path) as leds:
+        leds.play(2, timeline, mask=0b101, repeat=False)
+        time.sleep(0.05)
+        assert leds.frame == 0b100
+
+
+# ---------------------------------------------------------------------------
+# Erreurs
+# ---------------------------------------------------------------------------
+def test_commande_inconnue(demon):
+    with LedClient(demon.demon.path) as leds:
+        with pytest.raises(RuntimeError, match="commande inconnue"):
+            leds.request(42)
+        with pytest.raises(RuntimeError, match="contenu invalide"):
+            leds.request(CMD_SET, 0, b"\x01")
+        # La connexion reste utilisable
+        assert leds.write(0b001) == 0b001
+
+
+@pytest.mark.parametrize("duree, etapes", [
+    (0, [(0, 1)]),                 # durée nulle
+    (-5, [(0, 1)]),                # durée négative
+    (1000, []),                    # aucune étape
+    (1000, [(-1, 1)]),             # offset avant le début
+    (1000, [(0, 1), (1000, 2)]),   # offset à la fin
+])
+def test_play_invalide(demon, duree, etapes):
+    contenu = PLAY.pack(1, 0, duree) + b"".join(STEP.pack(*e) for e in etapes)
+    assert _decoder_timeline(contenu) is None
+    with LedClient(demon.demon.path) as leds:
+        with pytest.raises(RuntimeError, match="contenu invalide"):
+            leds.request(CMD_PLAY, 1, contenu)
+        # Le démon reste réactif
+        assert leds.write(0b001) == 0b001
+
+
+def test_un_seul_demon_par_socket(demon):
+    autre = LedDaemon(PinBank(LEDS, PiloteMemoire()), demon.demon.path)
+    with pytest.raises(OSError, match="déjà"):
+        asyncio.run(autre.start())
+
+
+def test_client_sans_demon(tmp_path):
+    with pytest.raises(OSError):
+        LedClient(str(tmp_path / "absent.sock"))
+
+
+# ---------------------------------------------------------------------------
+# Scripts avec GPIO_BACKEND=demon
+# ---------------------------------------------------------------------------
+def test_scripts_par_le_demon(demon, monkeypatch):
+    """Les scripts écrivent par le démon, sans jamais importer RPi.GPIO."""
+    import labo1
+    import led_rgb
+    import led_simple
+
+    monkeypatch.setenv("GPIO_BACKEND", "demon")
+    monkeypatch.setenv("LEDS_SOCKET", demon.demon.path)
+    monkeypatch.setitem(sys.modules, "RPi", None)
+    monkeypatch.setattr(labo1, "LABO1", {"delai": 0.001, "etapes": ["R", "V", "J"]})
+
+    with led_simple.leds() as banque:
+        assert led_simple.GPIO is None
+        banque.write(0b101)
+        assert demon.pilote.trame == 0b101
+
+    with led_rgb.leds():
+        led_rgb.fondu((0, 0, 0), (255, 0, 255), duree=0.001)
+        assert demon.pilote.trame == 0b101
+
+    labo1.main()
+    assert demon.pilote.trame == 0b100
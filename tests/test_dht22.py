@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Tests du registre de capteurs DHT22 (dht22.open / close).
+
+``board`` et ``adafruit_dht`` sont remplacés par des modules factices.
+"""
+
+import atexit
+import sys
+import time
+import types
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import dht22
+from echantillonneur import Sampler
+from historique import iter_records
+from reessai import RetryPolicy
+
+
+class CapteurFactice:
+    """Remplace adafruit_dht.DHT22 et compte les créations / libérations."""
+
+    crees = []
+
+    def __init__(self, pin):
+        self.pin = pin
+        self.libere = False
+        # Erreurs à lever aux prochaines transactions, puis valeurs lues
+        self.erreurs = []
+        self.trames = [(21.5, 40.0)]
+        self.transactions = 0
+        self._temperature = self._humidity = None
+        # Propriétés lues depuis la dernière trame (None : aucune trame)
+        self._lues = None
+        CapteurFactice.crees.append(self)
+
+    def measure(self):
+        self.transactions += 1
+        if self.erreurs:
+            raise RuntimeError(self.erreurs.pop(0))
+        if len(self.trames) > 1:
+            self._temperature, self._humidity = self.trames.pop(0)
+        else:
+            self._temperature, self._humidity = self.trames[0]
+        self._lues = set()
+
+    def _valeur(self, nom):
+        # Comme adafruit_dht, chaque propriété rappelle measure(), sans effet
+        # moins de 2 s après : seule une propriété déjà lue relance la lecture
+        if self._lues is None or nom in self._lues:
+            self.measure()
+        self._lues.add(nom)
+        return getattr(self, "_" + nom)
+
+    @property
+    def temperature(self):
+        return self._valeur("temperature")
+
+    @property
+    def humidity(self):
+        return self._valeur("humidity")
+
+    def exit(self):
+        self.libere = True
+
+
+@pytest.fixture(autouse=True)
+def materiel(monkeypatch):
+    board = types.ModuleType("board")
+    board.D4, board.D17 = 4, 17
+    adafruit_dht = types.ModuleType("adafruit_dht")
+    adafruit_dht.DHT22 = CapteurFactice
+    monkeypatch.setitem(sys.modules, "board", board)
+    monkeypatch.setitem(sys.modules, "adafruit_dht", adafruit_dht)
+    CapteurFactice.crees = []
+    monkeypatch.setattr(dht22, "_politiques", {})
+    yield
+    dht22.close()
+
+
+# ---------------------------------------------------------------------------
+# Un capteur par broche
+# ---------------------------------------------------------------------------
+def test_capteur_cree_une_seule_fois():
+    assert dht22.lire_temperature() == 21.5
+    assert dht22.lire_humidite() == 40.0
+    assert dht22.lire_temperature() == 21.5
+    assert len(CapteurFactice.crees) == 1
+    assert dht22.open() is CapteurFactice.crees[0]
+
+
+def test_un_capteur_par_broche():
+    a = dht22.open("D4")
+    b = dht22.open("D17")
+    assert a is not b
+    assert (a.pin, b.pin) == (4, 17)
+
+    dht22.close("D4")
+    assert a.libere and not b.libere
+    assert dht22.open("D17") is b
+
+
+def test_close_libere_tout_avec_exit():
+    capteurs = [dht22.open("D4"), dht22.open("D17")]
+    dht22.close()
+    assert all(c.libere for c in capteurs)
+    # Rouvrir crée un nouveau capteur
+    assert dht22.open() is not capteurs[0]
+
+
+def test_close_sans_capteur():
+    dht22.close()
+    dht22.close("D4")
+
+
+def test_liberation_a_la_sortie(monkeypatch):
+    enregistres = []
+    monkeypatch.setattr(atexit, "register", enregistres.append)
+    monkeypatch.setattr(atexit, "unregister",
+                        lambda f: enregistres.remove(f) if f in enregistres else None)
+    dht22.open("D4")
+    dht22.open("D17")
+    assert enregistres == [dht22.close]
+    dht22.close()
+    assert enregistres == []
+
+
+def test_contexte_capteur():
+    with dht22.capteur() as dht:
+        assert dht22.lire_temperature() == 21.5
+    assert dht.libere
+    assert len(CapteurFactice.crees) == 1
+
+
+# ---------------------------------------------------------------------------
+# Erreurs de lecture
+# ---------------------------------------------------------------------------
+def test_erreur_de_lecture_donne_none(capsys):
+    dht22.open().erreurs = ["Checksum did not validate"] * 20
+    dht22._politiques["D4"] = RetryPolicy(max_attempts=2, sleep=lambda s: None)
+    assert dht22.lire_temperature() is None
+    assert dht22.lire_humidite() is None
+    assert "Checksum" in capsys.readouterr().out
+
+
+# ---------------------------------------------------------------------------
+# Lecture combinée
+# ---------------------------------------------------------------------------
+def test_read_une_seule_transaction():
+    capteur = dht22.open()
+    capteur.trames = [(21.5, 40.0), (30.0, 80.0)]
+    mesure = dht22.read()
+    assert (mesure.temperature, mesure.humidity, mesure.attempts) == (21.5, 40.0, 1)
+    assert capteur.transactions == 1
+    assert mesure.timestamp > 0
+    # Lecture suivante : la trame suivante, entière
+    assert dht22.read()[:2] == (30.0, 80.0)
+    assert capteur.transactions == 2
+
+
+def test_reading_immuable():
+    mesure = dht22.Reading(21.5, 40.0, 0, 1)
+    with pytest.raises(AttributeError):
+        mesure.temperature = 0.0
+    assert mesure == (21.5, 40.0, 0, 1)
+
+
+def test_read_reessaie():
+    attentes = []
+    politique = RetryPolicy(min_interval=2.0, clock_ns=lambda: 0, sleep=attentes.append)
+    dht22.open().erreurs = ["Checksum did not validate", "A full buffer was not returned"]
+    mesure = dht22.read(policy=politique)
+    assert mesure.attempts == 3
+    assert attentes == [2.0, 2.0]
+
+
+def test_read_abandonne():
+    politique = RetryPolicy(max_attempts=2, clock_ns=lambda: 0, sleep=lambda s: None)
+    dht22.open().erreurs = ["DHT sensor not found, check wiring"] * 3
+    with pytest.raises(RuntimeError, match="not found"):
+        dht22.read(policy=politique)
+    assert politique.stats.failures == 1
+
+
+def test_politique_par_broche():
+    assert dht22.retry_policy("D4") is dht22.retry_policy("D4")
+    assert dht22.retry_policy("D4") is not dht22.retry_policy("D17")
+
+
+def test_read_incomplete():
+    dht22.open().trames = [(None, None)]
+    politique = RetryPolicy(max_attempts=1)
+    with pytest.raises(RuntimeError, match="incomplète"):
+        dht22.read(policy=politique)
+
+
+# ---------------------------------------------------------------------------
+# Échantillonneur en arrière-plan
+# ---------------------------------------------------------------------------
+@pytest.fixture
+def sans_fil(monkeypatch):
+    """start_sampler() sans fil : les mesures sont faites à la main."""
+    monkeypatch.setattr(Sampler, "start", lambda self: self)
+
+
+def test_lectures_depuis_l_echantillonneur(sans_fil):
+    echantillonneur = dht22.start_sampler(interval=10.0)
+    assert dht22.start_sampler() is echantillonneur
+    echantillonneur._echantillonner()
+    capteur = dht22.open()
+    transactions = capteur.transactions
+    for _ in range(100):
+        assert dht22.lire_temperature() == 21.5
+    assert dht22.lire_humidite() == 40.0
+    # Les lectures rendent la valeur en cache, sans transaction
+    assert capteur.transactions == transactions
+
+
+def test_mesure_trop_ancienne_ignoree(monkeypatch, capsys):
+    """Au-delà de 2 périodes sans nouvelle mesure, plus de valeur en cache."""
+    horloge = [0]
+    echantillonneur = Sampler(dht22.read, interval=10.0, clock_ns=lambda: horloge[0])
+    echantillonneur._echantillonner()
+    # Arrêté : aucune nouvelle mesure, la dernière ne fait que vieillir
+    echantillonneur.stop()
+    monkeypatch.setattr(dht22, "_echantillonneur", echantillonneur)
+
+    horloge[0] = 15 * 10**9
+    assert dht22.lire_temperature() == 21.5
+    horloge[0] = 25 * 10**9
+    assert dht22.lire_temperature() is None
+    assert "Aucune mesure récente" in capsys.readouterr().out
+
+
+class CapteurLent(CapteurFactice):
+    """Comme adafruit_dht : nouvelle trame seulement plus de 2 s après la précédente."""
+
+    def __init__(self, pin, horloge):
+        super().__init__(pin)
+        self.horloge = horloge
+        self.derniere_ns = None
+
+    def measure(self):
+        maintenant = self.horloge[0]
+        if self.derniere_ns is not None and maintenant - self.derniere_ns <= 2 * 10**9:
+            return
+        self.derniere_ns = maintenant
+        super().measure()
+
+
+def test_echantillonneur_toujours_une_nouvelle_trame(sans_fil, monkeypatch):
+    """Même réveillé un peu en avance, chaque période lit une nouvelle trame."""
+    horloge = [0]
+    monkeypatch.setattr(sys.modules["adafruit_dht"], "DHT22",
+                        lambda pin: CapteurLent(pin, horloge))
+    dht22.open().trames = [(20.0 + i, 40.0) for i in range(6)]
+    echantillonneur = dht22.start_sampler()
+    temperatures = []
+    for _ in range(5):
+        echantillonneur._echantillonner()
+        temperatures.append(echantillonneur.latest()[0].temperature)
+        # Réveil 40 ms avant l'échéance
+        horloge[0] += echantillonneur.interval_ns - 40_000_000
+    assert temperatures == [20.0, 21.0, 22.0, 23.0, 24.0]
+
+
+def test_intervalle_trop_court():
+    with pytest.raises(ValueError):
+        dht22.start_sampler(interval=2.0)
+    assert dht22._echantillonneur is None
+
+
+def test_close_arrete_l_echantillonneur(sans_fil):
+    echantillonneur = dht22.start_sampler(interval=10.0)
+    dht22.close()
+    assert dht22._echantillonneur is None
+    # Arrêté : plus aucune attente possible
+    assert echantillonneur.wait_fresh(1.0) is None
+
+
+# ---------------------------------------------------------------------------
+# Boucle d'affichage
+# ---------------------------------------------------------------------------
+def test_horloge_qui_recule_n_arrete_pas_la_lecture(tmp_path, monkeypatch, capsys):
+    """Un instant mural qui recule est enregistré, la boucle continue."""
+    instants = iter([100, 50, 200])
+
+    def time_ns():
+        try:
+            return next(instants)
+        except StopIteration:
+            raise KeyboardInterrupt from None
+
+    monkeypatch.setattr(time, "time_ns", time_ns)
+    monkeypatch.setattr(time, "sleep", lambda secondes: None)
+    path = tmp_path / "mesures.log"
+    dht22.afficher_mesures(historique=str(path))
+
+    assert "Au revoir" in capsys.readouterr().out
+    assert [r[0] for r in iter_records(path)] == [100, 50, 200]
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Tests de l'échantillonneur en arrière-plan (echantillonneur.Sampler).
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from echantillonneur import Sampler
+
+
+class HorlogeVirtuelle:
+    """
+    Horloge ``clock_ns`` et attente ``sleep`` du Sampler, sans temps réel.
+
+    Arrivée à ``limite_ns``, l'attente appelle ``au_terme`` (ex. ``stop``)
+    puis signale ``finie``.
+    """
+
+    def __init__(self, limite_ns=None):
+        self.now_ns = 0
+        self.limite_ns = limite_ns
+        self.au_terme = None
+        self.finie = threading.Event()
+
+    def __call__(self):
+        return self.now_ns
+
+    def sleep(self, secondes):
+        self.now_ns += round(secondes * 1e9)
+        if self.limite_ns is not None and self.now_ns >= self.limite_ns:
+            self.au_terme()
+            self.finie.set()
+
+
+class Source:
+    """Lecture factice : 1, 2, 3... ou RuntimeError si demandé."""
+
+    def __init__(self, erreurs=0):
+        self.n = 0
+        self.erreurs = erreurs
+
+    def __call__(self):
+        if self.erreurs:
+            self.erreurs -= 1
+            raise RuntimeError("Checksum did not validate")
+        self.n += 1
+        return self.n
+
+
+# ---------------------------------------------------------------------------
+# Fil
+# ---------------------------------------------------------------------------
+def test_derniere_mesure_sans_attendre():
+    horloge = HorlogeVirtuelle()
+    echantillonneur = Sampler(Source(), interval=2.0, clock_ns=horloge)
+    echantillonneur._echantillonner()
+    horloge.now_ns += 500_000_000
+    assert echantillonneur.latest() == (1, 0.5)
+
+
+def test_aucune_mesure():
+    echantillonneur = Sampler(Source())
+    assert echantillonneur.latest() == (None, None)
+
+
+def test_wait_fresh_donne_une_nouvelle_mesure():
+    with Sampler(Source(), interval=0.01) as echantillonneur:
+        premiere = echantillonneur.wait_fresh(1.0)
+        suivante = echantillonneur.wait_fresh(1.0)
+    assert suivante > premiere
+
+
+def test_erreurs_comptees_sans_publier():
+    with Sampler(Source(erreurs=2), interval=0.005) as echantillonneur:
+        mesure = echantillonneur.wait_fresh(1.0)
+    assert mesure == 1
+    assert echantillonneur.errors == 2
+    assert "Checksum" in str(echantillonneur.last_error)
+
+
+def test_stop_reveille_les_attentes():
+    echantillonneur = Sampler(Source(erreurs=10**6), interval=0.01).start()
+    resultat = []
+    attente = threading.Thread(target=lambda: resultat.append(echantillonneur.wait_fresh()))
+    attente.start()
+    time.sleep(0.02)
+    echantillonneur.stop()
+    attente.join(1.0)
+    assert resultat == [None]
+
+
+def test_cadence_par_echeances_absolues():
+    """La durée de lecture ne s'ajoute pas à la période."""
+    horloge = HorlogeVirtuelle(limite_ns=210_000_000)
+
+    def lente():
+        horloge.now_ns += 5_000_000
+        return 0
+
+    echantillonneur = Sampler(lente, interval=0.02, clock_ns=horloge,
+                              sleep=horloge.sleep)
+    horloge.au_terme = echantillonneur.stop
+    echantillonneur.start()
+    assert horloge.finie.wait(5.0)
+    echantillonneur.stop()
+    # Lectures à 0, 20, ..., 200 ms (une période de 25 ms en donnerait 9)
+    assert echantillonneur.samples == 11
+
+
+# ---------------------------------------------------------------------------
+# Tâche asyncio
+# ---------------------------------------------------------------------------
+def test_tache_asyncio():
+    async def scenario():
+        echantillonneur = Sampler(Source(), interval=0.01)
+        echantillonneur.start_task()
+        # La boucle reste libre pendant les lectures
+        compteur = 0
+        premiere = await echantillonneur.next_reading()
+        while echantillonneur.samples < 3:
+            await asyncio.sleep(0.001)
+            compteur += 1
+        suivante = await echantillonneur.next_reading()
+        echantillonneur.stop()
+        return premiere, suivante, compteur
+
+    premiere, suivante, compteur = asyncio.run(scenario())
+    assert premiere == 1
+    assert suivante >= 3
+    assert compteur > 0
+
+
+def test_attente_asyncio_sur_echantillonneur_en_fil():
+    async def scenario(echantillonneur):
+        return await asyncio.wait_for(echantillonneur.next_reading(), 1.0)
+
+    with Sampler(Source(), interval=0.01) as echantillonneur:
+        assert asyncio.run(scenario(echantillonneur)) >= 1
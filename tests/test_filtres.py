@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Tests des filtres en flux (filtres.py) et de leur version NumPy en bloc.
+"""
+
+import random
+import statistics
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from filtres import (
+    HAMPEL_MIN, ExponentialAverage, FilterChain, HampelFilter, RollingMedian,
+    _mad_triee, ema_bulk, hampel_bulk, rolling_median_bulk,
+)
+
+
+def serie_avec_pics(n=300, graine=1):
+    """Température lente + bruit de 0,1 °C + quelques pics de +10 °C."""
+    hasard = random.Random(graine)
+    valeurs = [21.0 + i * 0.002 + hasard.choice((-0.1, 0.0, 0.1)) for i in range(n)]
+    pics = sorted(hasard.sample(range(20, n), 8))
+    for i in pics:
+        valeurs[i] += 10.0
+    return valeurs, pics
+
+
+# ---------------------------------------------------------------------------
+# Médiane glissante
+# ---------------------------------------------------------------------------
+def test_mediane_glissante():
+    filtre = RollingMedian(3)
+    assert [filtre.update(x) for x in [5, 1, 9, 3, 3, 100, 4]] == [5, 3, 5, 3, 3, 3, 4]
+
+
+def test_mad_par_selection():
+    """La MAD tirée de la fenêtre triée = calcul direct."""
+    hasard = random.Random(0)
+    for _ in range(500):
+        s = sorted(hasard.uniform(-5, 5) for _ in range(hasard.randint(1, 15)))
+        m = statistics.median(s)
+        assert _mad_triee(s, m) == pytest.approx(statistics.median(abs(x - m) for x in s))
+
+
+# ---------------------------------------------------------------------------
+# Hampel
+# ---------------------------------------------------------------------------
+def test_hampel_rejette_les_pics_isoles():
+    valeurs, pics = serie_avec_pics()
+    filtre = HampelFilter(window=7)
+    sortie = []
+    remplaces = []
+    for i, x in enumerate(valeurs):
+        sortie.append(filtre.update(x))
+        if filtre.last_outlier:
+            remplaces.append(i)
+    assert remplaces == pics
+    assert filtre.rejected == len(pics)
+    assert max(sortie) < 22.0
+
+
+def test_hampel_suit_un_vrai_changement():
+    """Un saut durable est accepté dès que la médiane le rejoint."""
+    filtre = HampelFilter(window=5, min_deviation=0.5)
+    sortie = [filtre.update(x) for x in [20.0] * 10 + [25.0] * 10]
+    assert sortie[10] == 20.0
+    assert sortie[-1] == 25.0
+
+
+def test_hampel_plancher():
+    filtre = HampelFilter(window=5, min_deviation=0.5)
+    sortie = [filtre.update(x) for x in [21.5] * 6 + [21.6]]
+    assert sortie[-1] == 21.6
+    assert not filtre.last_outlier
+
+
+# ---------------------------------------------------------------------------
+# EMA et chaîne
+# ---------------------------------------------------------------------------
+def test_ema():
+    filtre = ExponentialAverage(0.5)
+    assert [filtre.update(x) for x in [10, 20, 20]] == [10.0, 15.0, 17.5]
+    with pytest.raises(ValueError):
+        ExponentialAverage(0)
+
+
+def test_chaine():
+    chaine = FilterChain(HampelFilter(5), ExponentialAverage(1.0))
+    sortie = [chaine.update(x) for x in [20.0] * 5 + [30.0, 20.0]]
+    assert sortie[-2:] == [20.0, 20.0]
+
+
+# ---------------------------------------------------------------------------
+# Version NumPy : mêmes résultats que les filtres en flux
+# ---------------------------------------------------------------------------
+def test_bulk_identique_au_flux():
+    np = pytest.importorskip("numpy")
+    valeurs, _ = serie_avec_pics()
+
+    mediane = RollingMedian(5)
+    assert np.allclose(rolling_median_bulk(valeurs, 5), [mediane.update(x) for x in valeurs])
+
+    hampel = HampelFilter(7)
+    attendu = [hampel.update(x) for x in valeurs]
+    filtrees, masque = hampel_bulk(valeurs, 7)
+    assert np.allclose(filtrees, attendu)
+    assert masque.sum() == hampel.rejected
+
+    ema = ExponentialAverage(0.05)
+    assert np.allclose(ema_bulk(valeurs * 10, 0.05), [ema.update(x) for x in valeurs * 10])
+
+
+def test_fenetre_hampel_trop_petite():
+    """Fenêtre < HAMPEL_MIN refusée en flux comme en bloc."""
+    with pytest.raises(ValueError):
+        HampelFilter(window=HAMPEL_MIN - 1)
+    with pytest.raises(ValueError):
+        hampel_bulk([20.0] * 10, window=HAMPEL_MIN - 1)
+
+
+def test_bulk_identique_au_flux_petite_fenetre():
+    np = pytest.importorskip("numpy")
+    valeurs, _ = serie_avec_pics()
+    hampel = HampelFilter(HAMPEL_MIN)
+    attendu = [hampel.update(x) for x in valeurs]
+    filtrees, masque = hampel_bulk(valeurs, HAMPEL_MIN)
+    assert np.allclose(filtrees, attendu)
+    assert masque.sum() == hampel.rejected
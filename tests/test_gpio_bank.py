@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Tests de la banque de broches (gpio_bank.PinBank).
+
+Ces tests n'ont pas besoin du matériel : RPi.GPIO est remplacé par un
+enregistreur d'appels.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from gpio_bank import PinBank, RPiGPIODriver, _table_materielle
+
+
+LEDS = [17, 27, 22]
+
+
+class GpioEnregistreur:
+    """Remplace RPi.GPIO et enregistre chaque appel à output()."""
+
+    def __init__(self):
+        self.appels = []
+
+    def output(self, canaux, valeurs):
+        self.appels.append((tuple(canaux), tuple(valeurs)))
+
+
+# ---------------------------------------------------------------------------
+# Écriture de trames
+# ---------------------------------------------------------------------------
+def test_write_un_seul_appel_par_trame():
+    """Une trame complète = un seul GPIO.output pour les 3 broches."""
+    gpio = GpioEnregistreur()
+    banque = PinBank(LEDS, RPiGPIODriver(LEDS, gpio))
+
+    banque.write(0b101)
+
+    assert gpio.appels == [((17, 27, 22), (1, 0, 1))]
+    assert banque.frame == 0b101
+
+
+def test_set_et_clear_ne_touchent_que_le_masque():
+    """set()/clear() n'écrivent que les broches demandées."""
+    gpio = GpioEnregistreur()
+    banque = PinBank(LEDS, RPiGPIODriver(LEDS, gpio))
+
+    banque.set(banque.mask(27))
+    banque.clear(banque.mask(17, 22))
+
+    assert gpio.appels == [((27,), (1,)), ((17, 22), (0, 0))]
+    assert banque.frame == 0b010
+
+
+def test_mask_broche_inconnue():
+    """Une broche hors de la banque est une erreur."""
+    banque = PinBank(LEDS, RPiGPIODriver(LEDS, GpioEnregistreur()))
+
+    with pytest.raises(ValueError):
+        banque.mask(4)
+
+
+# ---------------------------------------------------------------------------
+# Traduction vers les registres BCM
+# ---------------------------------------------------------------------------
+def test_traduction_masque_materiel():
+    """Le bit i de la trame correspond au bit pins[i] du registre."""
+    hw = _table_materielle(tuple(LEDS))
+
+    assert hw(0b001) == 1 << 17
+    assert hw(0b110) == (1 << 27) | (1 << 22)
+
+
+# ---------------------------------------------------------------------------
+# Écritures redondantes évitées
+# ---------------------------------------------------------------------------
+def test_seuls_les_bits_changes_sont_ecrits():
+    gpio = GpioEnregistreur()
+    banque = PinBank(LEDS, RPiGPIODriver(LEDS, gpio))
+
+    banque.write(0)        # état inconnu : les 3 broches sont écrites
+    banque.write(0)        # rien n'a changé : aucun appel
+    banque.write(0b010)    # seule la verte change
+    banque.set(0b010)      # déjà HIGH
+
+    assert gpio.appels == [((17, 27, 22), (0, 0, 0)), ((27,), (1,))]
+    assert banque.counters() == {
+        "writes_issued": 4,
+        "writes_suppressed": 6,
+        "frames_issued": 2,
+        "frames_suppressed": 2,
+    }
+
+
+def test_invalidate_force_la_reecriture():
+    """Après un accès hors banque (PWM, GPIO.output), on réécrit."""
+    gpio = GpioEnregistreur()
+    banque = PinBank(LEDS, RPiGPIODriver(LEDS, gpio))
+    banque.write(0b001)
+
+    banque.invalidate(banque.mask(17))
+    banque.write(0b001)
+
+    assert gpio.appels[-1] == ((17,), (1,))
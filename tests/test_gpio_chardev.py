@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Tests du pilote /dev/gpiochipN (gpio_chardev.ChardevDriver).
+
+Sans matériel, un substitut d'ioctl décode les structures envoyées au
+noyau. Avec le module gpio-sim chargé, définir GPIO_SIM_CHIP (ex.
+/dev/gpiochip2) pour tester contre le vrai uAPI.
+"""
+
+import os
+import struct
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import gpio_chardev
+from gpio_bank import PinBank
+from gpio_chardev import ChardevDriver
+
+
+LEDS = [17, 27, 22]
+
+
+class IoctlSubstitut:
+    """Simule la requête de lignes et la mise à jour des valeurs."""
+
+    def __init__(self):
+        self.requete = None
+        self.ecritures = []
+        self.valeurs = 0
+
+    def __call__(self, fd, commande, tampon):
+        if commande == gpio_chardev.GPIO_V2_GET_LINE_IOCTL:
+            self.requete = gpio_chardev._LINE_REQUEST.unpack(tampon)
+            fd_ligne = os.open(os.devnull, os.O_RDONLY)
+            struct.pack_into("<i", tampon, gpio_chardev._FD_OFFSET, fd_ligne)
+        elif commande == gpio_chardev.GPIO_V2_LINE_SET_VALUES_IOCTL:
+            bits, masque = gpio_chardev._LINE_VALUES.unpack(tampon)
+            self.ecritures.append((bits, masque))
+            self.valeurs = (self.valeurs & ~masque) | (bits & masque)
+        elif commande == gpio_chardev.GPIO_V2_LINE_GET_VALUES_IOCTL:
+            _, masque = gpio_chardev._LINE_VALUES.unpack(tampon)
+            gpio_chardev._LINE_VALUES.pack_into(tampon, 0, self.valeurs & masque, masque)
+        return 0
+
+
+# ---------------------------------------------------------------------------
+# Substitut local
+# ---------------------------------------------------------------------------
+def test_requete_multi_lignes():
+    """Une seule requête pour les 3 LEDs, en sortie, à 0 au départ."""
+    ioctl = IoctlSubstitut()
+    pilote = ChardevDriver(LEDS, chip=os.devnull, ioctl=ioctl)
+
+    champs = ioctl.requete
+    assert list(champs[:3]) == LEDS
+    assert champs[64].rstrip(b"\0") == b"formatif-leds"
+    assert champs[65] == gpio_chardev.GPIO_V2_LINE_FLAG_OUTPUT
+    assert champs[-3] == 3  # num_lines
+    pilote.close()
+
+
+def test_une_ecriture_par_trame():
+    """Chaque trame = un ioctl SET_VALUES avec bits et masque."""
+    ioctl = IoctlSubstitut()
+    banque = PinBank(LEDS, ChardevDriver(LEDS, chip=os.devnull, ioctl=ioctl))
+
+    banque.write(0b101)
+    banque.clear(0b001)
+
+    assert ioctl.ecritures == [(0b101, 0b111), (0b000, 0b001)]
+    assert banque.driver.read() == 0b100
+    banque.close()
+
+
+def test_pas_de_puce_du_pi(monkeypatch):
+    """Une puce étrangère (expandeur I²C) n'est jamais prise par défaut."""
+    monkeypatch.setattr(gpio_chardev.glob, "glob",
+                        lambda motif: ["/dev/gpiochip0", "/dev/gpiochip1"])
+    monkeypatch.setattr(gpio_chardev, "chip_label", lambda puce: "pca9555")
+
+    assert gpio_chardev.find_chip() is None
+    with pytest.raises(FileNotFoundError):
+        ChardevDriver(LEDS, ioctl=IoctlSubstitut())
+
+
+# ---------------------------------------------------------------------------
+# Module noyau gpio-sim (optionnel)
+# ---------------------------------------------------------------------------
+@pytest.mark.skipif(not os.environ.get("GPIO_SIM_CHIP"),
+                    reason="GPIO_SIM_CHIP non défini (module gpio-sim)")
+def test_gpio_sim():
+    puce = os.environ["GPIO_SIM_CHIP"]
+    with PinBank([0, 1, 2], ChardevDriver([0, 1, 2], chip=puce)) as banque:
+        banque.write(0b110)
+        assert banque.driver.read() == 0b110
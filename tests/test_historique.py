@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Tests de l'historique binaire des mesures (historique.py).
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dht22 import Reading
+from historique import (LOG_HEADER, LOG_RECORD, ReadingLog, between,
+                        iter_records, replay)
+
+
+def horloge_manuelle():
+    """Horloge factice avancée à la main (liste à un élément, en ns)."""
+    maintenant = [0]
+    return maintenant, lambda: maintenant[0]
+
+
+def ecrire(path, n, **options):
+    """Mesure i : instant 10*i, température i, humidité 2*i."""
+    with ReadingLog(path, **options) as historique:
+        for i in range(n):
+            historique.append(10 * i, float(i), float(2 * i))
+
+
+# ---------------------------------------------------------------------------
+# Écriture
+# ---------------------------------------------------------------------------
+def test_format_fixe(tmp_path):
+    path = tmp_path / "mesures.log"
+    ecrire(path, 3)
+
+    assert LOG_RECORD.size == 16
+    assert path.stat().st_size == LOG_HEADER.size + 3 * 16
+    assert list(iter_records(path)) == [(0, 0.0, 0.0), (10, 1.0, 2.0), (20, 2.0, 4.0)]
+
+
+def test_fsync_par_lots(tmp_path):
+    path = tmp_path / "mesures.log"
+    historique = ReadingLog(path, sync_every=4)
+    for i in range(9):
+        historique.append(i, 0.0, 0.0)
+
+    # Deux lots pleins sur disque, un en attente
+    assert historique.syncs == 2
+    assert historique.pending == 1
+    assert len(list(iter_records(path))) == 8
+    assert len(historique) == 9
+    historique.close()
+    assert len(list(iter_records(path))) == 9
+
+
+def test_fsync_par_age(tmp_path):
+    maintenant, horloge = horloge_manuelle()
+    historique = ReadingLog(tmp_path / "mesures.log", sync_every=100,
+                            sync_interval=10.0, clock_ns=horloge)
+    historique.append(1, 0.0, 0.0)
+    maintenant[0] = 5 * 10**9
+    historique.append(2, 0.0, 0.0)
+    assert historique.syncs == 0
+
+    maintenant[0] = 10 * 10**9
+    historique.append(3, 0.0, 0.0)
+    assert historique.syncs == 1 and historique.pending == 0
+    historique.close()
+
+
+def test_reouverture_continue(tmp_path):
+    path = tmp_path / "mesures.log"
+    ecrire(path, 2)
+    with ReadingLog(path) as historique:
+        historique.append_reading(Reading(21.5, 40.25, 30, 1))
+        assert historique.out_of_order == 0
+
+    assert list(iter_records(path))[-1] == (30, 21.5, 40.25)
+
+
+def test_horloge_qui_recule(tmp_path):
+    """Un instant antérieur (heure réglée) est gardé, pas refusé."""
+    path = tmp_path / "mesures.log"
+    ecrire(path, 3)
+    with ReadingLog(path) as historique:
+        historique.append(5, 1.0, 2.0)
+        historique.append(40, 3.0, 4.0)
+        assert historique.out_of_order == 1
+
+    assert [r[0] for r in iter_records(path)] == [0, 10, 20, 5, 40]
+
+
+def test_enregistrement_coupe_ignore_puis_tronque(tmp_path):
+    path = tmp_path / "mesures.log"
+    ecrire(path, 2)
+    with open(path, "ab") as f:
+        f.write(b"\x01" * 7)
+
+    assert len(list(iter_records(path))) == 2
+    with ReadingLog(path) as historique:
+        historique.append(20, 2.0, 4.0)
+    assert path.stat().st_size == LOG_HEADER.size + 3 * 16
+    assert list(iter_records(path))[-1] == (20, 2.0, 4.0)
+
+
+def test_fichier_etranger_refuse(tmp_path):
+    path = tmp_path / "autre.bin"
+    path.write_bytes(b"pas un historique")
+    with pytest.raises(ValueError):
+        ReadingLog(path)
+    with pytest.raises(ValueError):
+        list(iter_records(path))
+
+
+# ---------------------------------------------------------------------------
+# Relecture projetée (NumPy)
+# ---------------------------------------------------------------------------
+def test_replay_sans_copie(tmp_path):
+    np = pytest.importorskip("numpy")
+    path = tmp_path / "mesures.log"
+    ecrire(path, 1000, sync_every=128)
+
+    mesures = replay(path)
+    assert isinstance(mesures, np.memmap)
+    assert not mesures.flags.writeable
+    assert len(mesures) == 1000
+    assert mesures["timestamp"][-1] == 9990
+    assert mesures["temperature"].dtype == np.float32
+    np.testing.assert_array_equal(mesures["humidity"], 2 * np.arange(1000))
+
+    fenetre = between(mesures, 100, 200)
+    assert list(fenetre["timestamp"]) == list(range(100, 200, 10))
+
+
+def test_between_non_trie(tmp_path):
+    pytest.importorskip("numpy")
+    path = tmp_path / "mesures.log"
+    with ReadingLog(path) as historique:
+        for instant in [100, 200, 300, 150, 250, 400]:
+            historique.append(instant, 0.0, 0.0)
+
+    fenetre = between(replay(path), 150, 300)
+    assert list(fenetre["timestamp"]) == [200, 150, 250]
+    assert list(between(replay(path))["timestamp"]) == [100, 200, 300, 150, 250, 400]
+
+
+def test_replay_vide(tmp_path):
+    pytest.importorskip("numpy")
+    path = tmp_path / "mesures.log"
+    ReadingLog(path).close()
+
+    assert len(replay(path)) == 0
+    assert list(iter_records(path)) == []
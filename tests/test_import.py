@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Tests : importer les scripts ne touche pas au matériel.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from simulateur import simulation
+
+
+REPO_ROOT = Path(__file__).parent.parent
+
+
+# ---------------------------------------------------------------------------
+# Import sans effet de bord
+# ---------------------------------------------------------------------------
+@pytest.mark.parametrize("module", ["led_simple", "led_rgb", "labo1", "dht22"])
+def test_import_sans_materiel(module):
+    """Aucun module matériel n'est chargé à l'import."""
+    sonde = (
+        f"import sys; import {module}; "
+        "print([m for m in ('RPi', 'board', 'adafruit_dht') if m in sys.modules])"
+    )
+    resultat = subprocess.run([sys.executable, "-c", sonde], capture_output=True,
+                              text=True, cwd=str(REPO_ROOT), check=True)
+
+    assert resultat.stdout.strip() == "[]"
+
+
+# ---------------------------------------------------------------------------
+# open() / close() idempotents
+# ---------------------------------------------------------------------------
+def test_open_idempotent():
+    import led_simple
+
+    with simulation() as sim:
+        premiere = led_simple.open()
+        assert led_simple.open() is premiere
+        assert sim.gpio.mode == sim.gpio.BCM
+
+        led_simple.allumer_toutes()
+        led_simple.close()
+        led_simple.close()
+
+        assert led_simple.banque is None
+        assert sim.gpio.modes == {}
+        assert sim.gpio.state == {17: 0, 27: 0, 22: 0}
+
+
+def test_effets_sans_open_prealable():
+    """Les effets appelés directement ouvrent la banque au premier usage."""
+    import led_rgb
+
+    with simulation() as sim:
+        try:
+            led_rgb.chenillard(0.01)
+            led_rgb.chenillard_allume(0.01)
+            assert sim.gpio.state == {17: 1, 27: 1, 22: 1}
+        finally:
+            led_rgb.close()
+
+    assert led_rgb.banque is None
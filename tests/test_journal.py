@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Tests du journal des transitions (journal.py).
+"""
+
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from journal import BackgroundWriter, EventLog, format_transitions, read_trace
+
+
+NOMS = ["LED_ROUGE", "LED_VERTE", "LED_JAUNE"]
+
+
+def horloge_compteur():
+    """Horloge factice : 0, 1, 2, ... à chaque appel."""
+    compteur = iter(range(10**9))
+    return lambda: next(compteur)
+
+
+# ---------------------------------------------------------------------------
+# Tampon circulaire
+# ---------------------------------------------------------------------------
+def test_drain_dans_l_ordre():
+    journal = EventLog(capacity=8, clock_ns=horloge_compteur())
+    for trame in (0b001, 0b010, 0b100):
+        journal.record(trame)
+
+    assert journal.drain() == [(0, 0b001), (1, 0b010), (2, 0b100)]
+    assert journal.drain() == []
+
+
+def test_debordement_compte_les_pertes():
+    """Le lecteur en retard perd les plus anciens événements, pas les récents."""
+    journal = EventLog(capacity=4, clock_ns=horloge_compteur())
+    for trame in range(10):
+        journal.record(trame)
+
+    assert [t for _, t in journal.drain()] == [6, 7, 8, 9]
+    assert journal.dropped == 6
+
+
+def test_capacite_puissance_de_deux():
+    with pytest.raises(ValueError):
+        EventLog(capacity=100)
+
+
+# ---------------------------------------------------------------------------
+# Sortie texte et trace binaire
+# ---------------------------------------------------------------------------
+def test_format_comme_labo1():
+    """Mêmes lignes que les print() d'origine de labo1.py."""
+    lignes, derniere = format_transitions(
+        [(0, 0b001), (1, 0b010), (2, 0)], NOMS)
+
+    assert lignes == [
+        "LED_ROUGE HIGH",
+        "LED_ROUGE LOW",
+        "LED_VERTE HIGH",
+        "LED_VERTE LOW",
+    ]
+    assert derniere == 0
+
+
+def test_ecrivain_texte():
+    journal = EventLog(clock_ns=horloge_compteur())
+    sortie = io.StringIO()
+    with BackgroundWriter(journal, NOMS, stream=sortie, interval=0.01):
+        journal.record(0b100)
+
+    assert sortie.getvalue() == "LED_JAUNE HIGH\n"
+
+
+def test_trace_binaire(tmp_path):
+    journal = EventLog(clock_ns=horloge_compteur())
+    trace = tmp_path / "leds.trc"
+    with BackgroundWriter(journal, trace=str(trace), interval=0.01):
+        journal.record(0b001)
+        journal.record(0b000)
+
+    assert read_trace(trace) == [(0, 0b001), (1, 0b000)]
+    assert trace.stat().st_size == 8 + 2 * 16
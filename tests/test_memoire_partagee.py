@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Tests de la mémoire partagée protégée par flock (memoire_partagee.py).
+"""
+
+import math
+import multiprocessing
+import os
+import sys
+import time
+from multiprocessing import shared_memory
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from memoire_partagee import SharedState, couleur_temperature, lock_path
+
+
+@pytest.fixture
+def nom():
+    return f"test-leds-{os.getpid()}"
+
+
+# ---------------------------------------------------------------------------
+# Publication et lecture
+# ---------------------------------------------------------------------------
+def test_aucune_mesure_au_depart(nom):
+    with SharedState.create(nom) as etat:
+        assert etat.read_reading() is None
+        assert etat.read_frame() == (0, 0, 0)
+
+
+def test_mesure_et_trame_visibles_par_un_autre_attachement(nom):
+    with SharedState.create(nom) as ecrivain, SharedState.attach(nom) as lecteur:
+        ecrivain.publish_reading(21.5, 40.0, timestamp_ns=123)
+        ecrivain.publish_frame(0b100, timestamp_ns=456)
+        assert lecteur.read_reading() == (21.5, 40.0, 123, 1)
+        assert lecteur.read_frame() == (0b100, 456, 1)
+
+        ecrivain.publish_reading(22.0, 41.0)
+        assert lecteur.read_reading()[3] == 2
+
+
+def test_segment_etranger_refuse(nom):
+    autre = shared_memory.SharedMemory(nom, create=True, size=64)
+    try:
+        with pytest.raises(ValueError, match="magic"):
+            SharedState.attach(nom)
+    finally:
+        autre.close()
+        autre.unlink()
+
+
+def test_verrou_supprime_avec_le_segment(nom):
+    with SharedState.create(nom):
+        assert os.path.exists(lock_path(nom))
+    assert not os.path.exists(lock_path(nom))
+
+
+def test_segment_absent(nom):
+    with pytest.raises(FileNotFoundError):
+        SharedState.attach(nom)
+
+
+# ---------------------------------------------------------------------------
+# Cohérence entre processus
+# ---------------------------------------------------------------------------
+def _publier(nom, n):
+    etat = SharedState.attach(nom)
+    for i in range(1, n + 1):
+        etat.publish_reading(float(i), float(-i), i)
+    etat.close()
+
+
+def test_lectures_jamais_dechirees(nom):
+    """Le lecteur ne voit jamais une mesure à moitié écrite."""
+    n = 20_000
+    with SharedState.create(nom) as etat:
+        ecrivain = multiprocessing.Process(target=_publier, args=(nom, n))
+        ecrivain.start()
+        precedent = 0
+        # Borné : un écrivain mort avant la fin ne doit pas bloquer la suite
+        limite = time.monotonic() + 30.0
+        while (ecrivain.is_alive() or precedent < n) and time.monotonic() < limite:
+            mesure = etat.read_reading()
+            if mesure is None:
+                continue
+            temperature, humidite, instant, numero = mesure
+            assert humidite == -temperature and instant == temperature == numero
+            assert numero >= precedent
+            precedent = numero
+        ecrivain.join(5.0)
+        if ecrivain.is_alive():
+            ecrivain.terminate()
+            ecrivain.join()
+        assert ecrivain.exitcode == 0
+        assert precedent == n
+
+
+# ---------------------------------------------------------------------------
+# Couleur
+# ---------------------------------------------------------------------------
+def test_couleur_temperature():
+    assert couleur_temperature(None) == 0
+    assert couleur_temperature(math.nan) == 0
+    assert couleur_temperature(12.0) == 0b010
+    assert couleur_temperature(21.0) == 0b100
+    assert couleur_temperature(30.0) == 0b001
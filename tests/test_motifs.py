@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Tests de la compilation et de la lecture des motifs (motifs.py).
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from motifs import LABO1, UNE_PAR_UNE, compile_pattern, play
+from sequenceur import Sequencer
+
+
+LEDS = [17, 27, 22]
+
+
+class BanqueEnregistreuse:
+    """Remplace PinBank et note (instant, trame) à chaque écriture."""
+
+    def __init__(self, horloge):
+        self.horloge = horloge
+        self.ecritures = []
+
+    def write(self, trame):
+        self.ecritures.append((self.horloge.maintenant, trame))
+
+
+class HorlogeFactice:
+    def __init__(self, depassement_ns=0):
+        self.maintenant = 0
+        self.depassement_ns = depassement_ns
+
+    def clock_ns(self):
+        return self.maintenant
+
+    def sleep(self, secondes):
+        self.maintenant += int(secondes * 1e9) + self.depassement_ns
+
+
+# ---------------------------------------------------------------------------
+# Compilation
+# ---------------------------------------------------------------------------
+def test_compilation_une_par_une():
+    """Les étapes deviennent des (offset, trame) cumulés."""
+    timeline = compile_pattern(UNE_PAR_UNE, LEDS)
+
+    assert list(timeline) == [
+        (0, 0b001),
+        (1_000_000_000, 0b011),
+        (2_000_000_000, 0b111),
+    ]
+    assert timeline.duration_ns == 3_000_000_000
+
+
+def test_compilation_labo1_deroulee():
+    """Les répétitions sont déroulées et la fin éteint tout."""
+    timeline = compile_pattern(LABO1, LEDS)
+
+    assert len(timeline) == 301
+    assert timeline.masks[:4].tolist() == [0b001, 0b010, 0b100, 0b001]
+    assert timeline.masks[-1] == 0
+    assert timeline.offsets[-1] == timeline.duration_ns == 30_000_000_000
+
+
+def test_etape_de_duree_nulle_fusionnee():
+    """Une étape de durée nulle est remplacée par la suivante."""
+    motif = {"delai": 0.5, "etapes": [["", 0], "J"]}
+
+    assert list(compile_pattern(motif, LEDS)) == [(0, 0b100)]
+
+
+def test_lettre_inconnue():
+    with pytest.raises(ValueError):
+        compile_pattern({"etapes": ["X"]}, LEDS)
+
+
+# ---------------------------------------------------------------------------
+# Lecture
+# ---------------------------------------------------------------------------
+def test_lecture_enchainee_avec_sequenceur():
+    """play() reprend et avance l'échéance du séquenceur."""
+    horloge = HorlogeFactice()
+    banque = BanqueEnregistreuse(horloge)
+    seq = Sequencer(clock_ns=horloge.clock_ns, sleep=horloge.sleep)
+    seq.start()
+
+    seq.sleep(0.5)
+    play(compile_pattern(UNE_PAR_UNE, LEDS), banque, seq)
+
+    assert banque.ecritures == [
+        (500_000_000, 0b001),
+        (1_500_000_000, 0b011),
+        (2_500_000_000, 0b111),
+    ]
+    assert seq.deadline_ns == horloge.maintenant == 3_500_000_000
+
+
+def test_retard_mesure_apres_le_reveil():
+    """Le retard rendu inclut le temps perdu dans sleep()."""
+    horloge = HorlogeFactice(depassement_ns=5_000_000)
+    banque = BanqueEnregistreuse(horloge)
+
+    retard = play(compile_pattern(UNE_PAR_UNE, LEDS), banque,
+                  clock_ns=horloge.clock_ns, sleep=horloge.sleep)
+
+    assert retard == 5_000_000
+    assert [t for t, _ in banque.ecritures] == [0, 1_005_000_000, 2_005_000_000]
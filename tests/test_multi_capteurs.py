@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Tests de la lecture de plusieurs capteurs à créneaux décalés (multi_capteurs.py).
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from multi_capteurs import MultiSensorPoller
+
+S = 1_000_000_000
+
+
+class Banc:
+    """Horloge virtuelle et capteurs factices qui notent leurs lectures."""
+
+    def __init__(self, duree_lecture=0.005, erreurs=()):
+        self.maintenant = 0
+        self.duree_lecture = int(duree_lecture * S)
+        self.erreurs = set(erreurs)
+        self.lectures = []      # (broche, début, fin)
+
+    def clock_ns(self):
+        return self.maintenant
+
+    def sleep(self, secondes):
+        self.maintenant += int(secondes * S)
+
+    def read(self, pin):
+        debut = self.maintenant
+        self.maintenant += self.duree_lecture
+        self.lectures.append((pin, debut, self.maintenant))
+        if (pin, len(self.lectures)) in self.erreurs:
+            raise RuntimeError("Checksum did not validate. Try again.")
+        return (pin, debut)
+
+    def poller(self, pins, **options):
+        return MultiSensorPoller(pins, read=self.read, clock_ns=self.clock_ns,
+                                 sleep=self.sleep, **options)
+
+
+# ---------------------------------------------------------------------------
+# Calendrier
+# ---------------------------------------------------------------------------
+def test_creneaux_decales():
+    banc = Banc()
+    poller = banc.poller(["D4", "D17", "D27", "D22"], interval=2.0, min_interval=2.0)
+    for _ in range(8):
+        poller.poll_once()
+
+    debuts = [debut for _, debut, _ in banc.lectures]
+    assert [pin for pin, _, _ in banc.lectures[:4]] == ["D4", "D17", "D27", "D22"]
+    assert debuts == [k * S // 2 for k in range(8)]
+
+
+def test_lectures_sans_chevauchement():
+    banc = Banc(duree_lecture=0.3)
+    poller = banc.poller(["D4", "D17", "D27"], interval=2.05)
+    poller.run(duration=20)
+
+    for (_, _, fin), (_, debut, _) in zip(banc.lectures, banc.lectures[1:]):
+        assert debut >= fin
+
+
+def test_intervalle_minimal_par_capteur():
+    """Une lecture lente décale le capteur suivant, sans rapprocher les siennes."""
+    banc = Banc(duree_lecture=1.5)
+    poller = banc.poller(["D4", "D17", "D27"], interval=2.05)
+    poller.run(duration=30)
+
+    for pin in ("D4", "D17", "D27"):
+        debuts = [debut for p, debut, _ in banc.lectures if p == pin]
+        assert len(debuts) > 3
+        assert all(b - a >= 2.05 * S for a, b in zip(debuts, debuts[1:]))
+
+
+def test_erreur_relue_au_creneau_suivant():
+    banc = Banc(erreurs={("D17", 2)})
+    poller = banc.poller(["D4", "D17"], interval=2.0, min_interval=2.0)
+    resultats = [poller.poll_once() for _ in range(4)]
+
+    assert resultats[1] == ("D17", None)
+    assert resultats[3] == ("D17", ("D17", 3 * S))
+    assert poller.stats["D17"].errors == 1
+    assert poller.latest("D17") == ("D17", 3 * S)
+
+
+def test_debit_par_capteur():
+    banc = Banc()
+    poller = banc.poller(["D4", "D17"], interval=2.0, min_interval=2.0)
+    poller.run(duration=100)
+
+    rapport = poller.report()
+    for pin in ("D4", "D17"):
+        assert rapport[pin]["samples"] == 50
+        assert rapport[pin]["samples_per_s"] == pytest.approx(0.5, rel=0.02)
+        assert rapport[pin]["mean_read_ms"] == pytest.approx(5.0)
+
+
+def test_parametres_invalides():
+    with pytest.raises(ValueError):
+        MultiSensorPoller([])
+    with pytest.raises(ValueError):
+        MultiSensorPoller(["D4", "D4"])
+    with pytest.raises(ValueError):
+        MultiSensorPoller(["D4"], interval=1.0)
+
+
+# ---------------------------------------------------------------------------
+# Fil d'arrière-plan
+# ---------------------------------------------------------------------------
+def test_fil_arrete_pendant_l_attente():
+    lectures = []
+    poller = MultiSensorPoller(["D4", "D17"], interval=10.0,
+                               read=lambda pin: lectures.append(pin) or pin)
+    with poller:
+        pass
+
+    # stop() interrompt l'attente du créneau suivant
+    assert lectures in ([], ["D4"])
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Tests des fondus PWM avec correction gamma (pwm.py).
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pwm
+from pwm import Fader, SoftwarePWM, gamma_table
+from simulateur import simulation
+
+
+class CanalMemoire:
+    """Canal PWM factice qui note chaque rapport cyclique reçu."""
+
+    max_duty = 100.0
+
+    def __init__(self):
+        self.valeurs = []
+
+    def set(self, duty):
+        self.valeurs.append(duty)
+
+    def close(self):
+        pass
+
+
+# ---------------------------------------------------------------------------
+# Table gamma
+# ---------------------------------------------------------------------------
+def test_table_gamma():
+    table = gamma_table()
+
+    assert len(table) == 256
+    assert table[0] == 0.0
+    assert table[255] == pytest.approx(100.0)
+    # À mi-niveau, la LED ne reçoit qu'environ 22 % du temps
+    assert table[128] == pytest.approx(22.0, abs=0.5)
+    assert all(a <= b for a, b in zip(table, table[1:]))
+
+
+# ---------------------------------------------------------------------------
+# Planification et application
+# ---------------------------------------------------------------------------
+def test_plan_tous_canaux():
+    """Un pas du plan = un rapport cyclique par canal, tiré de la table."""
+    fader = Fader([CanalMemoire(), CanalMemoire()])
+    table = fader.tables[0]
+
+    plan = fader.plan((0, 255), (255, 0), 5)
+
+    assert len(plan) == 5
+    assert plan[-1] == (table[255], table[0])
+    assert plan[0] == (table[51], table[204])
+
+
+def test_plan_identique_sans_numpy(monkeypatch):
+    """Les moitiés sont arrondies vers le haut, avec ou sans NumPy."""
+    pytest.importorskip("numpy")
+    fader = Fader([CanalMemoire(), CanalMemoire()])
+    depart, arrivee = (0, 255), (255, 0)
+
+    avec = fader.plan(depart, arrivee, 2)
+    monkeypatch.setattr(pwm, "np", None)
+    monkeypatch.setattr(pwm, "_NUMPY_CHERCHE", True)
+    sans = fader.plan(depart, arrivee, 2)
+
+    assert avec == sans
+    assert avec[0] == (fader.tables[0][128], fader.tables[1][128])
+    # 2,5 → 3 (np.rint donnerait 2)
+    assert fader.plan((0,), (5,), 2) == [(fader.tables[0][3],), (fader.tables[0][5],)]
+
+
+def test_fermeture_attend_le_fil_pwm():
+    """Le fil de RPi.GPIO remet la broche à 0 jusqu'à une période après stop()."""
+    with simulation() as sim:
+        import RPi.GPIO as GPIO
+        GPIO.setmode(GPIO.BCM)
+        GPIO.setup([17], GPIO.OUT)
+        canal = SoftwarePWM(GPIO, 17, frequency=200.0)
+        debut = sim.clock.now_ns
+        canal.close()
+
+    assert sim.clock.now_ns - debut >= 2 * 5_000_000
+
+
+def test_seuls_les_changements_sont_envoyes():
+    canal = CanalMemoire()
+    fader = Fader([canal])
+
+    fader.apply((10.0,))
+    fader.apply((10.0,))
+    fader.apply((20.0,))
+
+    assert canal.valeurs == [10.0, 20.0]
+
+
+def test_fondu_simule():
+    """Fondu de 1 s à 100 pas/s sur le PWM logiciel simulé."""
+    with simulation() as sim:
+        import RPi.GPIO as GPIO
+        GPIO.setmode(GPIO.BCM)
+        GPIO.setup([17, 27], GPIO.OUT)
+        fader = Fader([SoftwarePWM(GPIO, 17), SoftwarePWM(GPIO, 27)])
+
+        fader.fade((255, 128), 1.0, rate=100)
+        fin = sim.clock.now_ns
+        fader.close()
+
+    assert fin == 1_000_000_000
+    rouge = [d for _, pin, d in sim.gpio.pwm_history if pin == 17]
+    assert rouge[0] == 0 and rouge[-1] == pytest.approx(100.0)
+    assert fader.level == [255, 128]
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Tests de la politique de réessai adaptative (reessai.py).
+
+L'horloge et l'attente sont factices : aucun test ne dort vraiment.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from reessai import CHECKSUM, NOT_FOUND, OTHER, TIMEOUT, RetryPolicy, classify
+
+
+class HorlogeFactice:
+    """Horloge en ns ; sleep() avance le temps et note chaque attente."""
+
+    def __init__(self):
+        self.now_ns = 0
+        self.attentes = []
+
+    def clock_ns(self):
+        return self.now_ns
+
+    def sleep(self, secondes):
+        self.attentes.append(round(secondes, 6))
+        self.now_ns += int(secondes * 1e9)
+
+
+def transaction(erreurs, duree_ns=5_000_000, horloge=None):
+    """Transaction qui lève les erreurs données, puis réussit (5 ms chacune)."""
+    restantes = list(erreurs)
+
+    def lire():
+        horloge.now_ns += duree_ns
+        if restantes:
+            raise RuntimeError(restantes.pop(0))
+        return (21.5, 40.0)
+    return lire
+
+
+@pytest.fixture
+def horloge():
+    return HorlogeFactice()
+
+
+def politique(horloge, **kwargs):
+    return RetryPolicy(clock_ns=horloge.clock_ns, sleep=horloge.sleep, **kwargs)
+
+
+# ---------------------------------------------------------------------------
+# Classement des erreurs d'adafruit_dht
+# ---------------------------------------------------------------------------
+@pytest.mark.parametrize("message, classe", [
+    ("Checksum did not validate. Try again.", CHECKSUM),
+    ("Received unplausible data. Try again.", CHECKSUM),
+    ("A full buffer was not returned. Try again.", TIMEOUT),
+    ("Timed out waiting for PulseIn message", TIMEOUT),
+    ("DHT sensor not found, check wiring", NOT_FOUND),
+    ("Lecture incomplète", OTHER),
+])
+def test_classify(message, classe):
+    assert classify(RuntimeError(message)) == classe
+
+
+# ---------------------------------------------------------------------------
+# Attentes
+# ---------------------------------------------------------------------------
+def test_checksum_attend_seulement_le_reste_de_l_intervalle(horloge):
+    """2 s comptées depuis le début de la transaction ratée, pas après l'erreur."""
+    p = politique(horloge, min_interval=2.0)
+    resultat, tentatives = p.run(transaction(["Checksum did not validate"], horloge=horloge))
+    assert resultat == (21.5, 40.0) and tentatives == 2
+    assert horloge.attentes == [1.995]
+
+
+def test_not_found_recul_exponentiel(horloge):
+    p = politique(horloge, min_interval=2.0, max_time=60.0)
+    erreurs = ["DHT sensor not found, check wiring"] * 3
+    p.run(transaction(erreurs, horloge=horloge))
+    assert horloge.attentes == [4.0, 8.0, 16.0]
+
+
+def test_lecture_apres_succes_immediate(horloge):
+    """Après un succès, adafruit_dht rend la paire en cache : pas d'attente."""
+    p = politique(horloge)
+    p.run(transaction([], horloge=horloge))
+    p.run(transaction([], horloge=horloge))
+    assert horloge.attentes == []
+
+
+def test_lecture_apres_echec_respecte_l_intervalle(horloge):
+    p = politique(horloge, min_interval=2.0, max_attempts=1)
+    with pytest.raises(RuntimeError):
+        p.run(transaction(["Checksum did not validate"], horloge=horloge))
+    p.run(transaction([], horloge=horloge))
+    assert horloge.attentes == [1.995]
+
+
+# ---------------------------------------------------------------------------
+# Plafonds
+# ---------------------------------------------------------------------------
+def test_plafond_de_tentatives(horloge):
+    p = politique(horloge, max_attempts=3)
+    with pytest.raises(RuntimeError, match="Checksum"):
+        p.run(transaction(["Checksum did not validate"] * 5, horloge=horloge))
+    assert p.stats.as_dict()["attempts"] == 3
+    assert len(horloge.attentes) == 2
+
+
+def test_plafond_de_duree(horloge):
+    """On abandonne plutôt que d'attendre au-delà de max_time."""
+    p = politique(horloge, min_interval=2.0, max_attempts=10, max_time=5.0)
+    with pytest.raises(RuntimeError, match="not found"):
+        p.run(transaction(["DHT sensor not found, check wiring"] * 10, horloge=horloge))
+    # 4 s d'attente passent, 8 s dépasseraient les 5 s
+    assert horloge.attentes == [4.0]
+
+
+# ---------------------------------------------------------------------------
+# Statistiques
+# ---------------------------------------------------------------------------
+def test_statistiques(horloge):
+    p = politique(horloge, min_interval=2.0)
+    p.run(transaction([], horloge=horloge))
+    p.run(transaction(["A full buffer was not returned"], horloge=horloge))
+    with pytest.raises(RuntimeError):
+        politique(horloge, max_attempts=1).run(transaction(["x"], horloge=horloge))
+
+    stats = p.stats.as_dict()
+    assert stats["reads"] == 2 and stats["failures"] == 0
+    assert stats["attempts"] == 3
+    assert stats["errors"][TIMEOUT] == 1
+    # (5 ms) et (5 ms + 1.995 s + 5 ms) → moyenne ≈ 1.005 s
+    assert stats["mean_time_to_valid_s"] == pytest.approx(1.005)
+    assert stats["max_time_to_valid_s"] == pytest.approx(2.005)
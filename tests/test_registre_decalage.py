@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Tests de la chaîne de 74HC595 (registre_decalage.py) avec un SPI factice.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from gpio_bank import PinBank
+from registre_decalage import ShiftRegisterChain, ShiftRegisterDriver
+
+
+class SpiFactice:
+    """Remplace spidev.SpiDev et garde chaque transfert."""
+
+    max_speed_hz = 0
+
+    def __init__(self):
+        self.transferts = []
+
+    def writebytes2(self, tampon):
+        self.transferts.append(bytes(tampon))
+
+    def close(self):
+        pass
+
+
+# ---------------------------------------------------------------------------
+# Ordre des bits
+# ---------------------------------------------------------------------------
+def test_premier_octet_pour_le_dernier_registre():
+    """La sortie 0 est dans le dernier octet envoyé (premier registre)."""
+    spi = SpiFactice()
+    chaine = ShiftRegisterChain(24, spi=spi)
+
+    chaine[0] = 1
+    chaine[9] = 1
+    chaine[23] = 1
+    chaine.show()
+
+    assert spi.transferts == [bytes([0b1000_0000, 0b0000_0010, 0b0000_0001])]
+    assert chaine.frame == (1 << 0) | (1 << 9) | (1 << 23)
+    assert chaine[9] == 1 and chaine[10] == 0
+
+
+def test_sortie_hors_chaine():
+    chaine = ShiftRegisterChain(8, spi=SpiFactice())
+
+    with pytest.raises(IndexError):
+        chaine[8] = 1
+
+
+# ---------------------------------------------------------------------------
+# Pilote PinBank
+# ---------------------------------------------------------------------------
+def test_un_transfert_par_trame():
+    """Chaque trame de la banque = un seul transfert de toute la chaîne."""
+    spi = SpiFactice()
+    chaine = ShiftRegisterChain(256, spi=spi)
+    banque = PinBank(range(256), ShiftRegisterDriver(range(256), chaine))
+
+    banque.write(1 << 200)
+    banque.set(1)
+
+    assert len(spi.transferts) == 2
+    assert all(len(t) == 32 for t in spi.transferts)
+    assert chaine.frame == (1 << 200) | 1
+
+
+def test_leds_sur_q0_q2():
+    """Les LEDs du projet (17, 27, 22) sortent sur Q0, Q1, Q2 (GPIO_BACKEND=spi595)."""
+    spi = SpiFactice()
+    chaine = ShiftRegisterChain(8, spi=spi)
+    banque = PinBank([17, 27, 22], ShiftRegisterDriver([17, 27, 22], chaine))
+
+    banque.write(0b100)
+
+    assert [chaine[i] for i in range(3)] == [0, 0, 1]
+    assert spi.transferts[-1] == bytearray([0b100])
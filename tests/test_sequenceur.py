@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Tests du séquenceur à échéances absolues (sequenceur.Sequencer).
+
+Une horloge factice remplace time.monotonic_ns : chaque étape « coûte »
+un surcoût fixe, comme print() et GPIO.output() dans led_rgb.py.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sequenceur import Sequencer
+
+
+class HorlogeFactice:
+    """Horloge en nanosecondes avancée par sleep() et par travail()."""
+
+    def __init__(self, depassement_ns=0):
+        self.maintenant = 0
+        self.depassement_ns = depassement_ns
+
+    def clock_ns(self):
+        return self.maintenant
+
+    def sleep(self, secondes):
+        # Le noyau réveille toujours un peu en retard
+        self.maintenant += int(secondes * 1e9) + self.depassement_ns
+
+    def travail(self, ns):
+        self.maintenant += ns
+
+
+# ---------------------------------------------------------------------------
+# Absence de dérive
+# ---------------------------------------------------------------------------
+def test_periode_sans_derive():
+    """Le surcoût de chaque étape ne s'accumule pas sur la période."""
+    horloge = HorlogeFactice(depassement_ns=50_000)
+    seq = Sequencer(clock_ns=horloge.clock_ns, sleep=horloge.sleep)
+    seq.start()
+
+    for _ in range(10_000):
+        horloge.travail(200_000)  # print + GPIO.output
+        seq.sleep(0.1)
+
+    # Avec time.sleep, on aurait 10 000 × 0.25 ms = 2.5 s de dérive
+    assert horloge.maintenant - 10_000 * 100_000_000 == 50_000
+    assert seq.stats.steps == 10_000
+    assert seq.stats.max_ns == 50_000
+
+
+def test_recalage_apres_gros_retard():
+    """Un retard énorme recale les échéances au lieu de rattraper en rafale."""
+    horloge = HorlogeFactice()
+    seq = Sequencer(resync_after=1.0, clock_ns=horloge.clock_ns,
+                    sleep=horloge.sleep)
+    seq.start()
+
+    horloge.travail(5_000_000_000)  # processus suspendu 5 s
+    retard = seq.sleep(0.1)
+
+    assert retard == 4_900_000_000
+    assert seq.stats.resyncs == 1
+    assert seq.deadline_ns == horloge.maintenant
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Tests de la série temporelle en tampon circulaire (serie.RingSeries).
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dht22 import Reading
+from serie import OCTETS_PAR_ECHANTILLON, RingSeries
+
+
+def remplir(serie, n, debut=0):
+    """Échantillon i : instant 10*i, température i, humidité -i."""
+    for i in range(debut, debut + n):
+        serie.append(10 * i, float(i), float(-i))
+
+
+# ---------------------------------------------------------------------------
+# Ajout et capacité
+# ---------------------------------------------------------------------------
+def test_memoire_fixe():
+    serie = RingSeries(1_000_000)
+    assert OCTETS_PAR_ECHANTILLON == 16
+    assert serie.memory_bytes == 16_000_000
+    assert serie.timestamps.itemsize == 8 and serie.temperature.itemsize == 4
+
+
+def test_ajout_et_ecrasement():
+    serie = RingSeries(4)
+    assert serie.latest() is None
+    remplir(serie, 6)
+    assert len(serie) == 4
+    assert list(serie) == [(20, 2.0, -2.0), (30, 3.0, -3.0), (40, 4.0, -4.0), (50, 5.0, -5.0)]
+    assert serie.latest() == (50, 5.0, -5.0)
+
+
+def test_append_reading():
+    serie = RingSeries(2)
+    serie.append_reading(Reading(21.5, 40.25, 123, 1))
+    assert serie.latest() == (123, 21.5, 40.25)
+
+
+def test_horloge_qui_recule():
+    """Un instant antérieur (horloge murale reculée) est gardé et compté."""
+    serie = RingSeries(4)
+    serie.append(10, 0.0, 0.0)
+    serie.append(5, 1.0, 0.0)
+    assert serie.out_of_order == 1
+    assert serie.latest() == (5, 1.0, 0.0)
+
+
+def test_capacite_invalide():
+    with pytest.raises(ValueError):
+        RingSeries(0)
+
+
+# ---------------------------------------------------------------------------
+# Fenêtres
+# ---------------------------------------------------------------------------
+def test_segments_sans_chevauchement():
+    serie = RingSeries(8)
+    remplir(serie, 5)
+    segments = serie.segments(10, 40)
+    assert len(segments) == 1
+    assert list(segments[0][0]) == [10, 20, 30]
+    assert segments[0][0].obj is serie.timestamps
+
+
+def test_segments_qui_chevauchent_la_fin():
+    serie = RingSeries(5)
+    remplir(serie, 8)               # instants 30..70, début à l'index 3
+    segments = serie.segments()
+    assert [list(s[0]) for s in segments] == [[30, 40], [50, 60, 70]]
+    assert [list(s[0]) for s in serie.segments(45, 65)] == [[50, 60]]
+    assert [list(s[0]) for s in serie.segments(35, 55)] == [[40], [50]]
+    assert serie.segments(80) == []
+    assert serie.segments(0, 30) == []
+
+
+@pytest.mark.parametrize("debut, fin", [(None, None), (0, 1000), (35, 65), (40, 41), (70, None)])
+def test_window_identique_a_une_recherche_lineaire(debut, fin):
+    serie = RingSeries(5)
+    remplir(serie, 8)
+    attendu = [t for t in range(30, 80, 10)
+               if (debut is None or t >= debut) and (fin is None or t < fin)]
+    instants, temperatures, humidites = serie.window(debut, fin)
+    assert list(instants) == attendu
+    assert list(temperatures) == [t / 10 for t in attendu]
+    assert list(humidites) == [-t / 10 for t in attendu]
+
+
+def test_window_numpy_sans_copie():
+    np = pytest.importorskip("numpy")
+    serie = RingSeries(8)
+    remplir(serie, 5)
+    instants, temperatures, _ = serie.window(10, 40)
+    assert instants.dtype == np.int64 and temperatures.dtype == np.float32
+    assert np.shares_memory(instants, np.frombuffer(serie.timestamps, np.int64))
+
+
+@pytest.mark.parametrize("debut, fin", [(None, None), (0, 1000), (25, 65), (40, 41), (None, 45), (55, None)])
+def test_window_horloge_qui_recule(debut, fin):
+    """Après un recul, la fenêtre garde tous les instants de l'intervalle."""
+    serie = RingSeries(6)
+    instants = [10, 20, 60, 70, 30, 40, 50, 80]   # recul de 70 à 30
+    for t in instants:
+        serie.append(t, float(t), 0.0)
+    gardes = instants[-6:]
+    attendu = [t for t in gardes
+               if (debut is None or t >= debut) and (fin is None or t < fin)]
+    assert list(serie.window(debut, fin)[0]) == attendu
+
+
+def test_recul_a_capacite_un():
+    """À capacité 1, un recul est compté mais la recherche reste dichotomique."""
+    serie = RingSeries(1)
+    for t in (10, 5, 3):
+        serie.append(t, 0.0, 0.0)
+    assert serie.out_of_order == 2
+    assert serie._reculs == 0
+    assert list(serie.window(0, 4)[0]) == [3]
+    assert list(serie.window(4, None)[0]) == []
+
+
+def test_recul_oublie_une_fois_ecrase():
+    """Quand le recul sort du tampon, la recherche redevient dichotomique."""
+    serie = RingSeries(3)
+    for t in (10, 20, 5, 30):
+        serie.append(t, 0.0, 0.0)
+    assert serie._reculs == 1
+    serie.append(40, 0.0, 0.0)              # 20 -> 5 sort du tampon
+    assert serie._reculs == 0 and serie.out_of_order == 1
+    assert [list(s[0]) for s in serie.segments(0, 35)] == [[5], [30]]
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Tests du simulateur GPIO : les scripts de LEDs tournent sans Raspberry Pi.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from simulateur import run_script, simulation
+
+
+REPO_ROOT = Path(__file__).parent.parent
+ROUGE, VERTE, JAUNE = 0b001, 0b010, 0b100
+
+
+# ---------------------------------------------------------------------------
+# Scripts complets
+# ---------------------------------------------------------------------------
+def test_labo1_en_quelques_millisecondes():
+    """Les 30 s de labo1.py s'exécutent en temps virtuel."""
+    debut = time.perf_counter()
+    sim = run_script(REPO_ROOT / "labo1.py")
+    reel = time.perf_counter() - debut
+
+    assert sim.clock.now_ns == 30_000_000_000
+    assert reel < 5.0
+
+    trames = sim.gpio.timeline([17, 27, 22])
+    assert trames[:4] == [
+        (0, ROUGE),
+        (100_000_000, VERTE),
+        (200_000_000, JAUNE),
+        (300_000_000, ROUGE),
+    ]
+    assert trames[-1] == (30_000_000_000, 0)
+
+
+def test_labo1_interrompu_libere_les_broches():
+    """Un Ctrl+C pendant la lecture passe quand même par GPIO.cleanup()."""
+    sim = run_script(REPO_ROOT / "labo1.py", duree=5.0)
+
+    assert sim.clock.now_ns == 5_000_000_000
+    assert sim.gpio.modes == {}
+
+
+def test_led_simple_arrete_par_la_duree():
+    """La boucle infinie de led_simple.py s'arrête comme avec Ctrl+C."""
+    sim = run_script(REPO_ROOT / "led_simple.py", duree=7.0)
+
+    assert sim.gpio.timeline([17, 27, 22])[:5] == [
+        (0, ROUGE | VERTE | JAUNE),
+        (1_000_000_000, 0),
+        (2_000_000_000, ROUGE),
+        (3_000_000_000, ROUGE | VERTE),
+        (4_000_000_000, ROUGE | VERTE | JAUNE),
+    ]
+    # GPIO.cleanup() a bien été appelé
+    assert sim.gpio.modes == {}
+
+
+def test_led_rgb_periode_exacte():
+    """Le chenillard à 0.1 s reste exactement à 0.1 s."""
+    sim = run_script(REPO_ROOT / "led_rgb.py", duree=10.0)
+
+    instants = [t for t, trame in sim.gpio.timeline([17, 27, 22]) if trame == ROUGE]
+    assert instants[:5] == [0, 300_000_000, 600_000_000, 900_000_000, 1_200_000_000]
+
+
+# ---------------------------------------------------------------------------
+# Installation et restauration
+# ---------------------------------------------------------------------------
+def test_simulation_restaure_time():
+    vrai_sleep = time.sleep
+    with simulation() as sim:
+        time.sleep(2.5)
+        assert time.monotonic_ns() == 2_500_000_000
+    assert time.sleep is vrai_sleep
+    assert "RPi.GPIO" not in sys.modules or sys.modules["RPi.GPIO"] is not sim.gpio
+
+
+def test_simulation_temps_reel():
+    """En temps réel, seul sleep est remplacé et les instants sont mesurés."""
+    vrai_monotonic = time.monotonic_ns
+    with simulation(duree=0.05, realtime=True) as sim:
+        assert time.monotonic_ns is vrai_monotonic
+        gpio = sys.modules["RPi.GPIO"]
+        gpio.setmode(gpio.BCM)
+        gpio.setup([17, 27], gpio.OUT)
+        time.sleep(0.01)
+        gpio.output([17, 27], [1, 1])
+        try:
+            time.sleep(0.1)
+        except KeyboardInterrupt:
+            pass
+        else:
+            raise AssertionError("la limite aurait dû arrêter l'exécution")
+
+    trames = sim.gpio.timeline([17, 27])
+    # Une seule écriture de deux broches : un seul instant
+    assert [trame for _, trame in trames] == [0, 0b11]
+    assert trames[1][0] - trames[0][0] >= 10_000_000
+    assert sim.clock.now_ns >= 50_000_000
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Tests du mode temps réel optionnel (temps_reel.py).
+
+Sans privilèges, chaque étape peut être refusée : on vérifie surtout que
+le mode se dégrade proprement et que l'état d'origine est rétabli.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from temps_reel import RealtimeReport, enter_realtime, leave_realtime, realtime
+
+
+# ---------------------------------------------------------------------------
+# Rapport
+# ---------------------------------------------------------------------------
+def test_rapport_vide():
+    rapport = RealtimeReport()
+    assert rapport.as_dict() == {
+        "cpus": [], "policy": "inconnue", "priority": 0,
+        "memory_locked": False, "errors": [],
+    }
+    assert "mémoire verrouillée: non" in str(rapport)
+
+
+def test_rapport_liste_les_erreurs():
+    rapport = RealtimeReport()
+    rapport.errors.append("SCHED_FIFO priorité 50: refusé")
+    assert str(rapport).endswith("\n  - SCHED_FIFO priorité 50: refusé")
+
+
+# ---------------------------------------------------------------------------
+# Entrée / sortie du mode
+# ---------------------------------------------------------------------------
+def test_sans_rien_demander():
+    rapport, precedent = enter_realtime(cpu=None, priority=0, lock_memory=False)
+    assert precedent == {}
+    assert rapport.errors == []
+    assert isinstance(rapport.policy, str)
+    leave_realtime(precedent)
+
+
+def test_epinglage_puis_retablissement():
+    avant = os.sched_getaffinity(0)
+    cpu = min(avant)
+    with realtime(cpu=cpu, priority=0, lock_memory=False) as rapport:
+        assert rapport.cpus == {cpu}
+        assert os.sched_getaffinity(0) == {cpu}
+    assert os.sched_getaffinity(0) == avant
+
+
+def test_cpu_invalide_se_degrade():
+    with realtime(cpu=10_000, priority=0, lock_memory=False) as rapport:
+        assert rapport.errors and "10000" in rapport.errors[0]
+        assert rapport.cpus
+
+
+def test_politique_retablie():
+    avant = os.sched_getscheduler(0)
+    with realtime(priority=10, lock_memory=False) as rapport:
+        # SCHED_FIFO obtenu, ou refus consigné dans le rapport
+        assert rapport.policy == "SCHED_FIFO" or rapport.errors
+    assert os.sched_getscheduler(0) == avant